@@ -1,102 +1,509 @@
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import hashlib
 import json
 import os
+import shutil
+import tempfile
 
-def merge_json_files_to_jsonl(json_paths, output_path):
-    with open(output_path, 'w', encoding='utf-8') as outfile:
-        for path in json_paths:
-            with open(path, 'r', encoding='utf-8') as infile:
-                try:
-                    data = json.load(infile)
-                    if isinstance(data, list):
-                        for entry in data:
-                            outfile.write(json.dumps(entry, ensure_ascii=False) + '\n')
-                    elif isinstance(data, dict):
-                        outfile.write(json.dumps(data, ensure_ascii=False) + '\n')
-                except json.JSONDecodeError as e:
-                    print(f"JSON 파싱 실패: {path}\n{e}")
+from otl_records import RECORD_TYPES, validate_records
+
+_decoder = json.JSONDecoder()
+
+
+class JsonStreamReader:
+    """
+    큰 JSON 파일을 조금씩 읽으며 값 단위로 파싱하는 스트리밍 리더
+
+    최상위 배열/객체의 항목을 하나씩 꺼내므로 파일 크기와 상관없이
+    메모리에는 현재 읽고 있는 항목 하나와 읽기 버퍼만 유지된다.
+    """
+
+    def __init__(self, f, chunk_size=1 << 16):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        """버퍼에 다음 조각을 읽어 붙임 (이미 처리한 부분은 버림)"""
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """공백을 건너뛴 다음 문자 반환 (파일 끝이면 빈 문자열)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"JSON 형식 오류: '{char}'가 필요하지만 '{self.peek()}'를 만났습니다.")
+        self.pos += 1
+
+    def value(self):
+        """다음 JSON 값 하나를 파싱하여 반환"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+                # 숫자 등이 버퍼 끝에서 잘렸을 수 있으므로 끝에 닿았으면 더 읽고 다시 시도
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def items(self):
+        """현재 위치의 배열 항목을 하나씩 반환"""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            char = self.peek()
+            self.pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError(f"JSON 형식 오류: 배열 안에서 '{char}'를 만났습니다.")
+
+    def members(self):
+        """현재 위치의 객체 키를 하나씩 반환. 다음 키로 넘어가기 전에 호출자가 값을 읽어야 한다."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise ValueError(f"JSON 형식 오류: 객체 안에서 '{char}'를 만났습니다.")
+
+
+def iter_json_items(path):
+    """최상위가 배열이면 항목을 하나씩, 객체이면 그 객체 하나를 반환"""
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = JsonStreamReader(f)
+        if reader.peek() == "[":
+            yield from reader.items()
+        else:
+            yield reader.value()
+
+
+def iter_json_object_arrays(path):
+    """{"키": [항목, ...], ...} 형식 파일에서 (키, 항목)을 하나씩 반환"""
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = JsonStreamReader(f)
+        for key in reader.members():
+            if reader.peek() == "[":
+                for item in reader.items():
+                    yield key, item
+            else:
+                yield key, reader.value()
+
+
+class JsonArrayWriter:
+    """
+    항목을 하나씩 받아 json.dump(..., indent=N)과 같은 모양의 배열을 쓰는 작성기
+
+    매개변수:
+        f: 출력 파일 객체
+        indent (int): 들여쓰기 칸 수 (None이면 한 줄로 작성)
+        level (int): 배열이 놓이는 들여쓰기 깊이 (객체 안의 배열이면 1)
+    """
+
+    def __init__(self, f, indent=2, level=0):
+        self.f = f
+        self.indent = indent
+        self.level = level
+        self.count = 0
+        self.f.write("[")
+
+    def write(self, item):
+        text = json.dumps(item, ensure_ascii=False, indent=self.indent)
+        if self.indent is None:
+            self.f.write((", " if self.count else "") + text)
+        else:
+            pad = "\n" + " " * (self.indent * (self.level + 1))
+            self.f.write(("," if self.count else "") + pad + text.replace("\n", pad))
+        self.count += 1
+
+    def close(self):
+        if self.count and self.indent is not None:
+            self.f.write("\n" + " " * (self.indent * self.level))
+        self.f.write("]")
+        return self.count
+
+
+def _file_to_jsonl(path, part_path):
+    """입력 파일 하나를 JSONL 조각 파일로 변환 (프로세스 풀 작업)"""
+    count = 0
+    try:
+        with open(part_path, 'w', encoding='utf-8') as outfile:
+            for entry in iter_json_items(path):
+                outfile.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                count += 1
+    except (json.JSONDecodeError, ValueError) as e:
+        return count, f"JSON 파싱 실패: {path}\n{e}"
+    return count, None
+
+
+def _array_to_part(path, part_path, indent, level, record_type=None):
+    """
+    입력 배열 파일 하나를 들여쓰기된 배열 조각 파일로 변환 (프로세스 풀 작업)
+
+    record_type("review" / "course")이 있으면 항목을 otl_records 모델로 검증한다.
+    형식이 다른 항목은 출력하고 원래 값 그대로 병합한다.
+    """
+    errors = []
+    items = iter_json_items(path)
+    if record_type is not None:
+        items = validate_records(items, record_type, errors)
+    with open(part_path, 'w', encoding='utf-8') as outfile:
+        writer = JsonArrayWriter(outfile, indent=indent, level=level)
+        for item in items:
+            writer.write(item)
+        count = writer.close()
+    if errors:
+        _print_record_errors(path, errors)
+        print(f"⚠️ {path}: 형식이 맞지 않는 항목 {len(errors)}개를 검증하지 않고 그대로 병합했습니다.")
+    return count
+
+
+def _print_record_errors(path, errors, limit=20):
+    """검증 오류를 limit개까지 출력"""
+    for index, message in errors[:limit]:
+        print(f"⚠️ {path} {index}번째 항목: {message}")
+    if len(errors) > limit:
+        print(f"⚠️ {path}: 그 밖에 {len(errors) - limit}개 항목의 오류는 생략했습니다.")
+
+
+def _run_parts(func, paths, extra_args, workers, per_path_args=None):
+    """
+    입력 파일마다 조각 파일을 프로세스 풀에서 동시에 만들고 (조각 경로, 결과) 목록 반환
+
+    per_path_args가 있으면 입력 파일별 인자를 extra_args 뒤에 붙인다.
+    """
+    tmp_dir = tempfile.mkdtemp(prefix="json_convert_")
+    part_paths = [os.path.join(tmp_dir, f"part{i}") for i in range(len(paths))]
+    per_path_args = per_path_args or [()] * len(paths)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(func, path, part, *extra_args, *args)
+                       for path, part, args in zip(paths, part_paths, per_path_args)]
+            results = [future.result() for future in futures]
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return tmp_dir, part_paths, results
+
+
+def merge_json_files_to_jsonl(json_paths, output_path, workers=None):
+    tmp_dir, part_paths, results = _run_parts(_file_to_jsonl, json_paths, (), workers)
+    try:
+        with open(output_path, 'w', encoding='utf-8') as outfile:
+            for part_path, (count, error) in zip(part_paths, results):
+                if error:
+                    print(error)
+                with open(part_path, 'r', encoding='utf-8') as part:
+                    shutil.copyfileobj(part, outfile)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
 
     print(f"모든 파일 병합 완료: {output_path}")
 
-def merge_json_files_by_type(json_file_list, output_path):
+def merge_json_files_by_type(json_file_list, output_path, workers=None):
     if len(json_file_list) != 3:
         raise ValueError("json_file_list에는 정확히 3개의 경로(courses, reviews, subjects)를 포함해야 합니다.")
 
-    with open(json_file_list[0], 'r', encoding='utf-8') as f:
-        courses = json.load(f)
-    with open(json_file_list[1], 'r', encoding='utf-8') as f:
-        reviews = json.load(f)
-    with open(json_file_list[2], 'r', encoding='utf-8') as f:
-        subjects = json.load(f)
-
-    merged = {
-        "courses": courses,
-        "reviews": reviews,
-        "subjects": subjects
-    }
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(merged, f, ensure_ascii=False, indent=2)
+    keys = ["courses", "reviews", "subjects"]
+    # courses / reviews 는 레코드 모델로 검증 (subjects 는 스크래퍼가 만들지 않으므로 그대로 사용)
+    record_types = [("course",), ("review",), ()]
+    tmp_dir, part_paths, _ = _run_parts(_array_to_part, json_file_list, (2, 1), workers, record_types)
+    try:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write("{")
+            for i, (key, part_path) in enumerate(zip(keys, part_paths)):
+                f.write(("," if i else "") + f'\n  "{key}": ')
+                with open(part_path, 'r', encoding='utf-8') as part:
+                    shutil.copyfileobj(part, f)
+            f.write("\n}")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
 
     print(f"✅ 병합 완료: {output_path}")
 
 def convert_merged_to_vectorstore_format(input_path, output_path):
-    with open(input_path, 'r', encoding='utf-8') as f:
-        merged = json.load(f)
-
-    vs_data = []
-
-    for category, items in merged.items():
-        for item in items:
+    with open(output_path, 'w', encoding='utf-8') as f:
+        writer = JsonArrayWriter(f, indent=2)
+        for category, item in iter_json_object_arrays(input_path):
             # 내용 압축: 전부 문자열로 풀어내기
             flat_text = " | ".join([f"{k}: {v}" for k, v in item.items() if isinstance(v, str)])
-            vs_data.append({
+            writer.write({
                 "text": flat_text,
                 "metadata": {"source": category}
             })
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(vs_data, f, ensure_ascii=False, indent=2)
+        writer.close()
 
     print(f"✅ Vector Store용 변환 완료: {output_path}")
 
 def split_json_file_in_half(input_path, output_path1, output_path2):
     with open(input_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+        if JsonStreamReader(f).peek() != "[":
+            raise ValueError("입력 파일은 JSON 배열이어야 합니다.")
+
+    # 첫 번째 순회로 항목 수만 세고, 두 번째 순회에서 나누어 기록
+    total = sum(1 for _ in iter_json_items(input_path))
+    mid = total // 2
+
+    with open(output_path1, 'w', encoding='utf-8') as f1, open(output_path2, 'w', encoding='utf-8') as f2:
+        writer1 = JsonArrayWriter(f1, indent=2)
+        writer2 = JsonArrayWriter(f2, indent=2)
+        for i, item in enumerate(iter_json_items(input_path)):
+            (writer1 if i < mid else writer2).write(item)
+        count1 = writer1.close()
+        count2 = writer2.close()
+
+    print(f"✅ 분할 완료:\n- {output_path1} ({count1} 항목)\n- {output_path2} ({count2} 항목)")
+
+
+
+def iter_records(path):
+    """JSON 배열 파일 또는 JSONL 파일의 레코드를 하나씩 반환"""
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = JsonStreamReader(f)
+        first = reader.peek()
+    if first == "[":
+        yield from iter_json_items(path)
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def validate_json_file(input_path, record_type):
+    """
+    JSON 배열 또는 JSONL 파일의 모든 항목을 레코드 모델로 검증
+
+    매개변수:
+        input_path (str): 입력 파일 (reviewData.json / coursesData.json 또는 JSONL)
+        record_type (str): "review" 또는 "course"
+    """
+    errors = []
+    count = sum(1 for _ in validate_records(iter_records(input_path), record_type, errors))
+    if errors:
+        _print_record_errors(input_path, errors)
+        print(f"❌ 검증 실패: {input_path} ({count} 항목 중 {len(errors)}개 오류)")
+        return False
+    print(f"✅ 검증 완료: {input_path} ({count} 항목)")
+    return True
+
+
+def estimate_tokens(text):
+    """
+    대략적인 토큰 수 추정
+
+    영문/숫자 등 ASCII는 4글자에 1토큰, 한글 등 그 밖의 문자는 글자마다 1토큰으로 계산한다.
+    """
+    ascii_count = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_count + 3) // 4 + (len(text) - ascii_count)
+
+
+def _index_ranges(indices):
+    """정렬된 입력 위치 목록을 [시작, 끝) 구간 목록으로 압축"""
+    ranges = []
+    for index in indices:
+        if ranges and ranges[-1][1] == index:
+            ranges[-1][1] = index + 1
+        else:
+            ranges.append([index, index + 1])
+    return ranges
+
+
+def _plan_shards(sizes, max_bytes, max_tokens):
+    """
+    (단위 키, 바이트, 토큰) 목록을 순서대로 채워 넣어 단위별 샤드 번호를 정함
+
+    한 단위가 한도를 넘으면 그 단위만 담은 샤드를 만든다.
+    """
+    assignment = {}
+    shard, used_bytes, used_tokens, used_units = 0, 2, 0, 0
+    for unit, unit_bytes, unit_tokens in sizes:
+        over_bytes = max_bytes is not None and used_bytes + unit_bytes > max_bytes
+        over_tokens = max_tokens is not None and used_tokens + unit_tokens > max_tokens
+        if used_units and (over_bytes or over_tokens):
+            shard, used_bytes, used_tokens, used_units = shard + 1, 2, 0, 0
+        if (max_bytes is not None and unit_bytes + 2 > max_bytes) or (max_tokens is not None and unit_tokens > max_tokens):
+            print(f"⚠️ 한도를 넘는 단위가 있어 단독 샤드로 저장합니다: {unit}")
+        assignment[unit] = shard
+        used_bytes += unit_bytes
+        used_tokens += unit_tokens
+        used_units += 1
+    return assignment
+
+
+def shard_json_file(input_path, output_dir, max_bytes=None, max_tokens=None, group_key=None):
+    """
+    JSON 배열 또는 JSONL 파일을 크기 한도 안의 샤드 여러 개로 분할
+
+    매개변수:
+        input_path (str): 입력 파일 (JSON 배열 또는 JSONL)
+        output_dir (str): 샤드와 manifest.json을 저장할 폴더
+        max_bytes (int): 샤드 하나의 최대 바이트 수
+        max_tokens (int): 샤드 하나의 최대 추정 토큰 수
+        group_key (str): 같은 값을 가진 항목을 한 샤드에 모을 필드 (예: "강의코드")
+
+    입력은 스트리밍으로 읽는다. group_key가 있으면 첫 번째 순회에서 그룹별 크기만 모으고
+    두 번째 순회에서 항목을 그룹이 배정된 샤드에 기록한다.
+    샤드는 입력과 같은 형식(JSON 배열은 한 줄 배열, JSONL은 JSONL)으로 저장된다.
+    """
+    if max_bytes is None and max_tokens is None:
+        raise ValueError("max_bytes 또는 max_tokens 중 하나는 지정해야 합니다.")
+
+    with open(input_path, 'r', encoding='utf-8') as f:
+        is_jsonl = JsonStreamReader(f).peek() != "["
+    stem, _ = os.path.splitext(os.path.basename(input_path))
+    ext = ".jsonl" if is_jsonl else ".json"
+
+    def unit_of(index, item):
+        if group_key is None:
+            return index
+        return item.get(group_key) if isinstance(item, dict) else None
+
+    # 1단계: 단위(항목 또는 그룹)별 바이트 / 토큰 수 집계
+    sizes = {}
+    for index, item in enumerate(iter_records(input_path)):
+        text = json.dumps(item, ensure_ascii=False)
+        unit = unit_of(index, item)
+        entry = sizes.setdefault(unit, [0, 0])
+        entry[0] += len(text.encode('utf-8')) + 1  # 구분자(쉼표 또는 줄바꿈) 포함
+        entry[1] += estimate_tokens(text)
+    assignment = _plan_shards([(unit, b, t) for unit, (b, t) in sizes.items()], max_bytes, max_tokens)
+    shard_count = max(assignment.values()) + 1 if assignment else 0
+
+    # 2단계: 항목을 배정된 샤드에 기록
+    os.makedirs(output_dir, exist_ok=True)
+    shards = []
+    files = []
+    for i in range(shard_count):
+        path = os.path.join(output_dir, f"{stem}_shard{i:03d}{ext}")
+        files.append(open(path, 'w', encoding='utf-8'))
+        shards.append({"file": os.path.basename(path), "indices": [], "bytes": 0, "tokens": 0})
+    try:
+        for index, item in enumerate(iter_records(input_path)):
+            text = json.dumps(item, ensure_ascii=False)
+            shard = assignment[unit_of(index, item)]
+            info = shards[shard]
+            if is_jsonl:
+                files[shard].write(text + "\n")
+            else:
+                files[shard].write(("," if info["indices"] else "[") + text)
+            info["indices"].append(index)
+            info["tokens"] += estimate_tokens(text)
+    finally:
+        for shard, f in enumerate(files):
+            if not is_jsonl:
+                f.write("]" if shards[shard]["indices"] else "[]")
+            f.close()
+
+    manifest = {
+        "source": os.path.basename(input_path),
+        "max_bytes": max_bytes,
+        "max_tokens": max_tokens,
+        "group_key": group_key,
+        "shards": [],
+    }
+    for info in shards:
+        path = os.path.join(output_dir, info["file"])
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                digest.update(block)
+        manifest["shards"].append({
+            "file": info["file"],
+            "items": len(info["indices"]),
+            "ranges": _index_ranges(info["indices"]),
+            "bytes": os.path.getsize(path),
+            "tokens": info["tokens"],
+            "sha256": digest.hexdigest(),
+        })
+
+    manifest_path = os.path.join(output_dir, "manifest.json")
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    print(f"✅ 샤드 분할 완료: {shard_count}개 샤드, manifest: {manifest_path}")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OTL 크롤링 데이터 변환 도구")
+    commands = parser.add_subparsers(dest="command", required=True)
 
-    if not isinstance(data, list):
-        raise ValueError("입력 파일은 JSON 배열이어야 합니다.")
+    p = commands.add_parser("merge-jsonl", help="여러 JSON 파일을 하나의 JSONL로 병합")
+    p.add_argument("inputs", nargs="+")
+    p.add_argument("-o", "--output", required=True)
 
-    mid = len(data) // 2
-    part1 = data[:mid]
-    part2 = data[mid:]
+    p = commands.add_parser("merge-type", help="courses / reviews / subjects 파일을 하나의 JSON 객체로 병합")
+    p.add_argument("inputs", nargs=3)
+    p.add_argument("-o", "--output", required=True)
 
-    with open(output_path1, 'w', encoding='utf-8') as f1:
-        json.dump(part1, f1, ensure_ascii=False, indent=2)
+    p = commands.add_parser("vectorstore", help="병합 파일을 Vector Store 업로드 형식으로 변환")
+    p.add_argument("input")
+    p.add_argument("-o", "--output", required=True)
 
-    with open(output_path2, 'w', encoding='utf-8') as f2:
-        json.dump(part2, f2, ensure_ascii=False, indent=2)
+    p = commands.add_parser("split", help="JSON 배열을 항목 수 기준으로 절반으로 분할")
+    p.add_argument("input")
+    p.add_argument("output1")
+    p.add_argument("output2")
 
-    print(f"✅ 분할 완료:\n- {output_path1} ({len(part1)} 항목)\n- {output_path2} ({len(part2)} 항목)")
+    p = commands.add_parser("shard", help="JSON 배열 / JSONL을 바이트 또는 토큰 한도 안의 샤드로 분할")
+    p.add_argument("input")
+    p.add_argument("-o", "--output-dir", required=True)
+    p.add_argument("--max-bytes", type=int)
+    p.add_argument("--max-tokens", type=int)
+    p.add_argument("--group-key", help="같은 값을 가진 항목을 한 샤드에 모을 필드 (예: 강의코드)")
 
+    p = commands.add_parser("validate", help="리뷰 / 과목 파일의 항목이 레코드 형식에 맞는지 검사")
+    p.add_argument("record_type", choices=sorted(RECORD_TYPES))
+    p.add_argument("input")
 
-# otl_crawl 폴더 기준 상대경로 사용
-json_file_list = [
-    './otl_crawl/coursesData.json',
-    './otl_crawl/subjectData.json',
-    './otl_crawl/reviewData.json'
-]
+    args = parser.parse_args()
+    if args.command == "merge-jsonl":
+        merge_json_files_to_jsonl(args.inputs, args.output)
+    elif args.command == "merge-type":
+        merge_json_files_by_type(args.inputs, args.output)
+    elif args.command == "vectorstore":
+        convert_merged_to_vectorstore_format(args.input, args.output)
+    elif args.command == "split":
+        split_json_file_in_half(args.input, args.output1, args.output2)
+    elif args.command == "shard":
+        shard_json_file(args.input, args.output_dir, args.max_bytes, args.max_tokens, args.group_key)
+    elif args.command == "validate":
+        if not validate_json_file(args.input, args.record_type):
+            raise SystemExit(1)
 
-# merge_json_files_to_jsonl(json_file_list, './otl_crawl/file-OtlData.jsonl')
-# merge_json_files_by_type(json_file_list, './otl_crawl/merged_OtlData.json')
-"""
-convert_merged_to_vectorstore_format(
-    'otl_crawl/merged_OtlData.json',
-    'otl_crawl/vectorstore_OtlData.json'
-)
-"""
 
-split_json_file_in_half(
-    './otl_crawl/reviewData.json',
-    './otl_crawl/reviewData_part1.json',
-    './otl_crawl/reviewData_part2.json'
-)
\ No newline at end of file
+if __name__ == "__main__":
+    # 예: python otl_crawl/json_convert.py shard ./otl_crawl/reviewData.json -o ./otl_crawl/shards --max-bytes 5000000 --group-key 강의코드
+    main()
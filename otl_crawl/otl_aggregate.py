@@ -0,0 +1,146 @@
+import argparse
+import json
+import os
+import re
+
+import numpy as np
+
+from json_convert import iter_records
+from otl_ratings import GRADE_THRESHOLDS, RATING_FIELDS, grade_to_number, recommendation_to_number
+
+# 집계 결과 배열의 항목 순서 (ratingAggregates.json 의 "fields")
+AGGREGATE_FIELDS = [
+    "gradeScore", "workloadScore", "teachingScore", "recommendationScore",
+    "reviewCount", "grade", "workload", "teaching",
+]
+
+# 과목별 리뷰 파일에 남기는 항목 (상세 창에 표시하는 값만)
+REVIEW_FILE_FIELDS = ("학기", "리뷰내용", "평점")
+
+# np.searchsorted 용 오름차순 하한과 학점 (하한 미만은 F)
+_GRADE_LOWERS = np.array([lower for lower, _ in reversed(GRADE_THRESHOLDS)])
+_GRADE_LETTERS = np.array(["F"] + [grade for _, grade in reversed(GRADE_THRESHOLDS)])
+
+
+def scores_to_grades(scores):
+    """평균 점수 배열을 학점 문자열 배열로 변환 (otl_ratings.number_to_grade 와 같은 구간)"""
+    return _GRADE_LETTERS[np.searchsorted(_GRADE_LOWERS, scores, side="right")]
+
+
+def load_rating_matrix(reviews):
+    """
+    리뷰 레코드를 평점 행렬과 그룹 번호 배열로 변환
+
+    반환값: (점수 행렬 [리뷰 수 x 4: 성적, 널널, 강의, 추천], (과목, 교수) 번호 배열, (과목, 교수) 목록)
+    """
+    pair_ids = {}
+    pair_index = []
+    rows = []
+    for review in reviews:
+        pair = (review.get("강의코드", ""), review.get("교수명", ""))
+        pair_index.append(pair_ids.setdefault(pair, len(pair_ids)))
+        ratings = review.get("평점") or {}
+        rows.append([grade_to_number(ratings.get(field)) for field in RATING_FIELDS]
+                    + [recommendation_to_number(ratings.get("recommendation"))])
+
+    scores = np.array(rows, dtype=np.float64).reshape(-1, len(RATING_FIELDS) + 1)
+    return scores, np.array(pair_index, dtype=np.int64), list(pair_ids)
+
+
+def group_means(scores, group_index, group_count):
+    """그룹 번호별 평균 점수 [그룹 수 x 4]와 리뷰 수 반환"""
+    counts = np.bincount(group_index, minlength=group_count)
+    sums = np.stack([np.bincount(group_index, weights=scores[:, j], minlength=group_count)
+                     for j in range(scores.shape[1])], axis=1)
+    return sums / np.maximum(counts, 1)[:, None], counts
+
+
+def _entries(means, counts, decimals):
+    letters = [scores_to_grades(means[:, j]) for j in range(len(RATING_FIELDS))]
+    rounded = np.round(means, decimals)
+    for i in range(len(counts)):
+        yield [float(v) for v in rounded[i]] + [int(counts[i])] + [str(column[i]) for column in letters]
+
+
+def compute_aggregates(reviews, decimals=4):
+    """
+    (과목 코드, 교수명)별 평균 평점 / 학점 / 리뷰 수 계산
+
+    평균과 학점은 subjectUtils.ts 의 calculateSubjectRating 과 같은 규칙으로 계산한다.
+    반환값: {"fields": [...], "byCourseProfessor": {코드: {교수명: [...]}}}
+    """
+    scores, pair_index, pairs = load_rating_matrix(reviews)
+
+    pair_means, pair_counts = group_means(scores, pair_index, len(pairs))
+
+    by_pair = {}
+    for (code, professor), entry in zip(pairs, _entries(pair_means, pair_counts, decimals)):
+        by_pair.setdefault(code, {})[professor] = entry
+
+    return {"fields": AGGREGATE_FIELDS, "byCourseProfessor": by_pair}
+
+
+def _iter_reviews(reviews_path):
+    """리뷰 파일의 레코드 (파일이 없으면 빈 데이터로 처리하여 프론트엔드 빌드가 깨지지 않도록 함)"""
+    if not os.path.exists(reviews_path):
+        print(f"⚠️ 리뷰 파일이 없어 빈 데이터로 생성합니다: {reviews_path}")
+        return iter(())
+    return iter_records(reviews_path)
+
+
+def write_aggregates(reviews_path, output_path, decimals=4):
+    """reviewData.json (또는 JSONL)에서 집계 파일 생성"""
+    aggregates = compute_aggregates(_iter_reviews(reviews_path), decimals)
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(aggregates, f, ensure_ascii=False, separators=(",", ":"))
+    print(f"✅ 평점 집계 완료: {output_path} (과목 {len(aggregates['byCourseProfessor'])}개, "
+          f"과목/교수 {sum(len(v) for v in aggregates['byCourseProfessor'].values())}개)")
+    return aggregates
+
+
+def review_filename(code):
+    """과목 코드의 리뷰 파일 이름 (subjectUtils.ts 의 reviewFileName 과 같은 규칙)"""
+    return re.sub(r"[^A-Za-z0-9._-]", "_", code) + ".json"
+
+
+def write_review_files(reviews_path, output_dir):
+    """
+    리뷰를 과목 코드별 {교수명: [리뷰]} 파일로 나누어 저장
+
+    프론트엔드는 전체 리뷰를 번들에 넣지 않고 상세 창을 열 때 해당 과목 파일만 불러온다.
+    이전 실행에서 만든 파일은 지우고 다시 만든다.
+    """
+    courses = {}
+    for review in _iter_reviews(reviews_path):
+        professors = courses.setdefault(review.get("강의코드", ""), {})
+        professors.setdefault(review.get("교수명", ""), []).append(
+            {field: review.get(field) for field in REVIEW_FILE_FIELDS})
+
+    os.makedirs(output_dir, exist_ok=True)
+    for name in os.listdir(output_dir):
+        if name.endswith(".json"):
+            os.remove(os.path.join(output_dir, name))
+    for code, professors in courses.items():
+        with open(os.path.join(output_dir, review_filename(code)), 'w', encoding='utf-8') as f:
+            json.dump(professors, f, ensure_ascii=False, separators=(",", ":"))
+    print(f"✅ 과목별 리뷰 파일 생성 완료: {output_dir} (과목 {len(courses)}개)")
+    return len(courses)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="과목+교수별 평균 평점 집계와 과목별 리뷰 파일 생성")
+    parser.add_argument("--reviews", default="./otl_crawl/reviewData.json")
+    parser.add_argument("-o", "--output", default="./src/data/ratingAggregates.json")
+    parser.add_argument("--reviews-dir", default="./public/reviews", help="과목별 리뷰 파일을 저장할 폴더")
+    parser.add_argument("--decimals", type=int, default=4)
+    args = parser.parse_args()
+
+    write_aggregates(args.reviews, args.output, args.decimals)
+    write_review_files(args.reviews, args.reviews_dir)
+
+
+if __name__ == "__main__":
+    main()
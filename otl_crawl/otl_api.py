@@ -0,0 +1,295 @@
+import aiohttp
+import asyncio
+import os
+import time
+
+from otl_crawling import OTL_URL, TYPE_MAPPING, DEPT_MAPPING
+from otl_journal import JsonlJournal
+from otl_rate import RateController
+from otl_records import Review, Ratings, Course, records_to_json
+from otl_state import CrawlStateStore
+
+# OTL 프론트엔드가 화면에 표시하는 값과 API 응답 값의 대응 관계
+# (리뷰 블록의 "성적 A", "널널 B", "강의 C" 및 "2023 봄" 형식의 학기 표기)
+SCORE_LETTERS = ["?", "F", "D", "C", "B", "A"]
+SEMESTER_NAMES = {1: "봄", 2: "여름", 3: "가을", 4: "겨울"}
+
+REVIEW_PAGE_SIZE = 100
+
+
+def filter_code(element_id):
+    """체크박스 ID에서 API 필터 값 추출 (예: "type-HSE" -> "HSE")"""
+    return element_id.split("-", 1)[1]
+
+
+def score_letter(value):
+    """API의 0~5 점수를 화면에 표시되는 문자 등급으로 변환"""
+    if isinstance(value, int) and 0 <= value < len(SCORE_LETTERS):
+        return SCORE_LETTERS[value]
+    return SCORE_LETTERS[0]
+
+
+def course_code_of(course):
+    """상세 창 부제목에 표시되는 과목코드 (새 코드가 있으면 새 코드 사용)"""
+    return course.get("new_code") or course.get("old_code") or ""
+
+
+def build_course_record(course):
+    """API 과목 응답을 OTLCourseScraper가 만드는 과목 레코드(Course)로 변환"""
+    department = course.get("department") or {}
+    return Course(
+        course.get("title", "").strip(),
+        course_code_of(course),
+        department.get("name", "").strip(),
+        course.get("type", "").strip(),
+        course.get("summary", "").strip(),
+    )
+
+
+def build_review_record(course, review):
+    """API 리뷰 응답을 OTLScraper.scrape_reviews가 만드는 리뷰 레코드(Review)로 변환"""
+    lecture = review.get("lecture") or {}
+    professors = lecture.get("professors") or []
+    professor_name = ", ".join(p.get("name", "").strip() for p in professors) or "알 수 없음"
+    if lecture.get("year") and lecture.get("semester") in SEMESTER_NAMES:
+        semester = f"{lecture['year']} {SEMESTER_NAMES[lecture['semester']]}"
+    else:
+        semester = "알 수 없음"
+
+    return Review(
+        course.get("title", "").strip(),
+        course_code_of(course),
+        professor_name,
+        semester,
+        review.get("content", "").strip(),
+        Ratings.from_json({
+            "recommendation": str(review.get("like", 0)),
+            "grade": score_letter(review.get("grade")),
+            "workload": score_letter(review.get("load")),
+            "teaching": score_letter(review.get("speech")),
+        }),
+    )
+
+
+class OTLApiScraper:
+    """
+    Selenium 대신 OTL의 JSON API를 직접 호출하는 스크래퍼
+
+    OTLScraper / OTLCourseScraper와 같은 메서드(navigate_to_otl, select_filters,
+    scrape_courses, save_to_json, close)를 제공하며 같은 형식의 레코드를 만든다.
+    base_url을 바꾸면 녹화한 응답을 돌려주는 로컬 서버를 대상으로 실행할 수 있다.
+
+    매개변수:
+        mode (str): "review" (리뷰 수집, reviewData.json) 또는 "course" (과목 수집, coursesData.json)
+        base_url (str): API 서버 주소
+        concurrency (int): 동시에 보낼 최대 요청 수 (연결 풀 크기와 동일, 실제 값은 rate가 조절)
+        timeout (float): 요청 하나의 최대 대기 시간(초)
+        state_path (str): 수집 상태 저장소 경로 (Selenium 스크래퍼와 같은 파일을 공유)
+        rate (RateController): 요청 속도 / 동시 요청 수 조절기
+    """
+
+    def __init__(self, mode="review", base_url=OTL_URL, concurrency=8, timeout=30, state_path=None, rate=None):
+        if mode not in ("review", "course"):
+            raise ValueError("mode는 'review' 또는 'course'여야 합니다.")
+        self.mode = mode
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.params = {}
+        self.courses = []
+        self.records = []  # 수집한 리뷰 또는 과목 레코드
+        self.saved_count = 0  # 저널에 이미 기록된 레코드 수
+        self.state = CrawlStateStore(mode, state_path)  # 강의별 수집 상태 (done/failed 등)
+        self.pending_done = []  # 수집했지만 아직 저널에 기록되지 않은 강의 키
+        self.rate = rate or RateController(max_concurrency=concurrency)
+
+    def navigate_to_otl(self):
+        """Selenium 스크래퍼와의 호환용. API 백엔드는 페이지 이동이 필요 없다."""
+        print(f"OTL API 백엔드를 사용합니다: {self.base_url}")
+
+    def select_filters(self, course_types, departments):
+        """
+        검색할 강의 유형과 학과를 설정하고 검색 결과가 있는지 확인
+
+        매개변수:
+            course_types (list): 선택할 강의 유형 목록 (예: ["기필", "기선", "전필"])
+            departments (list): 선택할 학과 목록 (예: ["전산"], "전체"는 학과 제한 없음)
+        """
+        types = [filter_code(TYPE_MAPPING[t]) for t in course_types if t in TYPE_MAPPING]
+        depts = [filter_code(DEPT_MAPPING[d]) for d in departments if d in DEPT_MAPPING]
+        self.params = {
+            "type": types or ["ALL"],
+            "department": depts or ["ALL"],
+            "level": ["ALL"],
+            "term": ["ALL"],
+        }
+        try:
+            self.courses = asyncio.run(self._run(self._fetch_courses))
+        except Exception as e:
+            print(f"과목 목록 조회 중 오류 발생: {e}")
+            return False
+        if not self.courses:
+            print("검색 결과가 없습니다. 다른 필터를 시도해보세요.")
+            return False
+        print(f"총 {len(self.courses)}개의 강의를 찾았습니다")
+        return True
+
+    def scrape_courses(self, save_interval=5, filename=None):
+        """
+        선택한 필터의 모든 강의를 병렬로 수집
+
+        매개변수:
+            save_interval (int): 몇 개의 강의마다 JSON 파일에 저장할지 지정
+            filename (str): 저장할 JSON 파일 이름 (기본값: 모드별 기본 파일)
+        """
+        filename = filename or ("reviewData.json" if self.mode == "review" else "coursesData.json")
+        full_path = os.path.join(os.getcwd(), "otl_crawl", filename)
+
+        # 상태 저장소를 처음 사용하면 기존 결과 파일의 강의를 수집 완료로 가져옴
+        self.state.seed_if_empty(lambda: [self._record_key(record) for record in JsonlJournal(full_path).load()])
+        self.state.warn_if_results_missing(JsonlJournal(full_path).exists())
+        self.records = []  # 이번 실행에서 새로 수집한 데이터만 보관
+        self.saved_count = 0
+
+        pending = [c for c in self.courses if not self.state.is_done(self._course_key(c))]
+        print(f"이미 수집한 강의 {len(self.courses) - len(pending)}개를 건너뛰고 {len(pending)}개를 수집합니다.")
+
+        try:
+            asyncio.run(self._run(self._scrape_pending, pending, save_interval, filename))
+        finally:
+            self.save_to_json(filename)
+            self.compact_json(filename)
+            print(f"요청 속도 조절: {self.rate.snapshot()}")
+
+    def save_to_json(self, filename=None):
+        """마지막 저장 이후 수집한 데이터만 JSONL 저널에 추가 (체크포인트)"""
+        filename = filename or ("reviewData.json" if self.mode == "review" else "coursesData.json")
+        try:
+            full_path = os.path.join(os.getcwd(), "otl_crawl", filename)
+            new_records = self.records[self.saved_count:]
+            JsonlJournal(full_path).append(records_to_json(new_records))
+            self.saved_count = len(self.records)
+            # 저널에 기록된 뒤에만 수집 완료로 표시하여 중단 시 누락이 없도록 함
+            self.state.mark_done(self.pending_done)
+            self.pending_done = []
+            print(f"{len(new_records)}개의 레코드를 저널에 추가했습니다. 총 {len(self.records)}개의 레코드가 저장되었습니다.")
+        except Exception as e:
+            print(f"JSON 저장 중 오류 발생: {e}")
+
+    def compact_json(self, filename=None):
+        """저널을 기존 JSON 파일과 합쳐 프론트엔드용 JSON 배열 파일로 저장"""
+        filename = filename or ("reviewData.json" if self.mode == "review" else "coursesData.json")
+        try:
+            full_path = os.path.join(os.getcwd(), "otl_crawl", filename)
+            count = JsonlJournal(full_path).compact()
+            if count is not None:
+                print(f"데이터가 {full_path}에 저장되었습니다. 총 {count}개의 레코드가 저장되었습니다.")
+        except Exception as e:
+            print(f"JSON 병합 중 오류 발생: {e}")
+
+    def close(self):
+        """상태 저장소 종료 (HTTP 세션은 요청 묶음마다 열고 닫는다)"""
+        self.state.close()
+
+    def _course_key(self, course):
+        if self.mode == "review":
+            return f"{course.get('title', '').strip()}_{course_code_of(course)}"
+        return course_code_of(course)
+
+    def _record_key(self, record):
+        if self.mode == "review":
+            return f"{record['강의명']}_{record['강의코드']}"
+        return record["과목코드"]
+
+    async def _run(self, func, *args):
+        """연결 풀을 가진 세션 안에서 코루틴 실행 (동시 요청 수는 self.rate가 제한)"""
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(base_url=self.base_url, connector=connector, timeout=timeout) as session:
+            return await func(session, *args)
+
+    async def _get_json(self, session, path, params=None):
+        async with self.rate.slot():
+            started = time.perf_counter()
+            try:
+                async with session.get(path, params=params) as response:
+                    # 429 / 5xx 는 서버 과부하로 보고 요청 속도를 줄임
+                    overloaded = response.status == 429 or response.status >= 500
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+            except (asyncio.TimeoutError, aiohttp.ClientError):
+                self.rate.record(time.perf_counter() - started, error=True)
+                raise
+            self.rate.record(time.perf_counter() - started, error=overloaded)
+            return data
+
+    async def _fetch_courses(self, session):
+        query = [(key, value) for key, values in self.params.items() for value in values]
+        return await self._get_json(session, "/api/courses", params=query)
+
+    async def _fetch_reviews(self, session, course):
+        """한 과목의 모든 리뷰를 페이지 단위로 조회"""
+        reviews = []
+        offset = 0
+        while True:
+            page = await self._get_json(
+                session, f"/api/courses/{course['id']}/reviews",
+                params={"order": "-written_datetime", "offset": offset, "limit": REVIEW_PAGE_SIZE},
+            )
+            reviews.extend(page)
+            if len(page) < REVIEW_PAGE_SIZE:
+                return reviews
+            offset += REVIEW_PAGE_SIZE
+
+    async def _scrape_course(self, session, course):
+        self.state.mark_started(self._course_key(course))
+        if self.mode == "course":
+            return [build_course_record(course)]
+        reviews = await self._fetch_reviews(session, course)
+        return [build_review_record(course, review) for review in reviews if not review.get("is_deleted")]
+
+    async def _scrape_pending(self, session, pending, save_interval, filename):
+        """
+        남은 강의를 동시에 수집하되 결과는 강의 목록 순서대로 추가
+
+        동시 요청 수와 요청 속도는 self.rate가 제한하므로 모든 작업을 한 번에 만들어도 된다.
+        """
+        tasks = [asyncio.create_task(self._scrape_course(session, course)) for course in pending]
+        courses_since_last_save = 0
+        for i, (course, task) in enumerate(zip(pending, tasks)):
+            try:
+                records = await task
+            except Exception as e:
+                print(f"강의 처리 중 오류 발생: {course.get('title')} ({e})")
+                self.state.mark_failed(self._course_key(course), e)
+                continue
+            self.records.extend(records)
+            self.pending_done.append(self._course_key(course))
+            print(f"강의 처리 완료 {i+1}/{len(pending)}: {course.get('title')} ({len(records)}개 레코드)")
+
+            courses_since_last_save += 1
+            if courses_since_last_save >= save_interval:
+                self.save_to_json(filename)
+                courses_since_last_save = 0
+
+
+def main():
+    scraper = OTLApiScraper(mode="review", concurrency=8)
+
+    try:
+        scraper.navigate_to_otl()
+
+        # 필터 설정
+        course_types = ["인선"]
+        departments = ["전체"]
+
+        if scraper.select_filters(course_types, departments):
+            scraper.scrape_courses(save_interval=50, filename="reviewData.json")
+        else:
+            print("검색 결과가 없어 스크래핑을 중단합니다.")
+    finally:
+        scraper.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import gzip
+import json
+import os
+import time
+import zlib
+
+from otl_wait import DETAIL_SECTION, REVIEW_BLOCK
+
+DEFAULT_ARCHIVE = "pageArchive.jsonl.gz"
+
+# 상세 창의 outerHTML (상세 창 밖에 렌더링된 리뷰 블록이 있으면 뒤에 함께 붙임)
+PAGE_HTML_SCRIPT = f"""
+const section = document.getElementsByClassName('{DETAIL_SECTION[1]}')[0];
+if (!section) return null;
+const outside = Array.from(document.getElementsByClassName('{REVIEW_BLOCK[1]}')).filter((block) => !section.contains(block));
+if (!outside.length) return section.outerHTML;
+return section.outerHTML + '<div class="otl-archive-reviews">' + outside.map((block) => block.outerHTML).join('') + '</div>';
+"""
+
+
+def archive_path(filename=DEFAULT_ARCHIVE):
+    return os.path.join(os.getcwd(), "otl_crawl", filename)
+
+
+class PageArchive:
+    """
+    강의 상세 창의 원본 HTML을 모아 두는 추가 전용 압축 아카이브
+
+    페이지 하나는 {"course_code", "course_title", "crawled_at", "source", "html"} 한 줄(JSONL)이고,
+    체크포인트마다 모인 페이지를 gzip 멤버 하나로 압축해 파일 끝에 붙인다 (이어 붙인 gzip 멤버는
+    하나의 gzip 스트림으로 읽힌다). 기존 내용은 다시 쓰지 않으므로 여러 워커가 같은 파일에
+    추가해도 되고, 기록 도중 중단되어 잘린 마지막 멤버는 읽을 때 버린다.
+    otl_reparse.py 가 이 아카이브에서 reviewData.json / coursesData.json 을 다시 만든다.
+
+    매개변수:
+        path (str): 아카이브 경로 (기본값: otl_crawl/pageArchive.jsonl.gz)
+        source (str): 페이지를 저장한 스크래퍼 ("review", "course", "unified")
+            course 스크래퍼는 리뷰 로드를 기다리지 않으므로 리뷰 재추출에는 사용하지 않는다.
+    """
+
+    def __init__(self, path=None, source="review"):
+        self.path = path or archive_path()
+        self.source = source
+        self.pending = []  # 아직 파일에 쓰지 않은 페이지
+
+    def add(self, driver, course_title, course_code):
+        """현재 상세 창의 HTML을 아카이브 대기열에 추가 (상세 창이 없으면 False)"""
+        html = driver.execute_script(PAGE_HTML_SCRIPT)
+        if not html:
+            return False
+        self.pending.append({
+            "course_code": course_code,
+            "course_title": course_title,
+            "crawled_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "source": self.source,
+            "html": html,
+        })
+        return True
+
+    def flush(self):
+        """대기 중인 페이지를 gzip 멤버 하나로 압축해 파일 끝에 추가하고 디스크에 동기화"""
+        if not self.pending:
+            return 0
+        data = "".join(json.dumps(page, ensure_ascii=False) + "\n" for page in self.pending)
+        member = gzip.compress(data.encode("utf-8"))
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        # O_APPEND 로 멤버 전체를 한 번에 써서 다른 워커의 기록과 섞이지 않도록 함
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, member)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        count = len(self.pending)
+        self.pending = []
+        return count
+
+    def pages(self):
+        """아카이브의 모든 페이지를 기록 순서대로 반환 (잘린 마지막 멤버는 버림)"""
+        if not os.path.exists(self.path):
+            return
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            try:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break
+                    yield json.loads(line)
+            except (EOFError, gzip.BadGzipFile, zlib.error, json.JSONDecodeError):
+                print(f"아카이브 끝의 손상된 기록을 건너뛰었습니다: {self.path}")
+
+    def latest(self, sources=None):
+        """
+        강의(강의명 + 코드)마다 가장 최근에 저장한 페이지 목록 (처음 저장된 순서)
+
+        매개변수:
+            sources (set): 이 스크래퍼들이 저장한 페이지만 사용 (None이면 모두)
+        """
+        latest = {}
+        for page in self.pages():
+            if sources is not None and page.get("source") not in sources:
+                continue
+            key = (page["course_title"], page["course_code"])
+            if key not in latest or page["crawled_at"] >= latest[key]["crawled_at"]:
+                latest[key] = page
+        return list(latest.values())
@@ -0,0 +1,163 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from otl_crawling import OTLScraper, TYPE_MAPPING
+from otl_course import OTLCourseScraper
+from otl_fixture import FixtureServer
+from otl_memory import MemorySampler
+from otl_profiles import PROFILES
+
+# 벤치마크할 스크래퍼 종류별 클래스와 저장 파일 이름
+SCRAPERS = {
+    "review": (OTLScraper, "reviewData.json"),
+    "course": (OTLCourseScraper, "coursesData.json"),
+}
+
+
+class CommandCounter:
+    """
+    WebDriver 명령(find_element, executeScript, getElementText 등) 호출 횟수를 셈
+
+    WebElement 메서드도 내부적으로 driver.execute 를 호출하므로 드라이버 인스턴스 하나만 감싸면 된다.
+    """
+
+    def __init__(self, driver):
+        self.counts = {}
+        self._execute = driver.execute
+
+        def execute(command, params=None):
+            self.counts[command] = self.counts.get(command, 0) + 1
+            return self._execute(command, params)
+
+        driver.execute = execute
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def snapshot(self):
+        return dict(self.counts)
+
+
+def run_scraper(name, base_url, workdir, course_types, departments, bulk_extract=True, save_interval=5,
+                profile="fast"):
+    """
+    로컬 서버를 대상으로 스크래퍼 하나를 처음부터 끝까지 실행하고 측정값 반환
+
+    결과 파일과 상태 저장소는 workdir 아래에 만들어 실제 데이터와 섞이지 않도록 한다.
+    """
+    scraper_class, filename = SCRAPERS[name]
+    os.makedirs(os.path.join(workdir, "otl_crawl"), exist_ok=True)
+    previous_cwd = os.getcwd()
+    os.chdir(workdir)  # 스크래퍼는 현재 폴더의 otl_crawl/ 아래에 저장한다
+    sampler = MemorySampler().start()
+    scraper = None
+    try:
+        scraper = scraper_class(headless=True, bulk_extract=bulk_extract, profile=profile,
+                                state_path=os.path.join(workdir, "otl_crawl", f"{name}State.db"))
+        counter = CommandCounter(scraper.driver)
+
+        setup_started = time.perf_counter()
+        scraper.navigate_to_otl(base_url)
+        if not scraper.select_filters(course_types, departments):
+            raise RuntimeError("로컬 서버에서 검색 결과를 얻지 못했습니다.")
+        setup_seconds = time.perf_counter() - setup_started
+        setup_calls = counter.total
+
+        scrape_started = time.perf_counter()
+        scraper.scrape_courses(save_interval=save_interval, filename=filename)
+        scrape_seconds = time.perf_counter() - scrape_started
+
+        courses = scraper.state.counts().get("done", 0)
+        scrape_calls = counter.total - setup_calls
+        commands = counter.snapshot()
+        waits = scraper.waits.summary()
+    finally:
+        if scraper is not None:
+            scraper.close()
+        sampler.stop()
+        os.chdir(previous_cwd)
+
+    return {
+        "scraper": name,
+        "profile": profile,
+        "bulk_extract": bulk_extract,
+        "courses": courses,
+        "setup_seconds": setup_seconds,
+        "scrape_seconds": scrape_seconds,
+        "courses_per_minute": courses / scrape_seconds * 60 if scrape_seconds else 0.0,
+        "webdriver_calls": scrape_calls,
+        "webdriver_calls_per_course": scrape_calls / courses if courses else 0.0,
+        "setup_webdriver_calls": setup_calls,
+        "commands": dict(sorted(commands.items(), key=lambda item: -item[1])),
+        "peak_rss_python_mb": sampler.peak_self / (1 << 20),
+        "peak_rss_total_mb": sampler.peak_tree / (1 << 20),
+        "waits": waits,
+    }
+
+
+def print_result(result):
+    mode = "bulk" if result["bulk_extract"] else "legacy"
+    print(f"\n[{result['scraper']} / {mode} / {result['profile']}] 강의 {result['courses']}개, {result['scrape_seconds']:.1f}초")
+    print(f"  처리량: {result['courses_per_minute']:.1f} 강의/분")
+    print(f"  WebDriver 호출: 강의당 {result['webdriver_calls_per_course']:.1f}회 "
+          f"(전체 {result['webdriver_calls']}회, 필터 설정 {result['setup_webdriver_calls']}회)")
+    top = ", ".join(f"{command} {count}" for command, count in list(result["commands"].items())[:5])
+    print(f"  주요 명령: {top}")
+    print(f"  최대 메모리: Python {result['peak_rss_python_mb']:.0f}MB, "
+          f"브라우저 포함 {result['peak_rss_total_mb']:.0f}MB")
+
+
+def run_benchmark(scrapers=("review", "course"), course_count=100, reviews_per_course=10, latency=0.05,
+                  legacy=False, seed=0, profiles=("fast",)):
+    """
+    로컬 서버를 띄우고 스크래퍼별로 벤치마크 실행
+
+    매개변수:
+        scrapers (list): "review", "course" 중 실행할 스크래퍼
+        course_count (int): 가상 과목 수
+        reviews_per_course (int): 과목마다 리뷰 수
+        latency (float): API 응답 지연(초)
+        legacy (bool): 요소별 추출(bulk_extract=False)도 함께 측정할지 여부
+        profiles (list): 비교할 크롤링 프로필 목록 (예: ["debug", "fast", "minimal-memory"])
+    """
+    results = []
+    with FixtureServer(course_count, reviews_per_course, latency, seed=seed) as server:
+        print(f"로컬 OTL 서버: {server.url} (과목 {course_count}개, 리뷰 {reviews_per_course}개/과목, "
+              f"지연 {latency * 1000:.0f}ms)")
+        for name in scrapers:
+            for profile in profiles:
+                for bulk_extract in ((True, False) if legacy else (True,)):
+                    with tempfile.TemporaryDirectory(prefix="otl_bench_") as workdir:
+                        result = run_scraper(name, server.url, workdir, list(TYPE_MAPPING), ["전체"], bulk_extract,
+                                             profile=profile)
+                    print_result(result)
+                    results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 OTL 서버를 대상으로 한 스크래퍼 벤치마크")
+    parser.add_argument("--scrapers", nargs="+", choices=list(SCRAPERS), default=list(SCRAPERS))
+    parser.add_argument("--courses", type=int, default=100)
+    parser.add_argument("--reviews", type=int, default=10, help="과목마다 리뷰 수")
+    parser.add_argument("--latency", type=float, default=50, help="API 응답 지연(ms)")
+    parser.add_argument("--legacy", action="store_true", help="요소별 추출 방식도 함께 측정")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--profiles", nargs="+", choices=list(PROFILES), default=["fast"], help="비교할 크롤링 프로필")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.scrapers, args.courses, args.reviews, args.latency / 1000, args.legacy, args.seed,
+                            args.profiles)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과를 {args.json}에 저장했습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+from collections import deque
+import gzip
+import json
+import os
+import re
+import time
+
+from otl_wait import DETAIL_SECTION
+
+# 실패 기록 수준 (뒤로 갈수록 많이 기록)
+#
+#   off        기록하지 않음
+#   text       오류 종류 / 메시지 / URL / 문맥만 JSON으로 기록
+#   dom        text + 상세 창(_section--course-detail)의 outerHTML
+#   screenshot dom + 전체 화면 스크린샷(PNG)
+CAPTURE_LEVELS = ("off", "text", "dom", "screenshot")
+
+# 상세 창이 있으면 outerHTML, 없으면 null (목록 전체 DOM은 크기가 커서 기록하지 않음)
+_DETAIL_HTML_SCRIPT = f"""
+const section = document.getElementsByClassName('{DETAIL_SECTION[1]}')[0];
+return section ? section.outerHTML : null;
+"""
+
+
+def error_signature(name, error):
+    """같은 오류를 한 번만 기록하기 위한 키 (숫자와 Selenium 스택 트레이스를 지운 메시지)"""
+    message = str(error).split("Stacktrace:")[0]
+    message = re.sub(r"0x[0-9a-f]+|\d+", "#", message).strip()
+    return f"{name}|{type(error).__name__}|{message[:300]}"
+
+
+class FailureCapture:
+    """
+    오류가 난 순간의 페이지 상태를 단계별로 가볍게 기록
+
+    예외마다 1920x1080 스크린샷을 남기던 방식 대신 level에 따라 필요한 만큼만 기록하고,
+    기록은 gzip으로 압축한 JSON 파일(스크린샷은 같은 이름의 PNG)로 directory에 남긴다.
+    최근 limit개만 유지하는 링 버퍼로 오래된 기록은 지우고, 같은 오류(error_signature)는
+    실행마다 처음 한 번만 기록하고 이후에는 횟수만 센다.
+
+    매개변수:
+        level (str): "off", "text", "dom", "screenshot"
+        directory (str): 기록을 저장할 폴더 (기본값: otl_crawl/failures)
+        limit (int): 유지할 최대 기록 수
+    """
+
+    def __init__(self, level="text", directory=None, limit=50):
+        if level not in CAPTURE_LEVELS:
+            raise ValueError(f"알 수 없는 실패 기록 수준입니다: {level} (사용 가능: {', '.join(CAPTURE_LEVELS)})")
+        self.level = level
+        self.directory = directory or os.path.join(os.getcwd(), "otl_crawl", "failures")
+        self.limit = limit
+        self.seen = {}  # 오류 키 -> 발생 횟수
+        self.written = 0
+        self.suppressed = 0
+        # 이전 실행에서 남은 기록도 링 버퍼에 포함하여 폴더 크기를 제한
+        self.ring = deque(self._existing())
+        self._prune()
+
+    def _existing(self):
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(os.path.join(self.directory, name[:-len(".json.gz")])
+                      for name in os.listdir(self.directory) if name.endswith(".json.gz"))
+
+    def _prune(self):
+        while len(self.ring) > self.limit:
+            stem = self.ring.popleft()
+            for path in (f"{stem}.json.gz", f"{stem}.png"):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    def capture(self, driver, name, error, **context):
+        """
+        오류 하나를 기록하고 기록 파일 경로를 반환 (기록하지 않았으면 None)
+
+        매개변수:
+            driver: Selenium 웹드라이버 (응답하지 않으면 가능한 항목만 기록)
+            name (str): 오류가 난 위치 (예: "course_error", "filter_error")
+            error: 예외 객체 또는 메시지
+            context: 함께 남길 값 (강의 순번, 목록 제목 등)
+        """
+        if self.level == "off":
+            return None
+        signature = error_signature(name, error)
+        self.seen[signature] = self.seen.get(signature, 0) + 1
+        if self.seen[signature] > 1:
+            self.suppressed += 1
+            return None
+
+        record = {
+            "name": name,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "error_type": type(error).__name__,
+            "message": str(error).split("Stacktrace:")[0].strip(),
+            "context": context,
+        }
+        try:
+            record["url"] = driver.current_url
+            if self.level in ("dom", "screenshot"):
+                record["detail_html"] = driver.execute_script(_DETAIL_HTML_SCRIPT)
+        except Exception as e:
+            record["capture_error"] = str(e).split("Stacktrace:")[0].strip()
+
+        os.makedirs(self.directory, exist_ok=True)
+        stem = os.path.join(self.directory, f"{time.time_ns()}-{os.getpid()}-{name}")
+        if self.level == "screenshot":
+            # PNG는 이미 압축되어 있으므로 gzip 없이 저장
+            try:
+                driver.save_screenshot(f"{stem}.png")
+                record["screenshot"] = os.path.basename(f"{stem}.png")
+            except Exception as e:
+                record["capture_error"] = str(e).split("Stacktrace:")[0].strip()
+        with gzip.open(f"{stem}.json.gz", "wt", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False)
+
+        self.written += 1
+        self.ring.append(stem)
+        self._prune()
+        return f"{stem}.json.gz"
+
+    def publish(self, metrics):
+        """기록 / 중복으로 건너뛴 횟수를 CrawlMetrics 게이지로 기록"""
+        metrics.set_gauge("captures_written", self.written)
+        metrics.set_gauge("captures_suppressed", self.suppressed)
@@ -0,0 +1,239 @@
+import argparse
+import heapq
+
+from json_convert import JsonArrayWriter, estimate_tokens, iter_records, iter_json_object_arrays
+from otl_incremental import semester_rank
+from otl_ratings import RatingTotals
+
+# 평균 평점 표시용 라벨
+RATING_LABELS = (("grade", "성적"), ("workload", "널널"), ("teaching", "강의"))
+# 청크에 남은 자리가 이보다 적으면 줄을 잘라 넣지 않고 다음 청크로 넘김
+MIN_LINE_TOKENS = 16
+
+
+def truncate_to_tokens(text, max_tokens):
+    """estimate_tokens 기준으로 max_tokens 안에 들어가도록 문자열 뒷부분을 자름"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    budget = max(max_tokens - 1, 0) * 4  # 말줄임표 자리를 남김 (ASCII 4글자 = 1토큰 기준)
+    for end, ch in enumerate(text):
+        budget -= 1 if ord(ch) < 128 else 4
+        if budget < 0:
+            return text[:end].rstrip() + "…"
+    return text
+
+
+class CourseGroup:
+    """
+    과목 코드 + 교수 하나에 대한 평점 합계, 개설 학기 범위, 리뷰 표본
+
+    리뷰 전체를 보관하지 않고 최근 학기 → 긴 리뷰 순으로 max_reviews개만 유지한다.
+    """
+
+    def __init__(self, course_code, professor, max_reviews):
+        self.course_code = course_code
+        self.professor = professor
+        self.course_name = ""
+        self.max_reviews = max_reviews
+        self.totals = RatingTotals()
+        self.first_semester = None
+        self.last_semester = None
+        self.sample = []  # (학기 순서, 리뷰 길이, 입력 순번, 학기, 리뷰내용) 최소 힙
+        self.seen = 0
+
+    def add(self, review):
+        self.course_name = self.course_name or review.get("강의명", "")
+        self.totals.add(review.get("평점"))
+
+        semester = review.get("학기")
+        rank = semester_rank(semester)
+        if rank != (0, 0):
+            if self.first_semester is None or rank < semester_rank(self.first_semester):
+                self.first_semester = semester
+            if self.last_semester is None or rank > semester_rank(self.last_semester):
+                self.last_semester = semester
+
+        content = (review.get("리뷰내용") or "").strip()
+        self.seen += 1
+        if not content or self.max_reviews <= 0:
+            return
+        entry = (rank, len(content), self.seen, semester, content)
+        if len(self.sample) < self.max_reviews:
+            heapq.heappush(self.sample, entry)
+        else:
+            heapq.heappushpop(self.sample, entry)
+
+    def sampled_reviews(self):
+        """표본 리뷰를 최근 학기 순으로 반환"""
+        return [(semester, content) for _, _, _, semester, content in sorted(self.sample, reverse=True)]
+
+
+def _header_lines(group, course):
+    lines = [f"[과목] {group.course_name or course.get('과목명', '')} ({group.course_code})"]
+    if group.professor:
+        lines.append(f"교수: {group.professor}")
+    lines.append(f"학과: {course.get('학과', '')} | 구분: {course.get('구분', '')}")
+    if group.first_semester:
+        lines.append(f"개설 학기: {group.first_semester} ~ {group.last_semester}")
+    averages = group.totals.averages()
+    if averages:
+        scores = ", ".join(f"{label} {averages[field]} ({averages[field + 'Score']:.2f})" for field, label in RATING_LABELS)
+        lines.append(f"리뷰 {averages['reviewCount']}개 평균 - {scores}, 추천 {averages['recommendationScore']:.2f}")
+    return lines
+
+
+def group_chunks(group, course, target_tokens):
+    """
+    그룹 하나를 target_tokens 이하의 텍스트 청크 목록으로 묶음
+
+    첫 청크에는 과목 설명을, 모든 청크에는 과목/교수/평균 평점 머리말을 넣는다.
+    머리말 뒤 남는 자리에 표본 리뷰를 최근 학기 순으로 채운다.
+    줄마다 줄바꿈 1토큰을 더해 세므로 청크 전체의 estimate_tokens 는 target_tokens 를 넘지 않는다.
+    """
+    header = "\n".join(_header_lines(group, course))
+    header_tokens = estimate_tokens(header) + 1
+    chunks = []
+    body = []
+    used = header_tokens
+
+    description = (course.get("설명") or "").strip()
+    if description:
+        line = "설명: " + description
+        budget = target_tokens - used - 1
+        if estimate_tokens(line) > budget:
+            # 머리말만으로 자리가 거의 차면 설명은 생략
+            line = truncate_to_tokens(line, budget) if budget >= MIN_LINE_TOKENS else None
+        if line:
+            body.append(line)
+            used += estimate_tokens(line) + 1
+
+    label = "리뷰:"
+    has_reviews = False  # 현재 청크에 리뷰 줄이 있는지
+    for semester, content in group.sampled_reviews():
+        line = f"- ({semester}) {content}"
+        tokens = estimate_tokens(line) + 1
+        label_tokens = 0 if has_reviews else estimate_tokens(label) + 1
+        remaining = target_tokens - used - label_tokens
+        if tokens > remaining and body and (has_reviews or remaining - 1 < MIN_LINE_TOKENS):
+            chunks.append(header + "\n" + "\n".join(body))
+            body, used = [], header_tokens
+            if has_reviews:
+                label = "리뷰 (계속):"
+            has_reviews = False
+            label_tokens = estimate_tokens(label) + 1
+            remaining = target_tokens - used - label_tokens
+        if tokens > remaining:
+            line = truncate_to_tokens(line, max(remaining - 1, 1))
+            tokens = estimate_tokens(line) + 1
+        if not has_reviews:
+            body.append(label)
+            used += label_tokens
+            has_reviews = True
+        body.append(line)
+        used += tokens
+
+    if body or not chunks:
+        chunks.append(header + ("\n" + "\n".join(body) if body else ""))
+
+    # 머리말만으로 한도를 넘는 경우에도 청크가 target_tokens 를 넘지 않도록 확인
+    for index, text in enumerate(chunks):
+        if estimate_tokens(text) > target_tokens:
+            print(f"⚠️ 청크가 목표 토큰 수를 넘어 뒷부분을 잘랐습니다: {group.course_code} {group.professor}")
+            chunks[index] = truncate_to_tokens(text, target_tokens)
+    return chunks
+
+
+def build_chunks(courses, reviews, target_tokens=800, max_reviews=20):
+    """
+    과목 / 리뷰 레코드를 과목 코드 + 교수 단위의 Vector Store 문서로 묶음
+
+    매개변수:
+        courses (iterable): coursesData.json 형식의 과목 레코드
+        reviews (iterable): reviewData.json 형식의 리뷰 레코드
+        target_tokens (int): 문서 하나의 목표 최대 토큰 수 (estimate_tokens 기준)
+        max_reviews (int): 그룹마다 문서에 넣을 최대 리뷰 수
+
+    반환값: {"text", "metadata"} 문서를 하나씩 반환하는 제너레이터
+    """
+    course_info = {course["과목코드"]: course for course in courses}
+    groups = {}
+    for review in reviews:
+        key = (review.get("강의코드", ""), review.get("교수명", ""))
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = CourseGroup(key[0], key[1], max_reviews)
+        group.add(review)
+
+    # 리뷰가 하나도 없는 과목도 설명만 담은 문서로 포함
+    reviewed_codes = {code for code, _ in groups}
+    for code, course in course_info.items():
+        if code not in reviewed_codes:
+            group = groups[(code, "")] = CourseGroup(code, "", max_reviews)
+            group.course_name = course.get("과목명", "")
+
+    for key in sorted(groups):
+        group = groups[key]
+        course = course_info.get(group.course_code, {})
+        chunks = group_chunks(group, course, target_tokens)
+        for index, text in enumerate(chunks):
+            yield {
+                "text": text,
+                "metadata": {
+                    "source": "course_reviews",
+                    "course_code": group.course_code,
+                    "course_name": group.course_name or course.get("과목명", ""),
+                    "professor": group.professor,
+                    "department": course.get("학과", ""),
+                    "category": course.get("구분", ""),
+                    "semester_first": group.first_semester or "",
+                    "semester_last": group.last_semester or "",
+                    "review_count": group.totals.count,
+                    "chunk_index": index,
+                    "chunk_count": len(chunks),
+                },
+            }
+
+
+def _write_chunks(documents, output_path):
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        writer = JsonArrayWriter(f, indent=2)
+        for document in documents:
+            writer.write(document)
+            count += 1
+        writer.close()
+    print(f"✅ Vector Store용 청크 생성 완료: {output_path} (문서 {count}개)")
+    return count
+
+
+def chunk_files(courses_path, reviews_path, output_path, target_tokens=800, max_reviews=20):
+    """coursesData.json / reviewData.json (또는 JSONL)에서 청크 문서 파일 생성"""
+    documents = build_chunks(iter_records(courses_path), iter_records(reviews_path), target_tokens, max_reviews)
+    return _write_chunks(documents, output_path)
+
+
+def chunk_merged(merged_path, output_path, target_tokens=800, max_reviews=20):
+    """merge_json_files_by_type 로 병합한 파일에서 청크 문서 파일 생성 (과목 / 리뷰를 각각 스트리밍)"""
+    courses = (item for category, item in iter_json_object_arrays(merged_path) if category == "courses")
+    reviews = (item for category, item in iter_json_object_arrays(merged_path) if category == "reviews")
+    return _write_chunks(build_chunks(courses, reviews, target_tokens, max_reviews), output_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="과목 코드 + 교수 단위의 Vector Store 청크 생성")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("--merged", help="merge_json_files_by_type 로 병합한 파일")
+    parser.add_argument("--courses", default="./otl_crawl/coursesData.json")
+    parser.add_argument("--reviews", default="./otl_crawl/reviewData.json")
+    parser.add_argument("--target-tokens", type=int, default=800)
+    parser.add_argument("--max-reviews", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.merged:
+        chunk_merged(args.merged, args.output, args.target_tokens, args.max_reviews)
+    else:
+        chunk_files(args.courses, args.reviews, args.output, args.target_tokens, args.max_reviews)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+from array import array
+import argparse
+import gzip
+import json
+import os
+import struct
+import sys
+
+try:
+    import zstandard
+except ImportError:  # zstd 압축을 쓰지 않으면 필요 없음
+    zstandard = None
+
+from json_convert import JsonArrayWriter, iter_records
+
+# 압축 리뷰 파일 구조
+#
+#   MAGIC | 헤더 길이(uint32 LE) | 헤더 JSON | 과목 블록 ...
+#
+# 헤더에는 문자열 사전(강의명, 강의코드, 교수명, 학기, 평점 값)과 과목 코드별 블록 위치가 들어 있다.
+# 블록 하나는 과목 코드 하나의 리뷰를 열 단위로 담고 독립적으로 압축되므로
+# 특정 과목만 읽을 때는 해당 블록만 풀면 된다.
+#
+# 블록 (압축 전, 모든 정수는 little endian):
+#   n(uint32) | 원래 순번 uint32[n] | 강의명 uint32[n] | 교수명 uint32[n] | 학기 uint32[n]
+#   | 평점 uint16[n x 4] (0은 평점 없음, k는 평점 값 사전의 k-1번) | 리뷰 길이 uint32[n] | 리뷰내용 UTF-8
+
+MAGIC = b"OTLREV1\n"
+RATING_KEYS = ("recommendation", "grade", "workload", "teaching")
+STRING_FIELDS = (("name", "강의명"), ("professor", "교수명"), ("semester", "학기"))
+COMPRESSIONS = ("none", "gzip", "zstd")
+
+
+def _compress(data, compression, level=None):
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=level or 6, mtime=0)
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=level or 10).compress(data)
+    return data
+
+
+def _decompress(data, compression):
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return data
+
+
+def _packed(typecode, values):
+    """정수 목록을 little endian 배열 바이트로 변환"""
+    packed = array(typecode, values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpacked(typecode, data, offset, count):
+    """little endian 배열 바이트에서 정수 count개를 읽음 (반환값: (배열, 다음 위치))"""
+    values = array(typecode)
+    end = offset + values.itemsize * count
+    values.frombytes(data[offset:end])
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values, end
+
+
+class _Interner:
+    """문자열을 등장 순서대로 번호를 매겨 사전으로 저장"""
+
+    def __init__(self):
+        self.ids = {}
+        self.strings = []
+
+    def __call__(self, value):
+        index = self.ids.get(value)
+        if index is None:
+            index = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+def write_compact(reviews, path, compression="gzip", level=None):
+    """
+    리뷰 레코드를 사전 인코딩된 과목별 열 블록 파일로 저장
+
+    매개변수:
+        reviews (iterable): reviewData.json 형식의 리뷰 레코드
+        path (str): 저장할 파일 경로
+        compression (str): "none", "gzip", "zstd" (zstd는 zstandard 패키지 필요)
+        level (int): 압축 수준
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+    if compression == "zstd" and zstandard is None:
+        raise RuntimeError("zstd 압축을 사용하려면 zstandard 패키지를 설치하세요.")
+
+    strings = {field: _Interner() for field, _ in STRING_FIELDS}
+    codes = _Interner()
+    ratings = _Interner()
+    columns = {}  # 과목 코드 번호 → 열 목록
+    count = 0
+    for position, review in enumerate(reviews):
+        code_id = codes(review["강의코드"])
+        block = columns.get(code_id)
+        if block is None:
+            block = columns[code_id] = {"position": [], "name": [], "professor": [], "semester": [],
+                                        "rating": [], "content": []}
+        block["position"].append(position)
+        for field, key in STRING_FIELDS:
+            block[field].append(strings[field](review[key]))
+        scores = review.get("평점") or {}
+        block["rating"].extend(ratings(scores[key]) + 1 if key in scores else 0 for key in RATING_KEYS)
+        block["content"].append(review["리뷰내용"].encode('utf-8'))
+        count += 1
+
+    blocks = []
+    payloads = []
+    offset = 0
+    for code_id, block in columns.items():
+        n = len(block["position"])
+        payload = b"".join([
+            struct.pack("<I", n),
+            _packed("I", block["position"]),
+            _packed("I", block["name"]),
+            _packed("I", block["professor"]),
+            _packed("I", block["semester"]),
+            _packed("H", block["rating"]),
+            _packed("I", [len(content) for content in block["content"]]),
+            b"".join(block["content"]),
+        ])
+        payload = _compress(payload, compression, level)
+        blocks.append({"code": code_id, "offset": offset, "length": len(payload), "count": n})
+        payloads.append(payload)
+        offset += len(payload)
+
+    header = json.dumps({
+        "version": 1,
+        "compression": compression,
+        "count": count,
+        "rating_keys": list(RATING_KEYS),
+        "strings": dict({field: strings[field].strings for field, _ in STRING_FIELDS},
+                        code=codes.strings, rating=ratings.strings),
+        "blocks": blocks,
+    }, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for payload in payloads:
+            f.write(payload)
+    os.replace(tmp_path, path)
+    return count
+
+
+class CompactReviewReader:
+    """
+    write_compact 로 저장한 리뷰 파일 리더
+
+    헤더만 먼저 읽고, 과목별 블록은 요청할 때 해당 부분만 읽어 압축을 푼다.
+
+    매개변수:
+        path (str): 압축 리뷰 파일 경로
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        if self.file.read(len(MAGIC)) != MAGIC:
+            self.file.close()
+            raise ValueError(f"압축 리뷰 파일 형식이 아닙니다: {path}")
+        (header_length,) = struct.unpack("<I", self.file.read(4))
+        self.header = json.loads(self.file.read(header_length).decode('utf-8'))
+        if self.header["compression"] == "zstd" and zstandard is None:
+            self.file.close()
+            raise RuntimeError("zstd로 압축된 파일을 읽으려면 zstandard 패키지를 설치하세요.")
+        self.body_offset = len(MAGIC) + 4 + header_length
+        self.strings = self.header["strings"]
+        self.blocks = {self.strings["code"][block["code"]]: block for block in self.header["blocks"]}
+
+    def __len__(self):
+        return self.header["count"]
+
+    def codes(self):
+        """파일에 들어 있는 과목 코드 목록"""
+        return list(self.blocks)
+
+    def review_count(self, course_code):
+        """과목 코드의 리뷰 수 (블록을 풀지 않고 헤더에서 반환)"""
+        block = self.blocks.get(course_code)
+        return block["count"] if block else 0
+
+    def _decode_block(self, course_code):
+        """과목 블록 하나를 (원래 순번, 리뷰 레코드) 목록으로 복원"""
+        block = self.blocks[course_code]
+        self.file.seek(self.body_offset + block["offset"])
+        data = _decompress(self.file.read(block["length"]), self.header["compression"])
+
+        (n,) = struct.unpack_from("<I", data, 0)
+        offset = 4
+        positions, offset = _unpacked("I", data, offset, n)
+        ids = {}
+        for field, _ in STRING_FIELDS:
+            ids[field], offset = _unpacked("I", data, offset, n)
+        rating_codes, offset = _unpacked("H", data, offset, n * len(RATING_KEYS))
+        lengths, offset = _unpacked("I", data, offset, n)
+
+        rating_values = self.strings["rating"]
+        records = []
+        for i in range(n):
+            content = data[offset:offset + lengths[i]].decode('utf-8')
+            offset += lengths[i]
+            scores = {}
+            for j, key in enumerate(RATING_KEYS):
+                value = rating_codes[i * len(RATING_KEYS) + j]
+                if value:
+                    scores[key] = rating_values[value - 1]
+            record = {
+                "강의명": self.strings["name"][ids["name"][i]],
+                "강의코드": course_code,
+                "교수명": self.strings["professor"][ids["professor"][i]],
+                "학기": self.strings["semester"][ids["semester"][i]],
+                "리뷰내용": content,
+                "평점": scores,
+            }
+            records.append((positions[i], record))
+        return records
+
+    def read_course(self, course_code):
+        """과목 코드 하나의 리뷰 목록 (해당 블록만 읽음)"""
+        if course_code not in self.blocks:
+            return []
+        return [record for _, record in self._decode_block(course_code)]
+
+    def iter_reviews(self, course_codes=None):
+        """
+        리뷰 레코드를 하나씩 반환
+
+        course_codes가 주어지면 해당 과목 블록만 블록 순서대로 읽고,
+        없으면 모든 블록을 풀어 원래 JSON 파일의 순서대로 반환한다.
+        """
+        if course_codes is not None:
+            for course_code in course_codes:
+                yield from self.read_course(course_code)
+            return
+        decoded = []
+        for course_code in self.blocks:
+            decoded.extend(self._decode_block(course_code))
+        decoded.sort(key=lambda item: item[0])
+        for _, record in decoded:
+            yield record
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def json_to_compact(json_path, compact_path, compression="gzip", level=None):
+    """reviewData.json (또는 JSONL)을 압축 리뷰 파일로 변환"""
+    count = write_compact(iter_records(json_path), compact_path, compression, level)
+    print(f"✅ 압축 변환 완료: {compact_path} (리뷰 {count}개, "
+          f"{os.path.getsize(json_path):,} → {os.path.getsize(compact_path):,} bytes)")
+    return count
+
+
+def compact_to_json(compact_path, json_path, indent=4):
+    """압축 리뷰 파일을 기존 reviewData.json 형식으로 복원"""
+    with CompactReviewReader(compact_path) as reader, open(json_path, 'w', encoding='utf-8') as f:
+        writer = JsonArrayWriter(f, indent=indent)
+        for record in reader.iter_reviews():
+            writer.write(record)
+        writer.close()
+        count = len(reader)
+    print(f"✅ JSON 복원 완료: {json_path} (리뷰 {count}개)")
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사전 인코딩된 압축 리뷰 파일 변환 도구")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("encode", help="reviewData.json → 압축 리뷰 파일")
+    p.add_argument("input")
+    p.add_argument("output")
+    p.add_argument("--compression", choices=COMPRESSIONS, default="gzip")
+    p.add_argument("--level", type=int)
+
+    p = commands.add_parser("decode", help="압축 리뷰 파일 → reviewData.json")
+    p.add_argument("input")
+    p.add_argument("output")
+
+    p = commands.add_parser("show", help="특정 과목의 리뷰 출력")
+    p.add_argument("input")
+    p.add_argument("course_codes", nargs="+")
+
+    args = parser.parse_args()
+    if args.command == "encode":
+        json_to_compact(args.input, args.output, args.compression, args.level)
+    elif args.command == "decode":
+        compact_to_json(args.input, args.output)
+    elif args.command == "show":
+        with CompactReviewReader(args.input) as reader:
+            for record in reader.iter_reviews(args.course_codes):
+                print(json.dumps(record, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
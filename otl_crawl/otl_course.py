@@ -1,211 +1,98 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementNotInteractableException, StaleElementReferenceException
 from selenium.webdriver.common.action_chains import ActionChains
-import json
+import argparse
 import time
 import os
 
-class OTLCourseScraper:
-    def __init__(self):
-        # Chrome 웹드라이버 설정
-        chrome_options = Options()
-        # 헤드리스 모드로 실행하려면 아래 주석을 해제하세요
-        # chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        
-        # Chrome 드라이버의 새 인스턴스 생성
-        self.driver = webdriver.Chrome(options=chrome_options)
+from otl_crawling import OTL_URL
+from otl_filters import FilterSelectionMixin
+from otl_journal import JsonlJournal
+from otl_state import CrawlStateStore
+from otl_wait import WaitEngine, detail_heading, in_viewport
+from otl_extract import extract_course_attributes, build_course_info
+from otl_metrics import CrawlMetrics, timed
+from otl_profiles import DEFAULT_PROFILE, create_driver, get_profile, remove_cache_directory
+from otl_watchdog import DriverWatchdog, DriverRestartMixin, driver_alive
+from otl_cursor import CourseCursor
+from otl_retry import RetryQueue, record_dead_letters, scrape_dead_letters
+from otl_rate import RateController
+from otl_capture import FailureCapture
+from otl_archive import PageArchive
+from otl_records import records_to_json
+
+class OTLCourseScraper(FilterSelectionMixin, DriverRestartMixin):
+    def __init__(self, headless=False, bulk_extract=True, state_path=None, prometheus=False, profile=DEFAULT_PROFILE,
+                 watchdog=None, rate=None, capture=None, archive=False, reset_state=False):
+        # 크롤링 프로필(debug / fast / minimal-memory)에 맞춰 Chrome 드라이버 생성
+        # 병렬 워커 등 화면이 필요 없는 경우 headless=True 로 헤드리스 모드로 실행
+        self.profile = profile
+        self.headless = headless
+        self.driver = create_driver(profile, headless)
+        # 브라우저 메모리 / 강의별 처리 시간을 감시하여 기준을 넘으면 드라이버를 재시작
+        self.watchdog = watchdog or DriverWatchdog(**get_profile(profile)["watchdog"])
+        self.watchdog.reset(self.driver)
+        self.base_url = OTL_URL  # 재시작 후 다시 접속할 주소
+        self.filters = None  # 재시작 후 다시 적용할 (강의 유형, 학과)
+        self.rate = rate or RateController()  # 상세 창 열기 요청 속도 (토큰 버킷 + AIMD)
+        # 오류 기록 수준 (off / text / dom / screenshot, 기본값: 프로필 설정)
+        self.capture = FailureCapture(capture or get_profile(profile)["capture"])
+        # archive=True 이면 상세 창 원본 HTML을 pageArchive.jsonl.gz 에 저장 (otl_reparse.py 로 재추출)
+        self.archive = PageArchive(source="course") if archive else None
         self.wait = WebDriverWait(self.driver, 15)  # 대기 시간 증가
-        self.courses_data = []  # 과목 데이터를 저장할 리스트
-        
-    def navigate_to_otl(self):
-        """OTL 웹사이트로 이동"""
-        self.driver.get("https://otl.sparcs.org/dictionary")
-        # 페이지가 완전히 로드될 때까지 기다림
-        time.sleep(5)
+        self.waits = WaitEngine(self.driver)  # 고정 sleep 대신 DOM 조건 대기
+        self.bulk_extract = bulk_extract  # 상세 창 정보를 스크립트 한 번으로 추출할지 여부
+        self.courses_data = []  # 과목 데이터(Course)를 저장할 리스트
+        self.saved_count = 0  # 저널에 이미 기록된 레코드 수
+        self.state = CrawlStateStore("course", state_path)  # 강의별 수집 상태 (done/failed 등)
+        if reset_state:
+            # 결과 파일을 지우고 다시 수집할 때 이전 수집 완료 기록을 지움 (남은 결과 파일로 다시 채워짐)
+            self.state.clear()
+        self.pending_done = []  # 수집했지만 아직 저널에 기록되지 않은 강의 키
+        self.metrics = CrawlMetrics("course", prometheus=prometheus)  # 단계별 소요 시간 / 카운터
         
-        # 페이지 로드 확인
-        try:
-            self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "_tabs__elem_zjyzb_333")))
-            print("OTL 웹사이트에 성공적으로 접속했습니다.")
-        except Exception as e:
-            print(f"웹사이트 로딩 중 오류: {e}")
-            self.driver.save_screenshot(os.path.join(os.getcwd(), "otl_crawl", "page_load_error.png"))
-        
-    def select_filters(self, course_types, departments):
+    @timed("navigate")
+    def navigate_to_otl(self, base_url=OTL_URL):
         """
-        원하는 강의 유형과 학과를 선택
-        
+        OTL 웹사이트로 이동
+
         매개변수:
-            course_types (list): 선택할 강의 유형 목록 (예: ["기필", "기선", "전필"])
-            departments (list): 선택할 학과 목록 (예: ["전산"])
+            base_url (str): OTL 주소 (otl_fixture.py 의 로컬 서버로 바꿔 벤치마크할 수 있음)
         """
+        self.base_url = base_url
+        self.driver.get(f"{base_url.rstrip('/')}/dictionary")
+        
+        # 페이지 로드 확인 (탭 요소가 나타날 때까지 대기)
         try:
-            # 검색 탭이 선택되어 있는지 확인
-            search_tab = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, '_tabs__elem_zjyzb_333') and .//span[text()='검색']]"))
-            )
-            if "selected" not in search_tab.get_attribute("class"):
-                self.driver.execute_script("arguments[0].click();", search_tab)
-                time.sleep(2)
-            
-            # 검색 영역이 보이는지 확인하고, 보이지 않으면 탭을 클릭
-            try:
-                search_area = self.driver.find_element(By.CLASS_NAME, "_search-area_zjyzb_2290")
-                if "hidden" in search_area.get_attribute("class"):
-                    print("검색 영역이 숨겨져 있습니다. 검색 탭을 다시 클릭합니다.")
-                    self.driver.execute_script("arguments[0].click();", search_tab)
-                    time.sleep(2)
-            except NoSuchElementException:
-                print("검색 영역 요소를 찾을 수 없습니다.")
-            
-            # 강의 유형 필터 설정
-            print("강의 유형 필터 설정 중...")
-            # 전체 체크박스 상태 확인 및 조정
-            type_all_checkbox = self.wait.until(
-                EC.presence_of_element_located((By.ID, "type-ALL"))
-            )
-            
-            if type_all_checkbox.is_selected():
-                # 전체 체크박스가 선택되어 있으면 클릭하여 해제
-                try:
-                    type_all_label = self.driver.find_element(By.XPATH, "//label[@for='type-ALL']")
-                    self.driver.execute_script("arguments[0].click();", type_all_label)
-                    print("전체 강의 유형 체크박스를 해제했습니다.")
-                    time.sleep(2)
-                except Exception as e:
-                    print(f"전체 강의 유형 체크박스 해제 중 오류: {e}")
-            
-            # 지정된 강의 유형 선택
-            type_mapping = {
-                "기필": "type-BR",
-                "기선": "type-BE",
-                "전필": "type-MR",
-                "전선": "type-ME",
-                "공통": "type-GR",
-                "석박": "type-EG",
-                "교필": "type-MGC",
-                "인선": "type-HSE",
-                "자선": "type-OE",
-                "기타": "type-ETC"
-            }
-            
-            for course_type in course_types:
-                if course_type in type_mapping:
-                    element_id = type_mapping[course_type]
-                    try:
-                        checkbox = self.driver.find_element(By.ID, element_id)
-                        label = self.driver.find_element(By.XPATH, f"//label[@for='{element_id}']")
-                        
-                        if not checkbox.is_selected():
-                            self.driver.execute_script("arguments[0].click();", label)
-                            print(f"강의 유형 선택: {course_type}")
-                            time.sleep(0.5)
-                        else:
-                            print(f"강의 유형 {course_type}은(는) 이미 선택되어 있습니다.")
-                    except Exception as e:
-                        print(f"강의 유형 '{course_type}' 선택 중 오류: {e}")
-            
-            # 학과 필터 설정
-            print("학과 필터 설정 중...")
-            # 전체 체크박스 상태 확인 및 조정
-            dept_all_checkbox = self.wait.until(
-                EC.presence_of_element_located((By.ID, "department-ALL"))
-            )
-            
-            if dept_all_checkbox.is_selected():
-                # 전체 체크박스가 선택되어 있으면 클릭하여 해제
-                try:
-                    dept_all_label = self.driver.find_element(By.XPATH, "//label[@for='department-ALL']")
-                    self.driver.execute_script("arguments[0].click();", dept_all_label)
-                    print("전체 학과 체크박스를 해제했습니다.")
-                    time.sleep(2)
-                except Exception as e:
-                    print(f"전체 학과 체크박스 해제 중 오류: {e}")
-            
-            # 지정된 학과 선택
-            dept_mapping = {
-                "인문": "department-HSS",
-                "건환": "department-CE",
-                "기경": "department-BTM",
-                "기계": "department-ME",
-                "뇌인지": "department-BCS",
-                "물리": "department-PH",
-                "바공": "department-BiS",
-                "반시공": "department-SS",
-                "산공": "department-IE",
-                "산디": "department-ID",
-                "생명": "department-BS",
-                "생화공": "department-CBE",
-                "수리": "department-MAS",
-                "신소재": "department-MS",
-                "원양": "department-NQE",
-                "융인": "department-TS",
-                "전산": "department-CS",
-                "전자": "department-EE",
-                "항공": "department-AE",
-                "화학": "department-CH",
-                "기타": "department-ETC"
-            }
-            
-            for department in departments:
-                if department in dept_mapping:
-                    element_id = dept_mapping[department]
-                    try:
-                        checkbox = self.driver.find_element(By.ID, element_id)
-                        label = self.driver.find_element(By.XPATH, f"//label[@for='{element_id}']")
-                        
-                        if not checkbox.is_selected():
-                            self.driver.execute_script("arguments[0].click();", label)
-                            print(f"학과 선택: {department}")
-                            time.sleep(0.5)
-                        else:
-                            print(f"학과 {department}은(는) 이미 선택되어 있습니다.")
-                    except Exception as e:
-                        print(f"학과 '{department}' 선택 중 오류: {e}")
-            
-            # 검색 버튼 클릭하여 필터 적용
-            search_button = self.driver.find_element(By.XPATH, "//button[@type='submit' and text()='검색']")
-            self.driver.execute_script("arguments[0].click();", search_button)
-            print("검색 버튼을 클릭하였습니다")
-            time.sleep(5)  # 검색 결과 로딩을 위한 대기 시간
-            
-            # 결과가 있는지 확인
-            try:
-                no_results = self.driver.find_elements(By.CLASS_NAME, "_list-placeholder_zjyzb_2887")
-                if no_results and "결과 없음" in no_results[0].text:
-                    print("검색 결과가 없습니다. 다른 필터를 시도해보세요.")
-                    return False
-                return True
-            except Exception as e:
-                print(f"결과 확인 중 오류: {e}")
-                return True  # 오류 시에도 계속 진행
-                
+            if self.waits.wait("navigate", EC.presence_of_element_located((By.CLASS_NAME, "_tabs__elem_zjyzb_333"))) is None:
+                raise TimeoutException("탭 요소가 나타나지 않았습니다.")
+            print("OTL 웹사이트에 성공적으로 접속했습니다.")
         except Exception as e:
-            print(f"필터 선택 중 오류 발생: {e}")
-            # 디버깅을 위한 스크린샷 저장
-            otl_crawl_path = os.path.join(os.getcwd(), "otl_crawl")
-            if not os.path.exists(otl_crawl_path):
-                os.makedirs(otl_crawl_path)
-            self.driver.save_screenshot(os.path.join(otl_crawl_path, "filter_error.png"))
-            return False
+            print(f"웹사이트 로딩 중 오류: {e}")
+            self.capture.capture(self.driver, "page_load_error", e, url=self.base_url)
         
-    def scrape_courses(self, save_interval=5, filename="coursesData.json"):
+    def scrape_courses(self, save_interval=5, filename="coursesData.json", worker_index=0, worker_count=1, exclude_keys=None,
+                       claim=None, only_keys=None, max_attempts=3):
         """
         선택한 필터에 따라 모든 강의 정보를 스크래핑
         
+        목록을 끝까지 처리했으면 True, 오류로 중간에 멈췄으면 False를 반환한다.
+        
         매개변수:
             save_interval (int): 몇 개의 강의마다 JSON 파일에 저장할지 지정
             filename (str): 저장할 JSON 파일 이름
+            worker_index (int): 병렬 모드에서 이 워커의 번호 (0부터 시작)
+            worker_count (int): 병렬 모드의 전체 워커 수 (1이면 모든 강의 처리)
+            exclude_keys (set): 다른 파일에서 이미 수집되어 건너뛸 강의 키 목록
+            claim (callable): 목록 제목을 받아 이 실행이 맡을 강의인지 반환하는 함수
+                              (여러 검색 조합에 겹쳐 나오는 강의를 한 번만 수집, otl_schedule.py 참고)
+            only_keys (set): 이 강의 키(목록 제목)만 방문 (실패 목록 재수집, otl_retry.py 참고)
+            max_attempts (int): 강의 하나의 최대 시도 횟수 (넘으면 실패 목록 파일에 기록)
         """
+        cursor = None
+        resolved = set()  # 수집에 성공했거나 이미 수집 완료인 강의의 목록 제목 (실패 목록에서 지움)
         try:
             # 기존 파일이 있으면 데이터 로드
             otl_crawl_path = os.path.join(os.getcwd(), "otl_crawl")
@@ -214,69 +101,92 @@ class OTLCourseScraper:
                 
             full_path = os.path.join(otl_crawl_path, filename)
             
-            if os.path.exists(full_path):
-                try:
-                    with open(full_path, 'r', encoding='utf-8') as f:
-                        self.courses_data = json.load(f)
-                    print(f"기존 파일에서 {len(self.courses_data)}개의 과목 정보를 로드했습니다.")
-                except Exception as e:
-                    print(f"기존 파일 로드 중 오류: {e}")
-                    self.courses_data = []
+            # 상태 저장소를 처음 사용하면 기존 결과 파일의 강의를 수집 완료로 가져옴
+            # (이후에는 결과 파일 전체를 메모리에 올리지 않고 강의 키 단위로 조회)
+            self.state.seed_if_empty(lambda: [record["과목코드"] for record in JsonlJournal(full_path).load()])
+            self.courses_data = []  # 이번 실행에서 새로 수집한 데이터만 보관
+            self.saved_count = 0
             
-            # 이미 수집한 과목 목록 생성 (과목코드 기준)
-            crawled_courses = set()
-            for course in self.courses_data:
-                crawled_courses.add(course["과목코드"])
+            # 다른 파일에서 이미 수집되어 건너뛸 강의 키
+            exclude_keys = set(exclude_keys or ())
             
-            print(f"이미 {len(crawled_courses)}개의 과목 정보를 수집했습니다.")
+            print(f"이미 {self.state.counts().get('done', 0)}개의 과목 정보를 수집했습니다.")
             
-            # 페이지가 완전히 로드될 때까지 기다림
-            time.sleep(5)
+            # 강의 목록이 모두 렌더링될 때까지 기다림
+            self.waits.wait_for_results()
             
-            # 모든 강의 블록 찾기
-            course_blocks = self.driver.find_elements(By.CLASS_NAME, "_block--course_zjyzb_1737")
-            if not course_blocks:
+            # 모든 강의 키를 한 번에 수집해 두고, 강의마다 키로 블록을 찾음
+            # 실패한 강의는 목록을 다 돈 뒤 지수 백오프로 max_attempts번까지 다시 방문
+            cursor = CourseCursor(self.driver, self.waits, retries=RetryQueue(max_attempts))
+            if not cursor.snapshot():
                 print("강의를 찾을 수 없습니다. 필터를 확인하세요.")
-                return
+                return True
                 
-            print(f"총 {len(course_blocks)}개의 강의를 찾았습니다")
+            print(f"총 {len(cursor.keys)}개의 강의를 찾았습니다")
+            # 병렬 모드에서는 강의 키 해시로 이 워커에 배정된 강의만 처리
+            cursor.shard(worker_index, worker_count)
+            if only_keys is not None:
+                cursor.restrict(only_keys)
+            self.metrics.set_gauge("courses_listed", len(cursor.keys))
+            self.metrics.start_progress()
             
             # 마지막 저장 이후 처리한 강의 수 카운터
             courses_since_last_save = 0
             
-            for i, course_block in enumerate(course_blocks):
+            # 상세 창 제목 변화를 감지하기 위해 현재 열려 있는 강의를 기록
+            last_heading = detail_heading(self.driver)
+            
+            for i, list_title in cursor:
+                course_started = time.perf_counter()
                 try:
-                    print(f"강의 처리 중 {i+1}/{len(course_blocks)}")
+                    print(f"강의 처리 중 {i+1}/{len(cursor.keys)} (남은 강의 {cursor.remaining}개)")
                     
-                    # 스크롤하여 요소를 화면에 표시
-                    self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", course_block)
-                    time.sleep(1)  # 스크롤 완료 대기
+                    # 코드 추출 (목록 제목에서 코드 부분 추출)
+                    course_pre_code = list_title.split()[-1] if len(list_title.split()) > 1 else "Unknown"
                     
-                    # 강의 제목과 코드 미리 가져오기 (디버깅 목적)
-                    try:
-                        title_elem = course_block.find_element(By.CLASS_NAME, "_block--course__title_zjyzb_1743")
-                        course_pre_title = title_elem.text.strip()
-                        # 코드 추출 (제목에서 코드 부분 추출)
-                        course_pre_code = course_pre_title.split()[-1] if len(course_pre_title.split()) > 1 else "Unknown"
-                        print(f"클릭할 강의: {course_pre_title}")
-                        
-                        # 이미 크롤링한 과목인지 확인
-                        if course_pre_code in crawled_courses:
-                            print(f"이미 수집한 과목입니다: {course_pre_code}. 건너뜁니다.")
-                            continue
-                    except Exception:
-                        course_pre_title = "알 수 없음"
+                    # 이미 크롤링한 과목이면 블록을 찾지 않고 건너뜀
+                    if course_pre_code in exclude_keys or self.state.is_done(course_pre_code):
+                        print(f"이미 수집한 과목입니다: {course_pre_code}. 건너뜁니다.")
+                        self.metrics.incr("courses_skipped")
+                        resolved.add(list_title)
+                        self.metrics.progress(cursor.position, len(cursor))
+                        continue
+                    
+                    # 다른 검색 조합에서 이미 맡은 강의는 상세 창을 열지 않고 건너뜀
+                    if claim is not None and not claim(list_title):
+                        print(f"다른 검색 조합에서 처리하는 강의입니다: {list_title}. 건너뜁니다.")
+                        self.metrics.incr("courses_skipped")
+                        self.metrics.progress(cursor.position, len(cursor))
+                        continue
+                    
+                    # 키로 강의 블록을 찾아 화면에 표시
+                    with self.metrics.phase("scroll"):
+                        course_block = cursor.locate(i)
+                        if course_block is None:
+                            raise NoSuchElementException(f"강의 블록을 찾을 수 없습니다: {list_title}")
+                        self.waits.wait("scroll", in_viewport(course_block))  # 스크롤 완료 대기
+                    print(f"클릭할 강의: {list_title}")
                     
-                    # JavaScript를 사용하여 강의를 클릭하여 상세 정보 보기
+                    # 요청 속도 제한: 상세 창을 열 때마다 토큰 하나를 사용
+                    with self.metrics.phase("throttle"):
+                        self.rate.acquire()
+                    
+                    # 이전 강의의 리뷰 블록을 기억해 두고 JavaScript를 사용하여 강의를 클릭하여 상세 정보 보기
+                    self.waits.snapshot_reviews()
                     self.driver.execute_script("arguments[0].click();", course_block)
-                    time.sleep(3)  # 강의 상세 정보 로딩을 위한 대기 시간
                     
                     # 강의 정보 추출
+                    course_key = None
                     try:
-                        # 상세 정보 창이 로드되었는지 확인
-                        detail_section = self.wait.until(
-                            EC.presence_of_element_located((By.CLASS_NAME, "_section--course-detail_zjyzb_637"))
-                        )
+                        # 상세 창 제목이 클릭한 강의로 바뀔 때까지 대기
+                        modal_started = time.perf_counter()
+                        with self.metrics.phase("modal_open"):
+                            detail_section = self.waits.wait_for_modal(last_heading)
+                        # 상세 창 로드 시간과 시간 초과 여부로 요청 속도 조절
+                        self.rate.record(time.perf_counter() - modal_started, error=detail_section is None)
+                        self.rate.publish(self.metrics)
+                        if detail_section is None:
+                            raise TimeoutException("강의 상세 정보가 로드되지 않았습니다.")
                         
                         # 강의명과 코드 추출
                         course_title_elem = detail_section.find_element(By.CLASS_NAME, "_title_zjyzb_1296")
@@ -284,46 +194,44 @@ class OTLCourseScraper:
                         
                         course_code_elem = detail_section.find_element(By.CLASS_NAME, "_subtitle_zjyzb_2133")
                         course_code = course_code_elem.text.strip()
+                        last_heading = (course_title, course_code)
                         
                         print(f"강의명: {course_title}, 코드: {course_code}")
                         
                         # 이미 크롤링한 과목인지 확인
-                        if course_code in crawled_courses:
+                        course_key = course_code
+                        if course_code in exclude_keys or self.state.is_done(course_code):
                             print(f"이미 수집한 과목입니다: {course_title} ({course_code}). 건너뜁니다.")
+                            self.metrics.incr("courses_skipped")
+                            resolved.add(list_title)
                         else:
-                            # 강의 상세 정보 추출
-                            course_info = {
-                                "과목명": course_title,
-                                "과목코드": course_code,
-                                "학과": "",    # 분류를 학과와 구분으로 분리
-                                "구분": "",
-                                "설명": ""
-                            }
+                            self.state.mark_started(course_code)
                             
-                            info_divs = detail_section.find_elements(By.CLASS_NAME, "_attribute--long-info_zjyzb_2482")
+                            # 강의 상세 정보 추출
+                            with self.metrics.phase("extract"):
+                                if self.bulk_extract:
+                                    # 모든 속성을 스크립트 한 번으로 (라벨, 값) 목록으로 가져옴
+                                    attributes = extract_course_attributes(self.driver, detail_section)
+                                else:
+                                    attributes = []
+                                    info_divs = detail_section.find_elements(By.CLASS_NAME, "_attribute--long-info_zjyzb_2482")
+                                    for div in info_divs:
+                                        label_elems = div.find_elements(By.TAG_NAME, "div")
+                                        if len(label_elems) >= 2:
+                                            attributes.append((label_elems[0].text.strip(), label_elems[1].text.strip()))
                             
-                            for div in info_divs:
-                                label_elems = div.find_elements(By.TAG_NAME, "div")
-                                if len(label_elems) >= 2:
-                                    label = label_elems[0].text.strip()
-                                    value = label_elems[1].text.strip()
-                                    
-                                    if label == "분류":
-                                        # 분류 값을 학과와 구분으로 분리
-                                        if "," in value:
-                                            parts = value.split(",", 1)  # 첫 번째 콤마에서만 분리
-                                            course_info["학과"] = parts[0].strip()
-                                            course_info["구분"] = parts[1].strip()
-                                        else:
-                                            course_info["학과"] = value
-                                    elif label == "설명":
-                                        course_info["설명"] = value
+                            course_info = build_course_info(course_title, course_code, attributes)
+                            if self.archive is not None:
+                                self.archive.add(self.driver, course_title, course_code)
                             
                             # 과목 데이터 추가
                             self.courses_data.append(course_info)
+                            self.metrics.incr("courses_processed")
+                            self.metrics.incr("records_extracted")
                             
-                            # 크롤링한 과목 목록에 추가
-                            crawled_courses.add(course_code)
+                            # 다음 체크포인트에서 수집 완료로 기록
+                            self.pending_done.append(course_code)
+                            resolved.add(list_title)
                             
                             # 처리한 강의 수 증가
                             courses_since_last_save += 1
@@ -336,93 +244,150 @@ class OTLCourseScraper:
                         
                         # ESC 키를 사용하여 모달 닫기
                         try:
-                            ActionChains(self.driver).send_keys(u'\ue00c').perform()
-                            time.sleep(2)  # 창이 닫히는 것을 기다림
+                            with self.metrics.phase("modal_close"):
+                                ActionChains(self.driver).send_keys(u'\ue00c').perform()
+                                self.waits.wait_for_modal_closed()  # 창이 닫히는 것을 기다림
                         except Exception as e:
                             print(f"ESC 키 사용 중 오류: {e}")
                         
                     except Exception as e:
                         print(f"강의 정보 추출 중 오류: {e}")
+                        self.metrics.incr("courses_failed")
+                        if course_key is not None:
+                            self.state.mark_failed(course_key, e)
+                        cursor.retry(i, e)
                         # ESC 키를 눌러 모달 닫기 시도
                         try:
                             ActionChains(self.driver).send_keys(u'\ue00c').perform()
-                            time.sleep(2)
+                            self.waits.wait_for_modal_closed()
                         except:
                             print("ESC 키를 사용한 창 닫기 실패")
                     
-                    # 강의 블록 목록 갱신
-                    course_blocks = self.driver.find_elements(By.CLASS_NAME, "_block--course_zjyzb_1737")
+                    self.watchdog.record(time.perf_counter() - course_started)
+                    self.metrics.progress(cursor.position, len(cursor))
                     
                 except StaleElementReferenceException:
-                    print("요소가 오래되었습니다. 강의 목록을 다시 가져옵니다.")
-                    course_blocks = self.driver.find_elements(By.CLASS_NAME, "_block--course_zjyzb_1737")
+                    # 목록이 다시 렌더링된 경우: 강의를 목록 끝에서 한 번 더 방문
+                    print("요소가 오래되었습니다. 이 강의는 목록 끝에서 다시 찾습니다.")
+                    if not cursor.requeue(i):
+                        cursor.retry(i, "강의 목록이 반복해서 다시 렌더링됨")
                 except Exception as e:
                     print(f"강의 처리 중 오류 발생: {e}")
-                    # 디버깅을 위한 스크린샷 저장
-                    otl_crawl_path = os.path.join(os.getcwd(), "otl_crawl")
-                    if not os.path.exists(otl_crawl_path):
-                        os.makedirs(otl_crawl_path)
-                    self.driver.save_screenshot(os.path.join(otl_crawl_path, f"course_error_{i}.png"))
+                    self.metrics.incr("courses_failed")
+                    cursor.retry(i, e)
+                    # 브라우저가 종료되었으면 스크린샷/복구 대신 드라이버 재시작 요청
+                    if not driver_alive(self.driver):
+                        self.watchdog.request_restart(f"브라우저 응답 없음: {e}")
+                    else:
+                        # 디버깅을 위한 실패 기록 저장 (같은 오류는 한 번만)
+                        self.capture.capture(self.driver, "course_error", e, index=i, course=list_title)
                     
-                    # 오류 발생 시 페이지 상태 복구 시도
-                    try:
-                        # ESC 키를 눌러 모달 닫기 시도
-                        ActionChains(self.driver).send_keys(u'\ue00c').perform()
-                        time.sleep(2)
-                        
-                        # 강의 목록 다시 가져오기
-                        course_blocks = self.driver.find_elements(By.CLASS_NAME, "_block--course_zjyzb_1737")
-                    except:
-                        print("페이지 상태 복구 실패")
+                        # 오류 발생 시 페이지 상태 복구 시도
+                        try:
+                            # ESC 키를 눌러 모달 닫기 시도
+                            ActionChains(self.driver).send_keys(u'\ue00c').perform()
+                            self.waits.wait_for_modal_closed()
+                        except:
+                            print("페이지 상태 복구 실패")
+                
+                # 메모리 / 처리 시간 기준을 넘었거나 브라우저가 종료되었으면 드라이버를 재시작하고 다음 강의부터 계속
+                reason = self.watchdog.check()
+                if self.watchdog.last_rss:
+                    self.metrics.set_gauge("browser_rss_mb", round(self.watchdog.last_rss / (1 << 20)))
+                if reason:
+                    if courses_since_last_save > 0:
+                        self.save_to_json(filename)
+                        courses_since_last_save = 0
+                    self.restart_driver(reason)
+                    cursor.driver = self.driver  # 같은 강의 키 목록으로 다음 강의부터 계속
+                    last_heading = detail_heading(self.driver)
             
             # 마지막 저장 후 처리된 강의가 있으면 저장
             if courses_since_last_save > 0:
                 self.save_to_json(filename)
                 print(f"남은 {courses_since_last_save}개 과목 처리 후 데이터 저장 완료. 총 {len(self.courses_data)}개 과목 저장됨.")
+            
+            # 저널을 최종 JSON 배열 파일로 합침
+            self.compact_json(filename)
+            
+            # 단계별 실제 대기 시간 요약
+            self.waits.print_summary()
+            self.metrics.progress(cursor.position, len(cursor), force=True)
+            return True
         
         except Exception as e:
             print(f"강의 스크래핑 중 오류 발생: {e}")
-            # 디버깅을 위한 스크린샷 저장
-            otl_crawl_path = os.path.join(os.getcwd(), "otl_crawl")
-            if not os.path.exists(otl_crawl_path):
-                os.makedirs(otl_crawl_path)
-            self.driver.save_screenshot(os.path.join(otl_crawl_path, "scrape_courses_error.png"))
+            # 디버깅을 위한 실패 기록 저장
+            self.capture.capture(self.driver, "scrape_courses_error", e)
             
             # 오류 발생해도 지금까지 수집한 데이터 저장
-            if self.courses_data:
-                self.save_to_json(filename)
-                print(f"오류 발생으로 중단. 현재까지 수집된 {len(self.courses_data)}개 과목 저장됨.")
+            self.save_to_json(filename)
+            print(f"오류 발생으로 중단. 현재까지 수집된 {len(self.courses_data)}개 과목 저장됨.")
+            self.compact_json(filename)
+            return False
+        finally:
+            # 끝내 실패한 강의는 --only-failed 실행이 다시 방문할 수 있도록 실패 목록에 기록
+            if cursor is not None:
+                self.metrics.set_gauge("dead_letters", record_dead_letters(filename, cursor, resolved, self.filters))
+            # 단계별 소요 시간 / 카운터 실행 보고서 저장
+            self.capture.publish(self.metrics)
+            self.metrics.export(filename, self.waits.summary())
 
+    @timed("save")
     def save_to_json(self, filename="coursesData.json"):
-        """수집한 데이터를 JSON 파일로 저장"""
+        """마지막 저장 이후 수집한 데이터만 JSONL 저널에 추가 (체크포인트)"""
         try:
-            # otl_crawl 폴더에 저장
-            otl_crawl_path = os.path.join(os.getcwd(), "otl_crawl")
-            
-            # otl_crawl 폴더가 없으면 생성
-            if not os.path.exists(otl_crawl_path):
-                os.makedirs(otl_crawl_path)
-                print(f"otl_crawl 폴더를 생성했습니다: {otl_crawl_path}")
-            
-            full_path = os.path.join(otl_crawl_path, filename)
-            
-            with open(full_path, 'w', encoding='utf-8') as f:
-                json.dump(self.courses_data, f, ensure_ascii=False, indent=4)
-            print(f"데이터가 {full_path}에 저장되었습니다. 총 {len(self.courses_data)}개의 과목이 저장되었습니다.")
+            full_path = os.path.join(os.getcwd(), "otl_crawl", filename)
+            new_records = self.courses_data[self.saved_count:]
+            JsonlJournal(full_path).append(records_to_json(new_records))
+            self.saved_count = len(self.courses_data)
+            if self.archive is not None:
+                self.archive.flush()
+            # 저널에 기록된 뒤에만 수집 완료로 표시하여 중단 시 누락이 없도록 함
+            self.state.mark_done(self.pending_done)
+            self.pending_done = []
+            print(f"{len(new_records)}개의 과목을 저널에 추가했습니다. 총 {len(self.courses_data)}개의 과목이 저장되었습니다.")
         except Exception as e:
             print(f"JSON 저장 중 오류 발생: {e}")
     
+    @timed("compact")
+    def compact_json(self, filename="coursesData.json"):
+        """저널을 기존 JSON 파일과 합쳐 프론트엔드용 JSON 배열 파일로 저장"""
+        try:
+            full_path = os.path.join(os.getcwd(), "otl_crawl", filename)
+            count = JsonlJournal(full_path).compact()
+            if count is not None:
+                print(f"데이터가 {full_path}에 저장되었습니다. 총 {count}개의 과목이 저장되었습니다.")
+        except Exception as e:
+            print(f"JSON 병합 중 오류 발생: {e}")
+    
     def close(self):
-        """웹드라이버 종료"""
+        """웹드라이버 및 상태 저장소 종료 (드라이버 디스크 캐시도 삭제)"""
         self.driver.quit()
+        remove_cache_directory(self.profile)
+        self.state.close()
 
 def main():
-    scraper = OTLCourseScraper()
+    parser = argparse.ArgumentParser(description="OTL 과목 정보 스크래퍼")
+    parser.add_argument("--only-failed", action="store_true",
+                        help="이전 실행에서 끝내 실패한 강의(coursesData.failed.jsonl)만 다시 수집")
+    parser.add_argument("--reset-state", action="store_true",
+                        help="crawlState.db 의 수집 완료 기록을 지우고 남아 있는 결과 파일 기준으로 다시 수집")
+    args = parser.parse_args()
+    scraper = OTLCourseScraper(reset_state=args.reset_state)
     
     try:
+        # 결과 파일을 지웠는데 수집 완료 기록이 남아 있으면 --reset-state 안내
+        scraper.state.warn_if_results_missing(JsonlJournal(os.path.join(os.getcwd(), "otl_crawl", "coursesData.json")).exists())
+        
         # OTL 웹사이트로 이동
         scraper.navigate_to_otl()
         
+        if args.only_failed:
+            # 실패 목록에 기록된 검색 필터를 다시 적용하고 해당 강의만 방문
+            scrape_dead_letters(scraper, "coursesData.json", save_interval=5, filename="coursesData.json")
+            return
+        
         # 필터 설정
         course_types = ["인선"]
         departments = ["전체"]
@@ -442,15 +407,8 @@ def main():
         
     except Exception as e:
         print(f"오류 발생: {e}")
-        # 디버깅을 위한 스크린샷 저장
-        try:
-            # otl_crawl 폴더에 스크린샷 저장
-            otl_crawl_path = os.path.join(os.getcwd(), "otl_crawl")
-            if not os.path.exists(otl_crawl_path):
-                os.makedirs(otl_crawl_path)
-            scraper.driver.save_screenshot(os.path.join(otl_crawl_path, "error.png"))
-        except:
-            pass
+        # 디버깅을 위한 실패 기록 저장
+        scraper.capture.capture(scraper.driver, "error", e)
     
     finally:
         scraper.close()
@@ -0,0 +1,188 @@
+import zlib
+
+from otl_wait import COURSE_BLOCK
+
+COURSE_TITLE_CLASS = "_block--course__title_zjyzb_1743"
+
+# 현재 렌더링된 강의 블록의 제목("강의명 코드") 목록을 반환하고, 요청하면 마지막 블록으로 스크롤
+# (지연 로딩 목록은 스크롤하면 다음 강의가 추가되고, 가상화 목록은 보이는 범위가 바뀜)
+_TITLES_SCRIPT = f"""
+const blocks = document.getElementsByClassName('{COURSE_BLOCK[1]}');
+const titles = [];
+for (const block of blocks) {{
+    const title = block.getElementsByClassName('{COURSE_TITLE_CLASS}')[0];
+    titles.push(title ? title.innerText.trim() : '');
+}}
+if (arguments[0] && blocks.length) blocks[blocks.length - 1].scrollIntoView({{block: 'end'}});
+return titles;
+"""
+
+# 제목이 key인 occurrence번째 강의 블록을 찾아 화면 가운데로 스크롤하고 반환
+# 렌더링된 범위에 없으면 스크롤 방향을 정할 수 있도록 [null, 제목 목록]을 반환
+_LOCATE_SCRIPT = f"""
+const [key, occurrence] = arguments;
+const blocks = document.getElementsByClassName('{COURSE_BLOCK[1]}');
+const titles = [];
+const matches = [];
+for (const block of blocks) {{
+    const title = block.getElementsByClassName('{COURSE_TITLE_CLASS}')[0];
+    const text = title ? title.innerText.trim() : '';
+    titles.push(text);
+    if (text === key) matches.push(block);
+}}
+if (!matches.length) return [null, titles];
+const block = matches[Math.min(occurrence, matches.length - 1)];
+block.scrollIntoView({{block: 'center'}});
+return [block, null];
+"""
+
+# 렌더링된 첫 블록(위로) 또는 마지막 블록(아래로)으로 스크롤
+_SCROLL_SCRIPT = f"""
+const blocks = document.getElementsByClassName('{COURSE_BLOCK[1]}');
+if (!blocks.length) return;
+if (arguments[0]) blocks[blocks.length - 1].scrollIntoView({{block: 'end'}});
+else blocks[0].scrollIntoView({{block: 'start'}});
+"""
+
+
+def shard_of(key, worker_count):
+    """강의 키를 병렬 워커 번호로 변환 (모든 워커가 같은 결과를 얻도록 crc32 사용)"""
+    return zlib.crc32(key.encode("utf-8")) % worker_count
+
+
+class CourseCursor:
+    """
+    강의 목록을 처음에 한 번 강의 키(목록 제목) 목록으로 고정하고, 강의마다 키로 블록을 찾는 커서
+
+    매 강의마다 모든 강의 블록을 다시 조회하던 방식(O(n²))과 달리 스크립트 호출 한 번으로
+    필요한 블록만 찾으므로 순회가 선형이고, 목록이 다시 렌더링되어도 순서가 바뀌거나
+    같은 강의를 두 번 방문하지 않는다. 지연 로딩/가상화된 목록은 스크롤하며 키를 모으고,
+    화면에 없는 블록은 스크롤하여 찾는다. 드라이버를 재시작한 뒤에도 driver만 바꾸면 이어서 순회할 수 있다.
+
+    매개변수:
+        driver: Selenium 웹드라이버
+        waits (WaitEngine): 스크롤 후 목록 변화를 기다릴 대기 계층
+        settle_timeout (float): 스크롤 후 새 강의가 나타나기를 기다리는 최대 시간(초)
+        max_scrolls (int): 목록 수집 / 블록 찾기에 사용할 최대 스크롤 횟수
+        retries (RetryQueue): 실패한 강의를 목록 끝에서 백오프 후 다시 방문할 대기열
+    """
+
+    def __init__(self, driver, waits, settle_timeout=0.5, max_scrolls=200, retries=None):
+        self.driver = driver
+        self.waits = waits
+        self.settle_timeout = settle_timeout
+        self.max_scrolls = max_scrolls
+        self.retries = retries
+        self.keys = []  # 목록 순서대로의 강의 키
+        self.order = []  # 방문할 강의 순번 (병렬 모드 배정, 재시도 포함)
+        self.position = 0  # order 에서 다음에 방문할 위치
+        self._first_index = {}  # 강의 키 -> 처음 등장한 순번
+        self._occurrence = []  # 순번 -> 같은 키 중 몇 번째인지
+        self._requeued = set()
+
+    def _titles(self, scroll=False):
+        return self.driver.execute_script(_TITLES_SCRIPT, scroll)
+
+    def _changed(self, previous):
+        """스크롤 후 렌더링된 제목 목록이 previous와 달라질 때까지 대기 (변화가 없으면 None)"""
+        def condition(driver):
+            titles = self._titles()
+            return titles if titles != previous else False
+        return self.waits.wait("scroll", condition, timeout=self.settle_timeout)
+
+    def snapshot(self):
+        """
+        현재 검색 결과의 모든 강의 키를 목록 순서대로 수집
+
+        목록이 한 번에 모두 렌더링되어 있으면 스크립트 한 번으로 끝나고,
+        마지막 블록으로 스크롤했을 때 새 강의가 나타나면 더 이상 늘지 않을 때까지 반복한다.
+        """
+        window = self._titles(scroll=True)
+        keys = list(window)
+        for _ in range(self.max_scrolls):
+            changed = self._changed(window)
+            if changed is None:
+                break
+            window = changed
+            # 이전 목록의 마지막 강의 뒤에 새로 나타난 강의만 추가 (가상화 목록은 앞부분이 사라짐)
+            last = keys[-1] if keys else None
+            start = len(window) - window[::-1].index(last) if last in window else 0
+            keys.extend(window[start:])
+            self._titles(scroll=True)
+
+        self.keys = keys
+        self.order = list(range(len(keys)))
+        self.position = 0
+        self._first_index = {}
+        self._occurrence = []
+        counts = {}
+        for index, key in enumerate(keys):
+            self._first_index.setdefault(key, index)
+            self._occurrence.append(counts.get(key, 0))
+            counts[key] = counts.get(key, 0) + 1
+        self._requeued = set()
+        return keys
+
+    def shard(self, worker_index, worker_count):
+        """병렬 모드에서 이 워커에 배정된 강의만 방문하도록 제한"""
+        if worker_count > 1:
+            self.order = [index for index in self.order if shard_of(self.keys[index], worker_count) == worker_index]
+
+    def restrict(self, keys):
+        """지정한 강의 키만 방문하도록 제한 (--only-failed 실행)"""
+        keys = set(keys)
+        self.order = [index for index in self.order if self.keys[index] in keys]
+
+    def __len__(self):
+        """방문할 전체 강의 수 (재시도 포함)"""
+        return len(self.order)
+
+    @property
+    def remaining(self):
+        """아직 방문하지 않은 강의 수"""
+        return len(self.order) - self.position
+
+    def __iter__(self):
+        """(목록 순번, 강의 키)를 차례로 반환 (목록을 다 돌면 재시도 대기열의 강의를 이어서 반환)"""
+        while True:
+            while self.position < len(self.order):
+                index = self.order[self.position]
+                self.position += 1
+                yield index, self.keys[index]
+            index = self.retries.next_due() if self.retries is not None else None
+            if index is None:
+                return
+            self.order.append(index)
+
+    def retry(self, index, error):
+        """실패한 강의를 재시도 대기열에 넣음 (재시도 대기열이 없거나 최대 시도 횟수를 넘으면 False)"""
+        if self.retries is None:
+            return False
+        return self.retries.fail(index, self.keys[index], error)
+
+    def requeue(self, index):
+        """블록이 중간에 다시 렌더링되어 처리하지 못한 강의를 목록 끝에 한 번만 다시 추가"""
+        if index in self._requeued:
+            return False
+        self._requeued.add(index)
+        self.order.append(index)
+        return True
+
+    def locate(self, index):
+        """
+        목록 순번의 강의 블록을 찾아 화면 가운데로 스크롤하고 반환 (찾지 못하면 None)
+
+        렌더링된 범위에 없으면 렌더링된 강의들의 순번과 비교해 위/아래로 스크롤하며 다시 찾는다.
+        """
+        key = self.keys[index]
+        for _ in range(self.max_scrolls):
+            block, titles = self.driver.execute_script(_LOCATE_SCRIPT, key, self._occurrence[index])
+            if block is not None:
+                return block
+            rendered = [self._first_index[title] for title in titles if title in self._first_index]
+            if not rendered:
+                return None
+            self.driver.execute_script(_SCROLL_SCRIPT, max(rendered) < index)
+            if self._changed(titles) is None:
+                return None
+        return None
@@ -0,0 +1,115 @@
+# 상세 창의 리뷰/과목 정보를 한 번의 execute_script 호출로 추출하는 스크립트 모음
+#
+# 요소마다 find_element / .text 를 호출하면 리뷰 하나에 8~10번 chromedriver와 통신한다.
+# 아래 스크립트는 브라우저 안에서 모든 요소를 직렬화하여 JSON 배열 하나로 돌려준다.
+# innerText는 Selenium의 .text와 같은 렌더링 텍스트를 반환한다.
+
+from otl_records import Review, Ratings, Course
+
+# arguments[0]: 이전 강의에서 남은 리뷰 블록 (WaitEngine.stale_reviews, 추출하지 않음)
+REVIEW_EXTRACT_SCRIPT = """
+const text = (el) => (el ? el.innerText.trim() : null);
+const stale = arguments[0] || [];
+return Array.from(document.getElementsByClassName('block--review')).filter((block) => !stale.includes(block)).map((block) => {
+    const title = block.querySelector('._block--review__title_zjyzb_1807');
+    const content = block.querySelector('._block--review__content_zjyzb_1814');
+    if (!title || !content) {
+        return null;
+    }
+    const spans = title.querySelectorAll(':scope > span');
+    return {
+        professor: spans.length >= 2 ? text(spans[0]) : null,
+        semester: spans.length >= 2 ? text(spans[1]) : null,
+        content: text(content),
+        scores: Array.from(block.querySelectorAll('._block--review__menus__score_zjyzb_1834')).map(text),
+    };
+});
+"""
+
+COURSE_INFO_EXTRACT_SCRIPT = """
+const section = arguments[0];
+return Array.from(section.querySelectorAll('._attribute--long-info_zjyzb_2482')).map((attr) => {
+    const divs = attr.getElementsByTagName('div');
+    return divs.length >= 2 ? [divs[0].innerText.trim(), divs[1].innerText.trim()] : null;
+}).filter((pair) => pair !== null);
+"""
+
+
+def parse_ratings(score_texts):
+    """'추천 3', '성적 A' 같은 평점 텍스트 목록을 평점 딕셔너리로 변환"""
+    ratings = {}
+    for rating_text in score_texts:
+        if not rating_text:
+            continue
+        if "추천" in rating_text:
+            ratings["recommendation"] = rating_text.split()[-1]
+        elif "성적" in rating_text:
+            ratings["grade"] = rating_text.split()[-1]
+        elif "널널" in rating_text:
+            ratings["workload"] = rating_text.split()[-1]
+        elif "강의" in rating_text:
+            ratings["teaching"] = rating_text.split()[-1]
+    return ratings
+
+
+def extract_reviews(driver, course_title, course_code, stale=()):
+    """
+    현재 상세 창의 모든 리뷰를 한 번의 스크립트 호출로 추출
+
+    반환값은 OTLScraper.scrape_reviews가 만드는 Review 목록과 같다.
+    stale(이전 강의에서 남은 리뷰 블록, WaitEngine.stale_reviews)은 추출하지 않는다.
+    """
+    reviews = []
+    for raw in driver.execute_script(REVIEW_EXTRACT_SCRIPT, list(stale)) or []:
+        if raw is None:
+            print("리뷰 처리 중 오류 발생: 리뷰 제목 또는 내용 요소가 없습니다.")
+            continue
+        reviews.append(Review(
+            course_title,
+            course_code,
+            raw["professor"] if raw["professor"] is not None else "알 수 없음",
+            raw["semester"] if raw["semester"] is not None else "알 수 없음",
+            raw["content"],
+            Ratings.from_json(parse_ratings(raw["scores"])),
+        ))
+    return reviews
+
+
+def build_course_info(course_title, course_code, attributes):
+    """상세 창의 (라벨, 값) 속성 목록으로 coursesData.json 의 과목 레코드(Course) 생성"""
+    department = category = description = ""  # 분류를 학과와 구분으로 분리
+    for label, value in attributes:
+        if label == "분류":
+            # 분류 값을 학과와 구분으로 분리
+            if "," in value:
+                parts = value.split(",", 1)  # 첫 번째 콤마에서만 분리
+                department = parts[0].strip()
+                category = parts[1].strip()
+            else:
+                department = value
+        elif label == "설명":
+            description = value
+    return Course(course_title, course_code, department, category, description)
+
+
+def extract_course_attributes(driver, detail_section):
+    """상세 창의 (라벨, 값) 속성 목록을 한 번의 스크립트 호출로 추출"""
+    return [tuple(pair) for pair in driver.execute_script(COURSE_INFO_EXTRACT_SCRIPT, detail_section) or []]
+
+
+REVIEW_SUMMARY_SCRIPT = """
+const stale = arguments[0] || [];
+const blocks = Array.from(document.getElementsByClassName('block--review')).filter((block) => !stale.includes(block));
+return {
+    count: blocks.length,
+    semesters: blocks.map((block) => {
+        const span = block.querySelector('._block--review__title_zjyzb_1807 > span:nth-of-type(2)');
+        return span ? span.innerText.trim() : null;
+    }).filter((semester) => semester),
+};
+"""
+
+
+def review_summary(driver, stale=()):
+    """현재 상세 창의 리뷰 개수와 학기 목록을 리뷰 본문 없이 한 번에 가져옴 (stale 블록 제외)"""
+    return driver.execute_script(REVIEW_SUMMARY_SCRIPT, list(stale)) or {"count": 0, "semesters": []}
@@ -0,0 +1,155 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException
+
+from otl_metrics import timed
+
+# 강의 유형 / 학과 필터에서 "전체" 체크박스를 뜻하는 이름 (매핑에는 없음)
+ALL_OPTION = "전체"
+
+# 강의 유형 / 학과 이름과 검색 필터 체크박스 ID 매핑
+TYPE_MAPPING = {
+    "기필": "type-BR",
+    "기선": "type-BE",
+    "전필": "type-MR",
+    "전선": "type-ME",
+    "공통": "type-GR",
+    "석박": "type-EG",
+    "교필": "type-MGC",
+    "인선": "type-HSE",
+    "자선": "type-OE",
+    "기타": "type-ETC"
+}
+
+DEPT_MAPPING = {
+    "인문": "department-HSS",
+    "건환": "department-CE",
+    "기경": "department-BTM",
+    "기계": "department-ME",
+    "뇌인지": "department-BCS",
+    "물리": "department-PH",
+    "바공": "department-BiS",
+    "반시공": "department-SS",
+    "산공": "department-IE",
+    "산디": "department-ID",
+    "생명": "department-BS",
+    "생화공": "department-CBE",
+    "수리": "department-MAS",
+    "신소재": "department-MS",
+    "원양": "department-NQE",
+    "융인": "department-TS",
+    "전산": "department-CS",
+    "전자": "department-EE",
+    "항공": "department-AE",
+    "화학": "department-CH",
+    "기타": "department-ETC"
+}
+
+
+class FilterSelectionMixin:
+    """
+    OTLScraper / OTLCourseScraper 공용 검색 필터 선택
+
+    사용하는 클래스는 driver, wait, waits, capture, filters 속성을 가져야 한다.
+    """
+
+    def _set_filter_group(self, prefix, mapping, names, label):
+        """
+        필터 그룹(강의 유형 / 학과)의 체크박스 선택 상태를 names 와 같게 맞춤
+        
+        names 에 "전체"가 있으면 전체 체크박스만 선택한다. 그렇지 않으면 전체를 해제하고
+        names 의 항목을 선택하며, 같은 페이지에서 이전 검색 조합으로 선택했던 나머지 항목은 해제한다.
+        현재 선택 상태는 스크립트 한 번으로 읽고 바꿔야 하는 체크박스만 클릭한다.
+        
+        매개변수:
+            prefix (str): 체크박스 ID 접두사 ("type" 또는 "department")
+            mapping (dict): 이름과 체크박스 ID 매핑 (TYPE_MAPPING / DEPT_MAPPING)
+            names (list): 선택할 이름 목록
+            label (str): 로그에 표시할 그룹 이름
+        """
+        for name in names:
+            if name != ALL_OPTION and name not in mapping:
+                print(f"알 수 없는 {label}입니다: {name}")
+        checked = set(self.driver.execute_script(
+            "return Array.from(document.querySelectorAll(`input[id^='${arguments[0]}-']:checked`)).map((input) => input.id);",
+            prefix,
+        ))
+        select_all = ALL_OPTION in names
+        wanted = {f"{prefix}-ALL"} if select_all else {mapping[name] for name in names if name in mapping}
+        
+        # 전체 체크박스를 먼저 맞춘 뒤 개별 항목을 맞춤
+        targets = [(f"{prefix}-ALL", ALL_OPTION)] + [(element_id, name) for name, element_id in mapping.items()]
+        for element_id, name in targets:
+            if element_id != f"{prefix}-ALL" and select_all:
+                break  # 전체를 선택하면 개별 항목은 건드리지 않음
+            should_select = element_id in wanted
+            if (element_id in checked) == should_select:
+                if should_select and element_id != f"{prefix}-ALL":
+                    print(f"{label} {name}은(는) 이미 선택되어 있습니다.")
+                continue
+            try:
+                checkbox = self.driver.find_element(By.ID, element_id)
+                label_elem = self.driver.find_element(By.XPATH, f"//label[@for='{element_id}']")
+                self.driver.execute_script("arguments[0].click();", label_elem)
+                print(f"{label} {'선택' if should_select else '해제'}: {name}")
+                self.waits.wait("filter", EC.element_selection_state_to_be(checkbox, should_select))
+            except Exception as e:
+                print(f"{label} '{name}' {'선택' if should_select else '해제'} 중 오류: {e}")
+    
+    @timed("select_filters")
+    def select_filters(self, course_types, departments):
+        """
+        원하는 강의 유형과 학과를 선택
+        
+        매개변수:
+            course_types (list): 선택할 강의 유형 목록 (예: ["기필", "기선", "전필"], 모두 선택하려면 ["전체"])
+            departments (list): 선택할 학과 목록 (예: ["전산"], 모두 선택하려면 ["전체"])
+        """
+        self.filters = (list(course_types), list(departments))
+        try:
+            # 검색 탭이 선택되어 있는지 확인
+            search_tab = self.wait.until(
+                EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, '_tabs__elem_zjyzb_333') and .//span[text()='검색']]"))
+            )
+            if "selected" not in search_tab.get_attribute("class"):
+                self.driver.execute_script("arguments[0].click();", search_tab)
+                self.waits.wait("filter", lambda d: "selected" in search_tab.get_attribute("class"))
+            
+            # 검색 영역이 보이는지 확인하고, 보이지 않으면 탭을 클릭
+            try:
+                search_area = self.driver.find_element(By.CLASS_NAME, "_search-area_zjyzb_2290")
+                if "hidden" in search_area.get_attribute("class"):
+                    print("검색 영역이 숨겨져 있습니다. 검색 탭을 다시 클릭합니다.")
+                    self.driver.execute_script("arguments[0].click();", search_tab)
+                    self.waits.wait("filter", lambda d: "hidden" not in search_area.get_attribute("class"))
+            except NoSuchElementException:
+                print("검색 영역 요소를 찾을 수 없습니다.")
+            
+            # 강의 유형 / 학과 필터 설정 (이전 검색에서 선택한 항목은 해제)
+            print("강의 유형 필터 설정 중...")
+            self._set_filter_group("type", TYPE_MAPPING, course_types, "강의 유형")
+            print("학과 필터 설정 중...")
+            self._set_filter_group("department", DEPT_MAPPING, departments, "학과")
+            
+            # 검색 버튼 클릭하여 필터 적용
+            search_button = self.driver.find_element(By.XPATH, "//button[@type='submit' and text()='검색']")
+            self.driver.execute_script("arguments[0].click();", search_button)
+            print("검색 버튼을 클릭하였습니다")
+            self.waits.wait_for_results()  # 검색 결과 목록이 안정될 때까지 대기
+            
+            # 결과가 있는지 확인
+            try:
+                no_results = self.driver.find_elements(By.CLASS_NAME, "_list-placeholder_zjyzb_2887")
+                if no_results and "결과 없음" in no_results[0].text:
+                    print("검색 결과가 없습니다. 다른 필터를 시도해보세요.")
+                    return False
+                return True
+            except Exception as e:
+                print(f"결과 확인 중 오류: {e}")
+                return True  # 오류 시에도 계속 진행
+                
+        except Exception as e:
+            print(f"필터 선택 중 오류 발생: {e}")
+            # 디버깅을 위한 실패 기록 저장
+            self.capture.capture(self.driver, "filter_error", e, course_types=course_types, departments=departments)
+            return False
@@ -0,0 +1,368 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import argparse
+import html
+import json
+import random
+import threading
+import time
+
+from otl_crawling import TYPE_MAPPING, DEPT_MAPPING
+
+# 로컬 OTL 대체 서버
+#
+# /dictionary 페이지는 스크래퍼가 의존하는 DOM 구조(해시 클래스 이름, type-* / department-* 체크박스,
+# 강의 블록, 상세 창, 리뷰 블록)를 그대로 만들고, 데이터는 OTL과 같은 형식의 JSON API에서 가져온다.
+# 같은 API를 OTLApiScraper(base_url)도 사용할 수 있다.
+
+TYPE_NAMES = {
+    "BR": "기초필수", "BE": "기초선택", "MR": "전공필수", "ME": "전공선택", "GR": "공통필수",
+    "EG": "석박사과목", "MGC": "교양필수", "HSE": "인문사회선택", "OE": "자유선택", "ETC": "기타",
+}
+
+DEPARTMENT_NAMES = {
+    "HSS": "인문사회과학부", "CE": "건설및환경공학과", "BTM": "기술경영학부", "ME": "기계공학과",
+    "BCS": "뇌인지과학과", "PH": "물리학과", "BiS": "바이오및뇌공학과", "SS": "반도체시스템공학과",
+    "IE": "산업및시스템공학과", "ID": "산업디자인학과", "BS": "생명과학과", "CBE": "생명화학공학과",
+    "MAS": "수리과학과", "MS": "신소재공학과", "NQE": "원자력및양자공학과", "TS": "융합인재학부",
+    "CS": "전산학부", "EE": "전기및전자공학부", "AE": "항공우주공학과", "CH": "화학과", "ETC": "기타",
+}
+
+PROFESSORS = ["김민수", "이서연", "박지훈", "최유진", "정하늘", "강도윤", "조수아", "윤태양"]
+REVIEW_SENTENCES = [
+    "과제가 많지만 배우는 것이 많습니다.", "시험 범위가 넓어서 미리 준비해야 합니다.",
+    "교수님 설명이 친절하고 자료가 잘 정리되어 있습니다.", "출석 체크가 엄격합니다.",
+    "팀 프로젝트 비중이 큽니다.", "성적은 후하게 주시는 편입니다.", "수업 난이도가 꽤 높습니다.",
+]
+
+
+def _code(element_id):
+    return element_id.split("-", 1)[1]
+
+
+def build_catalog(course_count=200, reviews_per_course=10, seed=0):
+    """
+    OTL API 형식의 가상 과목 / 리뷰 데이터 생성
+
+    과목 유형은 TYPE_MAPPING 순서대로 돌아가며 배정하여 모든 유형에 과목이 있도록 한다.
+    반환값: (과목 목록, {과목 id: 리뷰 목록})
+    """
+    rng = random.Random(seed)
+    type_codes = [_code(element_id) for element_id in TYPE_MAPPING.values()]
+    dept_codes = [_code(element_id) for element_id in DEPT_MAPPING.values()]
+    courses = []
+    reviews = {}
+    for i in range(course_count):
+        course_id = i + 1
+        type_code = type_codes[i % len(type_codes)]
+        dept_code = rng.choice(dept_codes)
+        courses.append({
+            "id": course_id,
+            "title": f"{DEPARTMENT_NAMES[dept_code][:2]}세미나 {course_id}",
+            "new_code": f"{dept_code}.{rng.randint(1, 4)}{course_id:04d}",
+            "old_code": f"{dept_code}{course_id:03d}",
+            "department": {"name": DEPARTMENT_NAMES[dept_code], "code": dept_code},
+            "type": TYPE_NAMES[type_code],
+            "type_en": type_code,
+            "summary": " ".join(rng.sample(REVIEW_SENTENCES, 3)),
+        })
+        reviews[course_id] = [
+            {
+                "id": course_id * 10000 + j,
+                "content": " ".join(rng.sample(REVIEW_SENTENCES, rng.randint(1, 4))),
+                "like": rng.randint(0, 20),
+                "grade": rng.randint(1, 5),
+                "load": rng.randint(1, 5),
+                "speech": rng.randint(1, 5),
+                "lecture": {
+                    "year": rng.randint(2018, 2024),
+                    "semester": rng.choice([1, 3]),
+                    "professors": [{"name": rng.choice(PROFESSORS)}],
+                },
+                "is_deleted": False,
+            }
+            for j in range(reviews_per_course)
+        ]
+    return courses, reviews
+
+
+def _checkboxes(prefix, mapping):
+    items = [f'<input type="checkbox" id="{prefix}-ALL" checked><label for="{prefix}-ALL">전체</label>']
+    for label, element_id in mapping.items():
+        items.append(f'<input type="checkbox" id="{html.escape(element_id)}">'
+                     f'<label for="{html.escape(element_id)}">{html.escape(label)}</label>')
+    return "\n    ".join(items)
+
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>OTL fixture</title>
+<style>
+  body { margin: 0; font-family: sans-serif; }
+  ._search-area_zjyzb_2290.hidden { display: none; }
+  #course-list { width: 55%%; }
+  ._block--course_zjyzb_1737 { height: 64px; padding: 8px; border-bottom: 1px solid #ddd; cursor: pointer; }
+  ._section--course-detail_zjyzb_637 { position: fixed; top: 0; right: 0; width: 40%%; height: 100%%;
+    overflow: auto; background: #fff; border-left: 1px solid #999; }
+  .block--review { padding: 6px 0; border-bottom: 1px solid #eee; }
+</style>
+</head>
+<body>
+<div class="_tabs_zjyzb_320">
+  <div class="_tabs__elem_zjyzb_333 selected" id="tab-search"><span>검색</span></div>
+  <div class="_tabs__elem_zjyzb_333"><span>장바구니</span></div>
+</div>
+<form class="_search-area_zjyzb_2290" id="search-form">
+  <div class="filter-type">
+    %(types)s
+  </div>
+  <div class="filter-department">
+    %(departments)s
+  </div>
+  <button type="submit">검색</button>
+</form>
+<div id="course-list"></div>
+<script>
+const REVIEW_BATCH = %(review_batch)d;
+const SCORE_LETTERS = ["?", "F", "D", "C", "B", "A"];
+const SEMESTER_NAMES = {1: "봄", 2: "여름", 3: "가을", 4: "겨울"};
+let openRequest = 0;
+
+const el = (tag, className, text) => {
+  const node = document.createElement(tag);
+  if (className) node.className = className;
+  if (text !== undefined) node.textContent = text;
+  return node;
+};
+
+const checkedCodes = (prefix) => {
+  const all = document.getElementById(prefix + "-ALL");
+  const codes = Array.from(document.querySelectorAll(`input[id^="${prefix}-"]:checked`))
+    .map((input) => input.id.slice(prefix.length + 1)).filter((code) => code !== "ALL");
+  return all.checked || codes.length === 0 ? ["ALL"] : codes;
+};
+
+document.getElementById("search-form").addEventListener("submit", async (event) => {
+  event.preventDefault();
+  const params = new URLSearchParams();
+  checkedCodes("type").forEach((code) => params.append("type", code));
+  checkedCodes("department").forEach((code) => params.append("department", code));
+  const list = document.getElementById("course-list");
+  list.replaceChildren();
+  const courses = await (await fetch("/api/courses?" + params)).json();
+  if (courses.length === 0) {
+    list.appendChild(el("div", "_list-placeholder_zjyzb_2887", "결과 없음"));
+    return;
+  }
+  courses.forEach((course) => {
+    const block = el("div", "_block--course_zjyzb_1737");
+    const title = el("div", "_block--course__title_zjyzb_1743");
+    title.appendChild(el("strong", "", course.title));
+    title.appendChild(document.createTextNode(" "));
+    title.appendChild(el("span", "", course.new_code));
+    block.appendChild(title);
+    block.appendChild(el("div", "_block--course__subtitle_zjyzb_1750", course.department.name));
+    block.addEventListener("click", () => openCourse(course.id));
+    list.appendChild(block);
+  });
+});
+
+async function openCourse(courseId) {
+  const request = ++openRequest;
+  // 실제 페이지처럼 상세 정보를 먼저 표시하고 리뷰는 응답이 오면 채움
+  const reviewsRequest = fetch(`/api/courses/${courseId}/reviews?offset=0&limit=1000`).then((r) => r.json());
+  const course = await fetch(`/api/courses/${courseId}`).then((r) => r.json());
+  if (request !== openRequest) return;
+
+  closeCourse();
+  const section = el("div", "_section--course-detail_zjyzb_637");
+  section.appendChild(el("div", "_title_zjyzb_1296", course.title));
+  section.appendChild(el("div", "_subtitle_zjyzb_2133", course.new_code));
+  [["분류", `${course.department.name}, ${course.type}`], ["설명", course.summary]].forEach(([label, value]) => {
+    const attr = el("div", "_attribute--long-info_zjyzb_2482");
+    attr.appendChild(el("div", "", label));
+    attr.appendChild(el("div", "", value));
+    section.appendChild(attr);
+  });
+  const reviewList = el("div", "_section--review-list_zjyzb_700");
+  const placeholder = el("div", "_list-placeholder_zjyzb_2887", "불러오는 중");
+  reviewList.appendChild(placeholder);
+  section.appendChild(reviewList);
+  document.body.appendChild(section);
+
+  const reviews = await reviewsRequest;
+  if (request !== openRequest) return;
+  if (reviews.length === 0) {
+    placeholder.textContent = "결과 없음";
+    return;
+  }
+  placeholder.remove();
+
+  // 실제 페이지처럼 리뷰를 여러 번에 나누어 렌더링
+  for (let start = 0; start < reviews.length; start += REVIEW_BATCH) {
+    if (request !== openRequest) return;
+    reviews.slice(start, start + REVIEW_BATCH).forEach((review) => reviewList.appendChild(renderReview(review)));
+    await new Promise((resolve) => setTimeout(resolve, 20));
+  }
+}
+
+function renderReview(review) {
+  const block = el("div", "block--review");
+  const title = el("div", "_block--review__title_zjyzb_1807");
+  title.appendChild(el("span", "", review.lecture.professors.map((p) => p.name).join(", ")));
+  title.appendChild(el("span", "", `${review.lecture.year} ${SEMESTER_NAMES[review.lecture.semester]}`));
+  block.appendChild(title);
+  block.appendChild(el("div", "_block--review__content_zjyzb_1814", review.content));
+  const menus = el("div", "_block--review__menus_zjyzb_1830");
+  [["추천", review.like], ["성적", SCORE_LETTERS[review.grade]], ["널널", SCORE_LETTERS[review.load]],
+   ["강의", SCORE_LETTERS[review.speech]]].forEach(([label, value]) => {
+    menus.appendChild(el("span", "_block--review__menus__score_zjyzb_1834", `${label} ${value}`));
+  });
+  block.appendChild(menus);
+  return block;
+}
+
+function closeCourse() {
+  document.querySelectorAll("._section--course-detail_zjyzb_637").forEach((section) => section.remove());
+}
+
+document.addEventListener("keydown", (event) => {
+  if (event.key === "Escape") {
+    openRequest++;
+    closeCourse();
+  }
+});
+</script>
+</body>
+</html>
+"""
+
+
+class FixtureServer:
+    """
+    로컬 OTL 대체 서버
+
+    매개변수:
+        course_count (int): 과목 수
+        reviews_per_course (int): 과목마다 리뷰 수
+        latency (float): API 응답마다 추가할 지연 시간(초)
+        review_batch (int): 상세 창에서 한 번에 렌더링할 리뷰 수
+        seed (int): 데이터 생성 시드
+        host (str), port (int): 바인딩 주소 (port=0 이면 빈 포트 자동 선택)
+    """
+
+    def __init__(self, course_count=200, reviews_per_course=10, latency=0.05, review_batch=5, seed=0,
+                 host="127.0.0.1", port=0):
+        self.courses, self.reviews = build_catalog(course_count, reviews_per_course, seed)
+        self.course_index = {course["id"]: course for course in self.courses}
+        self.latency = latency
+        self.request_count = 0
+        self.page = (PAGE_TEMPLATE % {
+            "types": _checkboxes("type", TYPE_MAPPING),
+            "departments": _checkboxes("department", DEPT_MAPPING),
+            "review_batch": review_batch,
+        }).encode('utf-8')
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def search(self, types, departments):
+        """유형 / 학과 필터 (ALL 이 포함되면 해당 조건 제한 없음)"""
+        return [
+            course for course in self.courses
+            if ("ALL" in types or course["type_en"] in types)
+            and ("ALL" in departments or course["department"]["code"] in departments)
+        ]
+
+    def _handler(self):
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status, body, content_type="application/json; charset=utf-8"):
+                if not isinstance(body, bytes):
+                    body = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                fixture.request_count += 1
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                parts = [part for part in url.path.split("/") if part]
+
+                if parts == ["dictionary"]:
+                    self._send(200, fixture.page, "text/html; charset=utf-8")
+                    return
+                if fixture.latency:
+                    time.sleep(fixture.latency)
+                if parts == ["api", "courses"]:
+                    self._send(200, fixture.search(query.get("type", ["ALL"]), query.get("department", ["ALL"])))
+                elif len(parts) >= 3 and parts[:2] == ["api", "courses"] and parts[2].isdigit():
+                    course_id = int(parts[2])
+                    if course_id not in fixture.course_index:
+                        self._send(404, {"error": "not found"})
+                    elif len(parts) == 3:
+                        self._send(200, fixture.course_index[course_id])
+                    elif parts[3:] == ["reviews"]:
+                        offset = int(query.get("offset", ["0"])[0])
+                        limit = int(query.get("limit", ["100"])[0])
+                        self._send(200, fixture.reviews[course_id][offset:offset + limit])
+                    else:
+                        self._send(404, {"error": "not found"})
+                else:
+                    self._send(404, {"error": "not found"})
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 OTL 대체 서버")
+    parser.add_argument("--courses", type=int, default=200)
+    parser.add_argument("--reviews", type=int, default=10, help="과목마다 리뷰 수")
+    parser.add_argument("--latency", type=float, default=50, help="API 응답 지연(ms)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--port", type=int, default=8800)
+    args = parser.parse_args()
+
+    server = FixtureServer(args.courses, args.reviews, args.latency / 1000, seed=args.seed, port=args.port)
+    print(f"로컬 OTL 서버가 {server.url}/dictionary 에서 실행 중입니다. (과목 {args.courses}개)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import hashlib
+
+# 학기 표기("2023 봄")의 계절 순서
+SEASON_ORDER = {"봄": 1, "여름": 2, "가을": 3, "겨울": 4}
+
+
+def _fingerprint(professor, semester, content):
+    source = "\x1f".join((professor, semester, content))
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+
+def review_fingerprint(review):
+    """교수명 + 학기 + 리뷰내용으로 리뷰(Review)를 구분하는 지문 생성"""
+    return _fingerprint(review.professor, review.semester, review.content)
+
+
+def semester_rank(semester):
+    """학기 문자열을 비교 가능한 (연도, 계절) 튜플로 변환 (형식이 다르면 (0, 0))"""
+    parts = (semester or "").split()
+    if len(parts) != 2 or not parts[0].isdigit():
+        return (0, 0)
+    return (int(parts[0]), SEASON_ORDER.get(parts[1], 0))
+
+
+def newest_semester(semesters):
+    """학기 목록 중 가장 최근 학기 반환 (목록이 비어 있으면 None)"""
+    semesters = [s for s in semesters if s]
+    if not semesters:
+        return None
+    return max(semesters, key=semester_rank)
+
+
+def summarize_reviews(reviews):
+    """
+    reviewData.json 레코드를 강의 키별로 묶어 리뷰 지문, 리뷰 수, 최신 학기를 모음
+
+    반환값: {강의 키: (지문 목록, 리뷰 수, 최신 학기)}
+    """
+    grouped = {}
+    for review in reviews:
+        course_key = f"{review['강의명']}_{review['강의코드']}"
+        grouped.setdefault(course_key, []).append(review)
+    return {
+        course_key: (
+            [_fingerprint(r["교수명"], r["학기"], r["리뷰내용"]) for r in items],
+            len(items),
+            newest_semester([r["학기"] for r in items]),
+        )
+        for course_key, items in grouped.items()
+    }
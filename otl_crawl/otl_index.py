@@ -0,0 +1,398 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import argparse
+import json
+import os
+import re
+import threading
+import time
+
+import numpy as np
+
+from json_convert import iter_records
+from otl_chunk import build_chunks
+
+# 인덱스 폴더 안의 파일 이름
+META_FILE = "meta.json"
+DOCS_FILE = "docs.jsonl"
+ARRAY_FILES = ("doc_offsets", "idf", "postings_indptr", "postings_docs", "postings_weights",
+               "doc_vectors", "components")
+
+NGRAM_RANGE = (2, 3)
+
+
+def char_ngrams(text, ngram_range=NGRAM_RANGE):
+    """
+    단어 경계를 공백으로 감싼 문자 n-gram 목록 생성
+
+    한국어 리뷰는 조사/어미 변화가 많아 단어 단위보다 문자 2~3-gram이 검색에 잘 맞는다.
+    """
+    grams = []
+    low, high = ngram_range
+    for word in re.findall(r"\w+", text.lower()):
+        padded = f" {word} "
+        for n in range(low, high + 1):
+            grams.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return grams
+
+
+def _term_counts(text, vocabulary=None):
+    counts = {}
+    for gram in char_ngrams(text):
+        if vocabulary is not None:
+            gram = vocabulary.get(gram)
+            if gram is None:
+                continue
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+def _weighted_vector(counts, idf):
+    """(특성 번호 → 빈도)를 정규화된 sublinear TF-IDF (특성 번호, 가중치) 배열로 변환"""
+    if not counts:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+    features = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+    tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+    weights = (1.0 + np.log(tf)) * idf[features]
+    norm = np.linalg.norm(weights)
+    if norm > 0:
+        weights /= norm
+    order = np.argsort(features)
+    return features[order], weights[order].astype(np.float32)
+
+
+def _sparse_matmul(indptr, indices, data, dense, block=4096):
+    """CSR 형식 희소 행렬(indptr, indices, data)과 밀집 행렬의 곱을 행 블록 단위로 계산"""
+    rows = len(indptr) - 1
+    out = np.zeros((rows, dense.shape[1]), dtype=np.float32)
+    for start in range(0, rows, block):
+        end = min(start + block, rows)
+        lo, hi = indptr[start], indptr[end]
+        if lo == hi:
+            continue
+        contrib = data[lo:hi, None] * dense[indices[lo:hi]]
+        lengths = np.diff(indptr[start:end + 1])
+        nonempty = lengths > 0
+        out[start:end][nonempty] = np.add.reduceat(contrib, (indptr[start:end] - lo)[nonempty], axis=0)
+    return out
+
+
+def _reduce_dimensions(csr, csc, dims, seed=0, oversample=10, power_iterations=2):
+    """
+    무작위 SVD(LSA)로 문서-특성 TF-IDF 행렬을 dims 차원으로 축소
+
+    반환값: (문서 벡터 [문서 수 x dims], 특성 → 축소 공간 사영 행렬 [특성 수 x dims])
+    """
+    doc_count = len(csr[0]) - 1
+    feature_count = len(csc[0]) - 1
+    k = min(dims + oversample, doc_count, feature_count)
+    rng = np.random.default_rng(seed)
+
+    q, _ = np.linalg.qr(_sparse_matmul(*csr, rng.standard_normal((feature_count, k)).astype(np.float32)))
+    for _ in range(power_iterations):
+        z, _ = np.linalg.qr(_sparse_matmul(*csc, q))
+        q, _ = np.linalg.qr(_sparse_matmul(*csr, z))
+    b = _sparse_matmul(*csc, q).T  # (k x 특성 수)
+    ub, s, vt = np.linalg.svd(b, full_matrices=False)
+    dims = min(dims, len(s))
+    doc_vectors = (q @ ub[:, :dims]) * s[:dims]
+    norms = np.linalg.norm(doc_vectors, axis=1, keepdims=True)
+    doc_vectors /= np.where(norms > 0, norms, 1)
+    return doc_vectors.astype(np.float32), vt[:dims].T.astype(np.float32)
+
+
+def build_index(documents, index_dir, min_df=2, max_features=100000, dims=None):
+    """
+    {"text", "metadata"} 문서 목록으로 로컬 검색 인덱스를 만들어 index_dir에 저장
+
+    매개변수:
+        documents (iterable): 검색 대상 문서 (예: otl_chunk.build_chunks 결과)
+        index_dir (str): 인덱스를 저장할 폴더
+        min_df (int): 이보다 적은 문서에 등장한 n-gram은 버림
+        max_features (int): 문서 빈도가 높은 순으로 유지할 최대 n-gram 수
+        dims (int): 지정하면 LSA로 차원을 축소한 밀집 벡터도 저장
+
+    모든 배열은 .npy 로 저장되어 LocalIndex가 mmap으로 열 수 있다.
+    """
+    os.makedirs(index_dir, exist_ok=True)
+    started = time.time()
+
+    # 1단계: 문서를 docs.jsonl에 기록하면서 n-gram 문서 빈도 집계
+    offsets = []
+    document_frequency = {}
+    with open(os.path.join(index_dir, DOCS_FILE), 'wb') as f:
+        for document in documents:
+            offsets.append(f.tell())
+            f.write(json.dumps(document, ensure_ascii=False).encode('utf-8') + b"\n")
+            for gram in set(char_ngrams(document["text"])):
+                document_frequency[gram] = document_frequency.get(gram, 0) + 1
+    doc_count = len(offsets)
+    if not doc_count:
+        raise ValueError("인덱스에 넣을 문서가 없습니다.")
+
+    terms = [gram for gram, df in document_frequency.items() if df >= min_df]
+    terms.sort(key=lambda gram: (-document_frequency[gram], gram))
+    terms = terms[:max_features]
+    vocabulary = {gram: i for i, gram in enumerate(terms)}
+    df = np.array([document_frequency[gram] for gram in terms], dtype=np.float32)
+    idf = (np.log((1 + doc_count) / (1 + df)) + 1).astype(np.float32)
+    del document_frequency
+
+    # 2단계: 문서별 TF-IDF 벡터(CSR) 계산
+    indptr = [0]
+    feature_blocks = []
+    weight_blocks = []
+    with open(os.path.join(index_dir, DOCS_FILE), 'r', encoding='utf-8') as f:
+        for line in f:
+            features, weights = _weighted_vector(_term_counts(json.loads(line)["text"], vocabulary), idf)
+            feature_blocks.append(features)
+            weight_blocks.append(weights)
+            indptr.append(indptr[-1] + len(features))
+    csr_indptr = np.array(indptr, dtype=np.int64)
+    csr_features = np.concatenate(feature_blocks) if feature_blocks else np.zeros(0, dtype=np.int32)
+    csr_weights = np.concatenate(weight_blocks) if weight_blocks else np.zeros(0, dtype=np.float32)
+    del feature_blocks, weight_blocks
+
+    # 특성 → 문서 역색인(CSC): 질의의 n-gram이 등장한 문서만 점수를 계산한다
+    doc_ids = np.repeat(np.arange(doc_count, dtype=np.int32), np.diff(csr_indptr))
+    order = np.argsort(csr_features, kind="stable")
+    postings_indptr = np.zeros(len(terms) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(csr_features, minlength=len(terms)), out=postings_indptr[1:])
+    arrays = {
+        "doc_offsets": np.array(offsets, dtype=np.int64),
+        "idf": idf,
+        "postings_indptr": postings_indptr,
+        "postings_docs": doc_ids[order],
+        "postings_weights": csr_weights[order],
+    }
+
+    if dims:
+        csr = (csr_indptr, csr_features, csr_weights)
+        csc = (postings_indptr, arrays["postings_docs"], arrays["postings_weights"])
+        arrays["doc_vectors"], arrays["components"] = _reduce_dimensions(csr, csc, dims)
+
+    for name, array in arrays.items():
+        np.save(os.path.join(index_dir, f"{name}.npy"), array)
+    for name in ARRAY_FILES:
+        if name not in arrays and os.path.exists(os.path.join(index_dir, f"{name}.npy")):
+            os.remove(os.path.join(index_dir, f"{name}.npy"))
+
+    meta = {
+        "documents": doc_count,
+        "features": len(terms),
+        "ngram_range": list(NGRAM_RANGE),
+        "dims": int(arrays["doc_vectors"].shape[1]) if dims else None,
+        "vocabulary": terms,
+    }
+    with open(os.path.join(index_dir, META_FILE), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+    print(f"✅ 로컬 인덱스 생성 완료: {index_dir} (문서 {doc_count}개, n-gram {len(terms)}개, "
+          f"{time.time() - started:.1f}초)")
+    return meta
+
+
+class LocalIndex:
+    """
+    build_index로 만든 인덱스를 mmap으로 열어 질의하는 검색기
+
+    매개변수:
+        index_dir (str): 인덱스 폴더
+        use_dense (bool): 차원 축소 벡터가 있으면 그것으로 검색할지 여부 (False면 TF-IDF 역색인 사용)
+    """
+
+    def __init__(self, index_dir, use_dense=True):
+        self.index_dir = index_dir
+        with open(os.path.join(index_dir, META_FILE), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        self.doc_count = meta["documents"]
+        self.vocabulary = {gram: i for i, gram in enumerate(meta["vocabulary"])}
+        self.arrays = {}
+        for name in ARRAY_FILES:
+            path = os.path.join(index_dir, f"{name}.npy")
+            if os.path.exists(path):
+                self.arrays[name] = np.load(path, mmap_mode="r")
+        self.dense = use_dense and "doc_vectors" in self.arrays
+        self.docs_file = open(os.path.join(index_dir, DOCS_FILE), 'rb')
+
+    def scores(self, query):
+        """질의와 모든 문서의 코사인 유사도 배열 반환"""
+        features, weights = _weighted_vector(_term_counts(query, self.vocabulary), self.arrays["idf"])
+        if self.dense:
+            reduced = weights @ self.arrays["components"][features]
+            norm = np.linalg.norm(reduced)
+            if norm == 0:
+                return np.zeros(self.doc_count, dtype=np.float32)
+            return self.arrays["doc_vectors"] @ (reduced / norm)
+
+        indptr = self.arrays["postings_indptr"]
+        scores = np.zeros(self.doc_count, dtype=np.float32)
+        for feature, weight in zip(features, weights):
+            lo, hi = indptr[feature], indptr[feature + 1]
+            # 한 특성의 문서 목록에는 같은 문서가 한 번만 있으므로 fancy index 덧셈으로 충분하다
+            scores[self.arrays["postings_docs"][lo:hi]] += weight * self.arrays["postings_weights"][lo:hi]
+        return scores
+
+    def document(self, doc_id):
+        """문서 번호로 {"text", "metadata"} 문서 읽기"""
+        self.docs_file.seek(int(self.arrays["doc_offsets"][doc_id]))
+        return json.loads(self.docs_file.readline())
+
+    def search(self, query, k=5, filters=None):
+        """
+        질의와 가장 유사한 문서 k개 반환
+
+        매개변수:
+            query (str): 검색어
+            k (int): 반환할 문서 수
+            filters (dict): metadata 값이 모두 일치하는 문서만 반환 (예: {"course_code": "CS.10001"})
+        """
+        scores = self.scores(query)
+        candidates = np.flatnonzero(scores > 0)
+        if filters:
+            candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        elif len(candidates) > k:
+            top = np.argpartition(-scores[candidates], k - 1)[:k]
+            candidates = candidates[top[np.argsort(-scores[candidates[top]], kind="stable")]]
+        else:
+            candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        results = []
+        for doc_id in candidates:
+            document = self.document(doc_id)
+            if filters and any(document["metadata"].get(key) != value for key, value in filters.items()):
+                continue
+            results.append({"score": float(scores[doc_id]), "text": document["text"], "metadata": document["metadata"]})
+            if len(results) >= k:
+                break
+        return results
+
+    def close(self):
+        self.docs_file.close()
+
+
+def serve(index_dir, host="127.0.0.1", port=5002, use_dense=True):
+    """
+    로컬 인덱스를 HTTP로 제공 (server.js 가 원격 Vector Store 대신 호출)
+
+    GET  /search?q=검색어&k=5
+    POST /search  {"query": "검색어", "k": 5, "filters": {...}}
+    응답: {"results": [{"score", "text", "metadata"}, ...], "elapsed_ms": ...}
+    """
+    index = LocalIndex(index_dir, use_dense=use_dense)
+
+    class SearchHandler(BaseHTTPRequestHandler):
+        def _send(self, status, body):
+            payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _search(self, query, k, filters):
+            if not query:
+                self._send(400, {"error": "query가 비어 있습니다."})
+                return
+            # k는 정수 또는 정수 문자열만 허용 (true, 2.5 등은 거부)
+            try:
+                if isinstance(k, bool) or not isinstance(k, (int, str)):
+                    raise ValueError
+                k = int(k)
+            except ValueError:
+                self._send(400, {"error": f"k는 정수여야 합니다: {k!r}"})
+                return
+            if k < 1:
+                self._send(400, {"error": "k는 1 이상이어야 합니다."})
+                return
+            started = time.perf_counter()
+            # LocalIndex의 문서 파일 핸들은 스레드 간에 공유되므로 검색은 하나씩 수행
+            with lock:
+                results = index.search(query, k, filters)
+            self._send(200, {"results": results, "elapsed_ms": (time.perf_counter() - started) * 1000})
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == "/health":
+                self._send(200, {"status": "ok", "documents": index.doc_count})
+            elif url.path == "/search":
+                params = parse_qs(url.query)
+                self._search(params.get("q", [""])[0], params.get("k", ["5"])[0], None)
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            if urlparse(self.path).path != "/search":
+                self._send(404, {"error": "not found"})
+                return
+            try:
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            except ValueError:
+                self._send(400, {"error": "잘못된 JSON 요청입니다."})
+                return
+            if not isinstance(body, dict):
+                self._send(400, {"error": "요청 본문은 JSON 객체여야 합니다."})
+                return
+            self._search(body.get("query", ""), body.get("k", 5), body.get("filters"))
+
+        def log_message(self, format, *args):
+            pass
+
+    lock = threading.Lock()
+    server = ThreadingHTTPServer((host, port), SearchHandler)
+    print(f"로컬 검색 서버가 http://{host}:{port} 에서 실행 중입니다. (문서 {index.doc_count}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        index.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링 데이터로 만드는 로컬 검색 인덱스")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("build", help="coursesData.json / reviewData.json 으로 인덱스 생성")
+    p.add_argument("--courses", default="./otl_crawl/coursesData.json")
+    p.add_argument("--reviews", default="./otl_crawl/reviewData.json")
+    p.add_argument("-o", "--index-dir", default="./otl_crawl/localIndex")
+    p.add_argument("--target-tokens", type=int, default=800)
+    p.add_argument("--min-df", type=int, default=2)
+    p.add_argument("--max-features", type=int, default=100000)
+    p.add_argument("--dims", type=int, help="LSA 차원 축소 (예: 256)")
+
+    p = commands.add_parser("query", help="인덱스에서 검색")
+    p.add_argument("query")
+    p.add_argument("-i", "--index-dir", default="./otl_crawl/localIndex")
+    p.add_argument("-k", type=int, default=5)
+    p.add_argument("--sparse", action="store_true", help="차원 축소 벡터 대신 TF-IDF 역색인 사용")
+
+    p = commands.add_parser("serve", help="로컬 검색 HTTP 서버 실행")
+    p.add_argument("-i", "--index-dir", default="./otl_crawl/localIndex")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=5002)
+    p.add_argument("--sparse", action="store_true")
+
+    args = parser.parse_args()
+    if args.command == "build":
+        reviews = iter_records(args.reviews) if os.path.exists(args.reviews) else []
+        documents = build_chunks(iter_records(args.courses), reviews, target_tokens=args.target_tokens)
+        build_index(documents, args.index_dir, args.min_df, args.max_features, args.dims)
+    elif args.command == "query":
+        index = LocalIndex(args.index_dir, use_dense=not args.sparse)
+        started = time.perf_counter()
+        results = index.search(args.query, args.k)
+        elapsed = (time.perf_counter() - started) * 1000
+        for result in results:
+            meta = result["metadata"]
+            print(f"{result['score']:.3f}  [{meta.get('course_code')}] {meta.get('course_name')} {meta.get('professor', '')}")
+        print(f"검색 시간: {elapsed:.1f}ms")
+        index.close()
+    elif args.command == "serve":
+        serve(args.index_dir, args.host, args.port, use_dense=not args.sparse)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import json
+import os
+
+
+class JsonlJournal:
+    """
+    JSON 결과 파일 옆에 두는 추가 전용(JSONL) 체크포인트 저널
+
+    체크포인트마다 전체 목록을 다시 쓰는 대신 새로 수집한 레코드만 한 줄씩 추가하고
+    fsync 한다. 실행이 끝나면 compact()가 기존 JSON 배열과 저널을 합쳐
+    프론트엔드가 읽는 들여쓰기된 JSON 배열 하나로 만든다.
+
+    compact()는 다음 순서로 진행되어 어느 단계에서 중단되어도 데이터가 사라지지 않는다.
+        1. 기존 JSON + 저널 내용을 임시 파일에 쓰고 fsync
+        2. 저널을 .old 로 이름 변경
+        3. 임시 파일로 JSON 파일 교체
+        4. .old 저널 삭제
+    생성 시 recover()가 중단된 compact를 마저 끝낸다.
+
+    매개변수:
+        json_path (str): 최종 JSON 배열 파일 경로 (예: otl_crawl/reviewData.json)
+    """
+
+    def __init__(self, json_path):
+        self.json_path = json_path
+        stem, _ = os.path.splitext(json_path)
+        self.path = f"{stem}.journal.jsonl"
+        self.tmp_path = f"{json_path}.tmp"
+        self.old_path = f"{self.path}.old"
+        self.recover()
+
+    def recover(self):
+        """중단된 compact 마무리"""
+        if not os.path.exists(self.old_path):
+            if os.path.exists(self.tmp_path):
+                # 1단계 도중 중단: 저널이 그대로 남아 있으므로 임시 파일만 버림
+                os.remove(self.tmp_path)
+            return
+        if os.path.exists(self.tmp_path):
+            # 2단계 이후 중단: 임시 파일은 완전히 기록된 상태
+            os.replace(self.tmp_path, self.json_path)
+        os.remove(self.old_path)
+        print(f"중단된 저장 작업을 복구했습니다: {self.json_path}")
+
+    def exists(self):
+        """JSON 배열 파일이나 저널 중 하나라도 있는지 확인"""
+        return os.path.exists(self.json_path) or os.path.exists(self.path)
+
+    def append(self, records):
+        """레코드를 저널 끝에 추가하고 디스크에 동기화 (체크포인트)"""
+        if not records:
+            return
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def replay(self):
+        """
+        저널에 기록된 레코드를 순서대로 반환
+
+        기록 도중 중단되어 마지막 줄이 잘린 경우 그 줄은 버리고 저널을 정상 위치까지 자른다.
+        """
+        if not os.path.exists(self.path):
+            return []
+        records = []
+        valid_end = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    records.append(json.loads(line.decode('utf-8')))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    break
+                valid_end += len(line)
+        if valid_end != os.path.getsize(self.path):
+            print(f"저널 끝의 손상된 기록을 잘라냈습니다: {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_end)
+        return records
+
+    def load(self):
+        """기존 JSON 배열과 저널을 합친 전체 레코드 목록 반환"""
+        records = []
+        if os.path.exists(self.json_path):
+            with open(self.json_path, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+        records.extend(self.replay())
+        return records
+
+    def compact(self):
+        """기존 JSON 배열과 저널을 합쳐 들여쓰기된 JSON 배열 파일로 저장하고 저널을 비움"""
+        if not os.path.exists(self.path):
+            return None
+        records = self.load()
+        with open(self.tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(self.path, self.old_path)
+        os.replace(self.tmp_path, self.json_path)
+        os.remove(self.old_path)
+        return len(records)
@@ -0,0 +1,95 @@
+import os
+import threading
+
+
+def process_rss(pid=None):
+    """프로세스의 현재 RSS(bytes) 반환 (/proc 을 읽을 수 없으면 None)"""
+    try:
+        with open(f"/proc/{pid or os.getpid()}/status", 'r') as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        return None
+    return 0
+
+
+def child_pids(pid=None):
+    """프로세스의 모든 하위 프로세스 PID 목록 (chromedriver, 브라우저 등)"""
+    pid = pid or os.getpid()
+    parents = {}
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return []
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", 'r') as f:
+                # comm 에 공백/괄호가 있을 수 있으므로 마지막 ')' 뒤에서 필드를 읽음
+                fields = f.read().rsplit(")", 1)[1].split()
+            parents.setdefault(int(fields[1]), []).append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+
+    result = []
+    stack = [pid]
+    while stack:
+        for child in parents.get(stack.pop(), []):
+            result.append(child)
+            stack.append(child)
+    return result
+
+
+def process_tree_rss(pid=None):
+    """프로세스와 모든 하위 프로세스의 RSS 합계(bytes) (/proc 이 없으면 None)"""
+    pid = pid or os.getpid()
+    own = process_rss(pid)
+    if own is None:
+        return None
+    return own + sum(process_rss(child) or 0 for child in child_pids(pid))
+
+
+class MemorySampler:
+    """
+    백그라운드 스레드에서 주기적으로 RSS를 읽어 최댓값을 기록
+
+    Python 프로세스 자신과 chromedriver / 브라우저를 포함한 프로세스 트리를 따로 기록한다.
+
+    매개변수:
+        interval (float): 측정 간격(초)
+    """
+
+    def __init__(self, interval=0.5):
+        self.interval = interval
+        self.peak_self = 0
+        self.peak_tree = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sample(self):
+        self.peak_self = max(self.peak_self, process_rss() or 0)
+        self.peak_tree = max(self.peak_tree, process_tree_rss() or 0)
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        self.sample()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.sample()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
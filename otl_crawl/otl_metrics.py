@@ -0,0 +1,172 @@
+from contextlib import contextmanager
+import functools
+import json
+import os
+import time
+
+# 단계별 소요 시간 히스토그램 구간(초)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def timed(phase):
+    """self.metrics 에 메서드 실행 시간을 phase 단계로 기록하는 데코레이터"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.phase(phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _format_duration(seconds):
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}시간 {seconds % 3600 // 60}분"
+    if seconds >= 60:
+        return f"{seconds // 60}분 {seconds % 60}초"
+    return f"{seconds}초"
+
+
+class CrawlMetrics:
+    """
+    크롤링 단계별 소요 시간, 카운터, 진행률을 기록하고 실행 보고서로 내보냄
+
+    단계(navigate, select_filters, scroll, modal_open, scrape_reviews, save 등)마다
+    소요 시간을 모아 히스토그램과 백분위수를 계산하고, 처리/건너뜀/실패한 강의 수와
+    추출한 레코드 수를 카운터로 센다.
+
+    매개변수:
+        scraper (str): 스크래퍼 이름 (보고서와 Prometheus 레이블에 사용)
+        prometheus (bool): 실행이 끝날 때 Prometheus 텍스트 파일도 함께 저장할지 여부
+        progress_interval (float): 진행률 줄을 출력하는 최소 간격(초)
+    """
+
+    def __init__(self, scraper, prometheus=False, progress_interval=2.0):
+        self.scraper = scraper
+        self.prometheus = prometheus
+        self.progress_interval = progress_interval
+        self.started = time.time()
+        self.durations = {}  # 단계 이름 -> 소요 시간 목록(초)
+        self.counters = {}
+        self.gauges = {}
+        self._last_progress = 0.0
+        self._progress_started = None
+
+    @contextmanager
+    def phase(self, name):
+        """with 블록의 실행 시간을 name 단계로 기록 (예외가 나도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def observe(self, name, seconds):
+        self.durations.setdefault(name, []).append(seconds)
+
+    def incr(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_gauge(self, name, value):
+        self.gauges[name] = value
+
+    def start_progress(self):
+        """강의 목록 처리를 시작하는 시점 기록 (처리 속도와 남은 시간 계산 기준)"""
+        self._progress_started = time.perf_counter()
+        self._last_progress = 0.0
+
+    def progress(self, done, total, force=False):
+        """처리한 강의 수, 처리 속도, 남은 예상 시간을 한 줄로 출력"""
+        now = time.perf_counter()
+        if self._progress_started is None:
+            self._progress_started = now
+        if not force and done < total and now - self._last_progress < self.progress_interval:
+            return
+        self._last_progress = now
+        elapsed = now - self._progress_started
+        rate = done / elapsed * 60 if elapsed > 0 else 0.0
+        eta = (total - done) / (done / elapsed) if done and elapsed > 0 else None
+        percent = done / total * 100 if total else 100.0
+        eta_text = _format_duration(eta) if eta is not None else "계산 중"
+        print(f"[진행] {done}/{total} ({percent:.0f}%) | {rate:.1f} 강의/분 | 남은 시간 {eta_text} | "
+              f"처리 {self.counters.get('courses_processed', 0)}, 건너뜀 {self.counters.get('courses_skipped', 0)}, "
+              f"실패 {self.counters.get('courses_failed', 0)}")
+
+    def phase_summary(self):
+        """단계별 횟수, 합계, 평균, 백분위수, 최대, 히스토그램 반환"""
+        result = {}
+        for name, values in self.durations.items():
+            ordered = sorted(values)
+            buckets = {str(bound): sum(1 for v in values if v <= bound) for bound in BUCKETS}
+            result[name] = {
+                "count": len(values),
+                "total": sum(values),
+                "mean": sum(values) / len(values),
+                "p50": ordered[len(ordered) // 2],
+                "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                "max": ordered[-1],
+                "buckets": buckets,
+            }
+        return result
+
+    def report(self, waits=None):
+        """실행 보고서 딕셔너리 생성 (waits: WaitEngine.summary() 결과)"""
+        elapsed = time.time() - self.started
+        processed = self.counters.get("courses_processed", 0)
+        return {
+            "scraper": self.scraper,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "elapsed_seconds": elapsed,
+            "courses_per_minute": processed / elapsed * 60 if elapsed > 0 else 0.0,
+            "counters": dict(self.counters),
+            "gauges": dict(self.gauges),
+            "phases": self.phase_summary(),
+            "waits": waits or {},
+        }
+
+    def prometheus_text(self):
+        """Prometheus 텍스트 노출 형식으로 변환"""
+        label = f'scraper="{self.scraper}"'
+        lines = [
+            "# HELP otl_crawl_phase_seconds 크롤링 단계별 소요 시간",
+            "# TYPE otl_crawl_phase_seconds histogram",
+        ]
+        for name, values in self.durations.items():
+            labels = f'{label},phase="{name}"'
+            for bound in BUCKETS:
+                lines.append(f'otl_crawl_phase_seconds_bucket{{{labels},le="{bound}"}} {sum(1 for v in values if v <= bound)}')
+            lines.append(f'otl_crawl_phase_seconds_bucket{{{labels},le="+Inf"}} {len(values)}')
+            lines.append(f"otl_crawl_phase_seconds_sum{{{labels}}} {sum(values)}")
+            lines.append(f"otl_crawl_phase_seconds_count{{{labels}}} {len(values)}")
+        lines += ["# HELP otl_crawl_events_total 크롤링 이벤트 수", "# TYPE otl_crawl_events_total counter"]
+        for name, value in self.counters.items():
+            lines.append(f'otl_crawl_events_total{{{label},event="{name}"}} {value}')
+        if self.gauges:
+            lines += ["# HELP otl_crawl_gauge 크롤링 상태 값", "# TYPE otl_crawl_gauge gauge"]
+            for name, value in self.gauges.items():
+                lines.append(f'otl_crawl_gauge{{{label},name="{name}"}} {value}')
+        lines += ["# HELP otl_crawl_elapsed_seconds 크롤링 시작 후 경과 시간", "# TYPE otl_crawl_elapsed_seconds gauge"]
+        lines.append(f"otl_crawl_elapsed_seconds{{{label}}} {time.time() - self.started}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, filename, waits=None):
+        """
+        otl_crawl/ 아래에 <파일 이름>.metrics.json (및 .metrics.prom) 저장
+
+        매개변수:
+            filename (str): 스크래퍼의 결과 JSON 파일 이름 (예: reviewData.json)
+            waits (dict): WaitEngine.summary() 결과
+        """
+        stem, _ = os.path.splitext(filename)
+        directory = os.path.join(os.getcwd(), "otl_crawl")
+        os.makedirs(directory, exist_ok=True)
+        report_path = os.path.join(directory, f"{stem}.metrics.json")
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(waits), f, ensure_ascii=False, indent=2)
+        print(f"실행 보고서를 {report_path}에 저장했습니다.")
+        if self.prometheus:
+            prom_path = os.path.join(directory, f"{stem}.metrics.prom")
+            with open(prom_path, 'w', encoding='utf-8') as f:
+                f.write(self.prometheus_text())
+        return report_path
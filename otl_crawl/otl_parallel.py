@@ -0,0 +1,210 @@
+from multiprocessing import Pool
+import glob
+import os
+import re
+
+from otl_crawling import OTLScraper
+from otl_course import OTLCourseScraper
+from otl_journal import JsonlJournal
+from otl_state import CrawlStateStore
+from otl_rate import RateController, DEFAULT_BUDGET
+from otl_retry import DeadLetterFile, dead_letter_path
+
+# 스크래퍼 종류별 클래스, 기본 파일 이름, 중복 판별 키
+SCRAPERS = {
+    "review": {
+        "class": OTLScraper,
+        "filename": "reviewData.json",
+        "key": lambda record: f"{record['강의명']}_{record['강의코드']}",
+    },
+    "course": {
+        "class": OTLCourseScraper,
+        "filename": "coursesData.json",
+        "key": lambda record: record["과목코드"],
+    },
+}
+
+
+def worker_filename(filename, worker_index):
+    """워커별 임시 저장 파일 이름 생성 (예: reviewData_worker0.json)"""
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}_worker{worker_index}{ext}"
+
+
+def find_worker_files(filename):
+    """
+    otl_crawl 폴더에 남아 있는 워커 파일 이름 목록 (워커 번호 순)
+
+    결과 파일, 저널, 실패 목록 중 하나라도 남은 워커를 모두 찾으므로
+    이전에 중단된 실행이 더 많은 워커로 남긴 파일도 포함된다.
+    """
+    stem, _ = os.path.splitext(filename)
+    pattern = re.compile(rf"{re.escape(stem)}_worker(\d+)\.")
+    indices = set()
+    for path in glob.glob(os.path.join(os.getcwd(), "otl_crawl", f"{glob.escape(stem)}_worker*")):
+        match = pattern.match(os.path.basename(path))
+        if match:
+            indices.add(int(match.group(1)))
+    return [worker_filename(filename, index) for index in sorted(indices)]
+
+
+def load_records(full_path):
+    """JSON 배열 파일과 저널을 읽어 리스트로 반환 (파일이 없거나 손상되었으면 빈 리스트)"""
+    try:
+        return JsonlJournal(full_path).load()
+    except Exception as e:
+        print(f"파일 로드 중 오류: {full_path} ({e})")
+        return []
+
+
+def run_worker(task):
+    """
+    워커 프로세스 하나에서 헤드리스 드라이버를 띄워 배정된 강의를 스크래핑
+
+    매개변수:
+        task (dict): scraper, worker_index, worker_count, course_types, departments,
+                     save_interval, profile, rate_budget 을 담은 작업 정보
+    """
+    spec = SCRAPERS[task["scraper"]]
+    filename = worker_filename(task["filename"], task["worker_index"])
+    rate = RateController(task["rate_budget"], workers=task["worker_count"])
+    scraper = spec["class"](headless=True, profile=task["profile"], rate=rate)
+
+    try:
+        scraper.navigate_to_otl()
+        if scraper.select_filters(task["course_types"], task["departments"]):
+            scraper.scrape_courses(
+                save_interval=task["save_interval"],
+                filename=filename,
+                worker_index=task["worker_index"],
+                worker_count=task["worker_count"],
+            )
+        else:
+            print(f"[워커 {task['worker_index']}] 검색 결과가 없어 스크래핑을 중단합니다.")
+    except Exception as e:
+        print(f"[워커 {task['worker_index']}] 오류 발생: {e}")
+    finally:
+        scraper.close()
+
+    return filename
+
+
+def merge_worker_outputs(scraper_name, filename, worker_files, remove_worker_files=True):
+    """
+    워커별 결과 파일을 기존 결과 파일에 병합
+
+    같은 강의 키는 먼저 등장한 파일(기존 파일 → 워커 0 → 워커 1 ...)의 레코드만 유지하여
+    여러 워커가 같은 강의를 수집했더라도 중복이 생기지 않도록 한다.
+    워커 레코드는 기존 파일의 저널에 추가한 뒤 JsonlJournal.compact()로 합치므로
+    병합 도중 중단되어도 기존 파일이 손상되지 않고, 남아 있던 저널도 함께 비워진다.
+    worker_files 외에 이전에 중단된 실행이 남긴 워커 파일도 찾아 병합한다.
+
+    매개변수:
+        scraper_name (str): "review" 또는 "course"
+        filename (str): 최종 저장할 JSON 파일 이름
+        worker_files (list): 병합할 워커 파일 이름 목록
+        remove_worker_files (bool): 병합 후 워커 파일 삭제 여부
+    """
+    key_func = SCRAPERS[scraper_name]["key"]
+    otl_crawl_path = os.path.join(os.getcwd(), "otl_crawl")
+    full_path = os.path.join(otl_crawl_path, filename)
+    worker_files = list(worker_files)
+    worker_files += [worker_file for worker_file in find_worker_files(filename) if worker_file not in worker_files]
+
+    merged = load_records(full_path)
+    owner = {key_func(record): filename for record in merged}
+
+    new_records = []
+    for worker_file in worker_files:
+        for record in load_records(os.path.join(otl_crawl_path, worker_file)):
+            key = key_func(record)
+            # 다른 파일이 이미 가져간 강의는 건너뜀
+            if owner.setdefault(key, worker_file) != worker_file:
+                continue
+            new_records.append(record)
+
+    journal = JsonlJournal(full_path)
+    journal.append(new_records)
+    journal.compact()
+    merged.extend(new_records)
+    print(f"워커 결과 병합 완료: {full_path} (총 {len(merged)}개 레코드, 강의 {len(owner)}개)")
+
+    # 워커별 실패 목록을 최종 실패 목록으로 합침 (--only-failed 실행은 이 파일을 사용)
+    dead_letters = DeadLetterFile(dead_letter_path(filename))
+    failed = sum(dead_letters.merge(dead_letter_path(worker_file), remove=remove_worker_files)
+                 for worker_file in worker_files)
+    if failed:
+        print(f"워커에서 끝내 실패한 강의 {failed}개를 {dead_letters.path}에 기록했습니다.")
+
+    if remove_worker_files:
+        for worker_file in worker_files:
+            worker_path = os.path.join(otl_crawl_path, worker_file)
+            for path in (worker_path, JsonlJournal(worker_path).path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    return merged
+
+
+def crawl_parallel(scraper_name, course_types, departments, num_workers=None, filename=None, save_interval=5,
+                   profile="fast", rate_budget=DEFAULT_BUDGET):
+    """
+    N개의 헤드리스 드라이버로 강의 목록을 나누어 병렬 스크래핑
+
+    강의 목록은 강의 키(목록에 표시된 제목)의 해시로 워커에 분배되므로
+    각 워커는 서로 겹치지 않는 강의만 상세 창을 열어 처리한다.
+
+    매개변수:
+        scraper_name (str): "review" (OTLScraper) 또는 "course" (OTLCourseScraper)
+        course_types (list): 선택할 강의 유형 목록
+        departments (list): 선택할 학과 목록
+        num_workers (int): 워커 수 (기본값: CPU 코어 수)
+        filename (str): 최종 저장할 JSON 파일 이름 (기본값: 스크래퍼별 기본 파일)
+        save_interval (int): 워커가 몇 개의 강의마다 중간 저장할지 지정
+        profile (str): 워커 드라이버의 크롤링 프로필 ("fast" 또는 메모리를 아끼려면 "minimal-memory")
+        rate_budget (float): 모든 워커를 합친 초당 상세 창 열기 상한 (워커마다 나누어 적용)
+    """
+    spec = SCRAPERS[scraper_name]
+    filename = filename or spec["filename"]
+    num_workers = num_workers or os.cpu_count() or 1
+
+    # 기존 결과에 이미 있는 강의는 공유 상태 저장소를 통해 모든 워커가 건너뜀
+    full_path = os.path.join(os.getcwd(), "otl_crawl", filename)
+    state = CrawlStateStore(scraper_name)
+    state.seed_if_empty(lambda: [spec["key"](record) for record in JsonlJournal(full_path).load()])
+    state.warn_if_results_missing(JsonlJournal(full_path).exists())
+    done_count = state.counts().get("done", 0)
+    state.close()
+    print(f"워커 {num_workers}개로 스크래핑을 시작합니다. 이미 수집한 강의 {done_count}개는 건너뜁니다.")
+
+    tasks = [
+        {
+            "scraper": scraper_name,
+            "filename": filename,
+            "worker_index": worker_index,
+            "worker_count": num_workers,
+            "course_types": course_types,
+            "departments": departments,
+            "save_interval": save_interval,
+            "profile": profile,
+            "rate_budget": rate_budget,
+        }
+        for worker_index in range(num_workers)
+    ]
+
+    with Pool(processes=num_workers) as pool:
+        worker_files = pool.map(run_worker, tasks)
+
+    return merge_worker_outputs(scraper_name, filename, worker_files)
+
+
+def main():
+    # 필터 설정
+    course_types = ["인선"]
+    departments = ["전체"]
+
+    crawl_parallel("review", course_types, departments, num_workers=4)
+
+
+if __name__ == "__main__":
+    main()
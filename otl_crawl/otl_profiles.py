@@ -0,0 +1,177 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
+import atexit
+import os
+import shutil
+import tempfile
+
+# 크롤링 프로필별 Chrome 설정
+#
+#   debug          화면을 띄우고 모든 리소스를 불러옴 (기존 동작, 선택자 확인/디버깅용)
+#   fast           헤드리스 + eager 로드 + 이미지/폰트/미디어 차단, 디스크 캐시를 워커별로 유지
+#   minimal-memory fast 설정에 렌더러 프로세스 수와 JS 힙을 제한하고 디스크 캐시를 끔
+#
+# watchdog 은 드라이버 재시작 기준 (otl_watchdog.DriverWatchdog 매개변수)
+# capture 는 오류가 났을 때 남길 기록 수준 (otl_capture.CAPTURE_LEVELS)
+#
+# 필요한 정보는 몇몇 DOM 노드의 텍스트뿐이므로 스타일시트는 차단하지 않는다.
+# (스크롤 위치/클릭 가능 여부 판단에 레이아웃이 필요함)
+PROFILES = {
+    "debug": {
+        "headless": False,
+        "page_load_strategy": "normal",
+        "block_assets": False,
+        "window_size": (1920, 1080),
+        "disk_cache": "default",
+        "arguments": [],
+        "watchdog": {"recycle_every": None, "max_rss_mb": 3072, "latency_factor": 4.0},
+        "capture": "screenshot",
+    },
+    "fast": {
+        "headless": True,
+        "page_load_strategy": "eager",  # DOMContentLoaded 이후 바로 진행 (이후는 WaitEngine 조건 대기)
+        "block_assets": True,
+        "window_size": (1280, 900),
+        "disk_cache": "worker",  # 드라이버를 다시 띄워도 JS 번들을 캐시에서 읽도록 워커별 디렉터리 사용
+        "arguments": [
+            "--disable-extensions",
+            "--mute-audio",
+        ],
+        "watchdog": {"recycle_every": 300, "max_rss_mb": 2048, "latency_factor": 3.0},
+        "capture": "dom",
+    },
+    "minimal-memory": {
+        "headless": True,
+        "page_load_strategy": "eager",
+        "block_assets": True,
+        "window_size": (1024, 768),
+        "disk_cache": "off",
+        "arguments": [
+            "--disable-extensions",
+            "--mute-audio",
+            "--renderer-process-limit=1",
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--disable-features=Translate,MediaRouter,BackForwardCache,OptimizationHints",
+            "--js-flags=--max-old-space-size=256",
+        ],
+        "watchdog": {"recycle_every": 150, "max_rss_mb": 1024, "latency_factor": 3.0},
+        "capture": "text",
+    },
+}
+
+DEFAULT_PROFILE = "debug"
+
+# 요청 가로채기로 차단할 리소스 (이미지, 폰트, 미디어)
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.ogg",
+]
+
+
+def get_profile(name):
+    """프로필 이름으로 설정 딕셔너리 반환 (없는 이름이면 ValueError)"""
+    try:
+        return PROFILES[name or DEFAULT_PROFILE]
+    except KeyError:
+        raise ValueError(f"알 수 없는 크롤링 프로필입니다: {name} (사용 가능: {', '.join(PROFILES)})")
+
+
+# 프로필 이름 -> 이 프로세스의 디스크 캐시 임시 폴더
+_cache_dirs = {}
+
+
+def cache_directory(profile_name):
+    """
+    프로필별 / 프로세스별 디스크 캐시 경로
+
+    같은 캐시를 여러 브라우저가 동시에 쓰지 않도록 프로세스마다 임시 폴더를 새로 만들고,
+    같은 프로세스에서 드라이버를 다시 띄우면 그 폴더를 재사용한다.
+    스크래퍼의 close() 또는 프로세스 종료 시 remove_cache_directory 로 지운다.
+    """
+    path = _cache_dirs.get(profile_name)
+    if path is None:
+        path = _cache_dirs[profile_name] = tempfile.mkdtemp(prefix=f"otl-chrome-cache-{profile_name}-")
+    return path
+
+
+def remove_cache_directory(profile_name=None):
+    """이 프로세스가 만든 디스크 캐시 폴더 삭제 (profile_name이 None이면 모두)"""
+    names = list(_cache_dirs) if profile_name is None else [profile_name or DEFAULT_PROFILE]
+    for name in names:
+        path = _cache_dirs.pop(name, None)
+        if path is not None:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+# close()를 호출하지 않고 끝난 프로세스의 캐시도 남지 않도록 함
+atexit.register(remove_cache_directory)
+
+
+def chrome_options(profile_name=DEFAULT_PROFILE, headless=False, cache_dir=None):
+    """
+    프로필에 맞는 Chrome 옵션 생성
+
+    매개변수:
+        profile_name (str): "debug", "fast", "minimal-memory"
+        headless (bool): 프로필과 관계없이 헤드리스로 실행할지 여부
+        cache_dir (str): 디스크 캐시 경로 (기본값: 프로필 설정을 따름)
+    """
+    profile = get_profile(profile_name)
+    options = Options()
+    if headless or profile["headless"]:
+        options.add_argument("--headless=new")
+    options.page_load_strategy = profile["page_load_strategy"]
+    width, height = profile["window_size"]
+    options.add_argument(f"--window-size={width},{height}")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    for argument in profile["arguments"]:
+        options.add_argument(argument)
+
+    if profile["block_assets"]:
+        # 이미지는 브라우저 설정으로도 막고, 폰트/미디어는 드라이버 생성 후 요청 차단으로 막음
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+
+    if cache_dir is None and profile["disk_cache"] == "worker":
+        cache_dir = cache_directory(profile_name or DEFAULT_PROFILE)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        options.add_argument(f"--disk-cache-dir={cache_dir}")
+    elif profile["disk_cache"] == "off":
+        options.add_argument("--disk-cache-size=1")
+        options.add_argument("--media-cache-size=1")
+    return options
+
+
+def block_assets(driver):
+    """DevTools 프로토콜로 이미지/폰트/미디어 요청을 차단 (지원하지 않는 드라이버면 False)"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        return True
+    except (AttributeError, WebDriverException) as e:
+        print(f"리소스 차단 설정 실패 (모든 리소스를 불러옵니다): {e}")
+        return False
+
+
+def create_driver(profile_name=DEFAULT_PROFILE, headless=False, cache_dir=None):
+    """
+    프로필을 적용한 Chrome 웹드라이버 생성
+
+    매개변수:
+        profile_name (str): "debug", "fast", "minimal-memory"
+        headless (bool): 프로필과 관계없이 헤드리스로 실행할지 여부
+        cache_dir (str): 디스크 캐시 경로
+    """
+    driver = webdriver.Chrome(options=chrome_options(profile_name, headless, cache_dir))
+    if get_profile(profile_name)["block_assets"]:
+        block_assets(driver)
+    return driver
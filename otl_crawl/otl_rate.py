@@ -0,0 +1,181 @@
+from contextlib import asynccontextmanager
+import asyncio
+import statistics
+import threading
+import time
+
+# 모든 워커를 합친 기본 요청 예산 (초당 상세 창 열기 / API 요청 수)
+DEFAULT_BUDGET = 4.0
+
+
+class TokenBucket:
+    """
+    초당 rate개의 토큰이 채워지고 최대 burst개까지 쌓이는 토큰 버킷
+
+    토큰을 미리 예약하고 기다릴 시간을 돌려주므로 스레드와 asyncio 양쪽에서 같은 버킷을 쓸 수 있다.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self):
+        """토큰 하나를 예약하고 사용할 수 있을 때까지 기다려야 하는 시간(초) 반환"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateController:
+    """
+    토큰 버킷과 AIMD(가산 증가 / 곱셈 감소)로 OTL 서버에 보내는 요청 속도를 조절
+
+    요청 속도(초당)와 동시 요청 수를 전역 예산 이하에서 시작해, 최근 window개 요청의
+    응답 시간 중앙값이 target_latency 이하이고 오류/시간 초과 비율이 max_error_rate 이하이면
+    조금씩 올리고, 그렇지 않으면 decrease 배로 줄인다.
+    Selenium 스크래퍼는 상세 창을 열 때마다, API 스크래퍼는 HTTP 요청마다 토큰을 하나 쓴다.
+
+    매개변수:
+        budget (float): 모든 워커를 합친 초당 요청 상한
+        workers (int): 예산을 나눠 쓰는 워커 프로세스 수 (프로세스마다 budget / workers)
+        initial_rate (float): 시작 요청 속도 (기본값: 프로세스 예산의 절반)
+        min_rate (float): 요청 속도 하한
+        concurrency (int): 시작 동시 요청 수 (HTTP 백엔드)
+        max_concurrency (int): 동시 요청 수 상한
+        target_latency (float): 응답 시간 중앙값 목표(초)
+        max_error_rate (float): 허용하는 오류/시간 초과 비율
+        window (int): 한 번의 조절에 사용하는 최근 요청 수
+        increase (float): 조절마다 올리는 요청 속도(초당)
+        decrease (float): 과부하일 때 요청 속도와 동시 요청 수에 곱하는 배수
+    """
+
+    def __init__(self, budget=DEFAULT_BUDGET, workers=1, initial_rate=None, min_rate=0.1, concurrency=2,
+                 max_concurrency=8, target_latency=2.0, max_error_rate=0.1, window=10, increase=None,
+                 decrease=0.5):
+        self.max_rate = budget / max(1, workers)
+        self.min_rate = min(min_rate, self.max_rate)
+        self.rate = initial_rate or self.max_rate / 2
+        self.concurrency = min(concurrency, max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.target_latency = target_latency
+        self.max_error_rate = max_error_rate
+        self.window = window
+        self.increase = increase or self.max_rate / 10
+        self.decrease = decrease
+        self.bucket = TokenBucket(self.rate, burst=1)
+        self.samples = []  # 최근 (응답 시간, 오류 여부)
+        self.requests = 0
+        self.errors = 0
+        self.increases = 0
+        self.decreases = 0
+        self.throttled = 0.0  # 토큰을 기다린 총 시간(초)
+        self._in_flight = 0
+        self._condition = None
+        self._loop = None
+
+    def acquire(self):
+        """요청을 보내기 전에 토큰을 기다림 (동기)"""
+        delay = self.bucket.reserve()
+        if delay > 0:
+            self.throttled += delay
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self):
+        """요청을 보내기 전에 토큰을 기다림 (asyncio)"""
+        delay = self.bucket.reserve()
+        if delay > 0:
+            self.throttled += delay
+            await asyncio.sleep(delay)
+        return delay
+
+    @asynccontextmanager
+    async def slot(self):
+        """동시 요청 수 제한과 토큰을 함께 적용하는 async with 블록"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # asyncio.run 마다 이벤트 루프가 새로 만들어지므로 조건 변수도 새로 만든다
+            self._loop = loop
+            self._condition = asyncio.Condition()
+            self._in_flight = 0
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.concurrency)
+            self._in_flight += 1
+        try:
+            await self.acquire_async()
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def record(self, latency, error=False):
+        """
+        요청 하나의 결과 기록 (window개가 모이면 요청 속도와 동시 요청 수를 조절)
+
+        매개변수:
+            latency (float): 응답 시간(초) (상세 창 로드 시간 등)
+            error (bool): 오류 또는 시간 초과 여부
+        """
+        self.requests += 1
+        self.errors += bool(error)
+        self.samples.append((latency, bool(error)))
+        if len(self.samples) >= self.window:
+            self._adjust()
+
+    def _adjust(self):
+        latency = statistics.median(sample[0] for sample in self.samples)
+        error_rate = sum(sample[1] for sample in self.samples) / len(self.samples)
+        self.samples = []
+        previous = self.rate
+        if error_rate > self.max_error_rate or latency > self.target_latency:
+            # 과부하: 곱셈 감소
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.concurrency = max(1, int(self.concurrency * self.decrease))
+            self.decreases += 1
+            print(f"[속도 조절] 응답 {latency:.2f}초, 오류 {error_rate:.0%} → 초당 {previous:.2f} → {self.rate:.2f}회, "
+                  f"동시 {self.concurrency}개")
+        else:
+            # 여유: 가산 증가 (전역 예산을 넘지 않음)
+            self.rate = min(self.max_rate, self.rate + self.increase)
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+            self.increases += 1
+        self.bucket.set_rate(self.rate)
+        if self._condition is not None and self._loop is not None and self._loop.is_running():
+            # 동시 요청 수가 늘었으면 기다리는 요청을 깨움
+            self._loop.create_task(self._notify())
+
+    async def _notify(self):
+        async with self._condition:
+            self._condition.notify_all()
+
+    def snapshot(self):
+        """현재 제한 값과 조절 횟수"""
+        return {
+            "rate_limit": round(self.rate, 3),
+            "rate_budget": round(self.max_rate, 3),
+            "concurrency_limit": self.concurrency,
+            "rate_increases": self.increases,
+            "rate_decreases": self.decreases,
+            "rate_requests": self.requests,
+            "rate_errors": self.errors,
+            "rate_throttled_seconds": round(self.throttled, 3),
+        }
+
+    def publish(self, metrics):
+        """현재 제한 값을 CrawlMetrics 게이지로 기록 (실행 보고서 / Prometheus 출력에 포함)"""
+        for name, value in self.snapshot().items():
+            metrics.set_gauge(name, value)
@@ -0,0 +1,77 @@
+# 리뷰 평점 문자열 ↔ 숫자 변환
+#
+# 프론트엔드 src/utils/subjectUtils.ts 의 convertGradeToNumber / convertNumberToGrade 와
+# 같은 값을 사용하므로 파이썬에서 미리 계산한 평균이 화면에 표시되는 값과 일치한다.
+
+GRADE_POINTS = {
+    "A+": 4.3, "A": 4.0, "A-": 3.7,
+    "B+": 3.3, "B": 3.0, "B-": 2.7,
+    "C+": 2.3, "C": 2.0, "C-": 1.7,
+    "D+": 1.3, "D": 1.0,
+    "F": 0.0,
+}
+
+# convertNumberToGrade 의 구간 (하한, 학점) - 위에서부터 처음 만족하는 구간을 사용
+GRADE_THRESHOLDS = [
+    (3.7, "A+"), (3.3, "A"), (3.0, "B+"), (2.7, "B"),
+    (2.3, "C+"), (2.0, "C"), (1.5, "D+"), (1.0, "D"),
+]
+
+RATING_FIELDS = ("grade", "workload", "teaching")
+
+
+def grade_to_number(grade):
+    """학점 문자열을 숫자로 변환 (알 수 없는 값은 0.0)"""
+    return GRADE_POINTS.get(grade, 0.0)
+
+
+def number_to_grade(score):
+    """평균 점수를 학점 문자열로 변환"""
+    for lower, grade in GRADE_THRESHOLDS:
+        if score >= lower:
+            return grade
+    return "F"
+
+
+def recommendation_to_number(text):
+    """추천 점수 문자열을 정수로 변환 (JS parseInt 와 같이 앞쪽 숫자만 사용, 실패하면 0)"""
+    text = (text or "").strip()
+    sign = -1 if text.startswith("-") else 1
+    digits = ""
+    for ch in text.lstrip("+-"):
+        if not ch.isdigit():
+            break
+        digits += ch
+    return sign * int(digits) if digits else 0
+
+
+class RatingTotals:
+    """
+    리뷰 평점의 합계를 누적하여 평균을 계산
+
+    평균은 subjectUtils.ts 의 calculateSubjectRating 과 같은 방식
+    (평점이 없는 항목은 0으로 계산)으로 구한다.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.totals = {field: 0.0 for field in RATING_FIELDS}
+        self.recommendation = 0
+
+    def add(self, ratings):
+        ratings = ratings or {}
+        self.count += 1
+        for field in RATING_FIELDS:
+            self.totals[field] += grade_to_number(ratings.get(field))
+        self.recommendation += recommendation_to_number(ratings.get("recommendation"))
+
+    def averages(self):
+        """평균 점수와 학점 반환 (리뷰가 없으면 None)"""
+        if not self.count:
+            return None
+        result = {f"{field}Score": self.totals[field] / self.count for field in RATING_FIELDS}
+        result["recommendationScore"] = self.recommendation / self.count
+        for field in RATING_FIELDS:
+            result[field] = number_to_grade(result[f"{field}Score"])
+        result["reviewCount"] = self.count
+        return result
@@ -0,0 +1,218 @@
+from dataclasses import dataclass
+import math
+import sys
+
+from otl_ratings import GRADE_POINTS
+
+# 리뷰 / 과목 레코드 모델
+#
+# 스크래퍼가 수백만 개의 리뷰를 메모리에 들고 있을 때 리뷰마다 한국어 키 문자열을 가진 dict를 만드는 대신
+# __slots__ 데이터 클래스를 사용하고, 반복되는 문자열(강의명, 코드, 교수명, 학기, 학과, 구분)은
+# sys.intern 으로 같은 객체를 공유한다. 평점은 숫자로 저장하고 JSON으로 쓸 때만 문자열로 바꾼다.
+# 숫자로 바꿀 수 없는 평점 값은 리뷰를 버리지 않고 원래 문자열 그대로 보관한다.
+# to_json / from_json 은 기존 reviewData.json / coursesData.json 스키마와 그대로 대응한다.
+
+GRADE_KEYS = ("grade", "workload", "teaching")
+UNRATED = "?"  # 평점이 없는 항목의 표시 (API 점수 0)
+# "?"로 표시된 항목의 점수. 평균 등에 섞이면 결과가 NaN이 되어 드러나고, 항상 같은 객체를 쓰므로
+# 레코드 비교(==)에서도 같은 값으로 취급된다. 화면에 항목 자체가 없으면 None.
+UNRATED_POINTS = math.nan
+
+# 학점 점수 → 학점 문자열 (GRADE_POINTS 의 값은 모두 다르므로 되돌릴 수 있음)
+POINT_GRADES = {points: grade for grade, points in GRADE_POINTS.items()}
+
+# 이미 경고를 출력한 (평점 항목, 값) (같은 값마다 한 번만 출력)
+_warned_values = set()
+
+
+def _raw_rating(key, value):
+    """숫자로 바꿀 수 없는 평점 값을 그대로 반환 (처음 보는 값이면 경고 출력)"""
+    if (key, repr(value)) not in _warned_values:
+        _warned_values.add((key, repr(value)))
+        print(f"⚠️ 알 수 없는 {key} 평점 값을 원래 문자열로 보관합니다: {value!r}")
+    return value
+
+
+def _intern(value):
+    return sys.intern(value) if value else value
+
+
+def _require_str(record, key, kind):
+    value = record.get(key)
+    if not isinstance(value, str):
+        raise ValueError(f"{kind} 레코드의 '{key}' 값이 문자열이 아닙니다: {value!r}")
+    return value
+
+
+@dataclass(slots=True)
+class Ratings:
+    """
+    리뷰 평점 (추천 수는 정수, 학점 항목은 otl_ratings.GRADE_POINTS 점수)
+
+    "?" 항목은 UNRATED_POINTS, 화면에 없던 항목은 None으로 저장하여 JSON으로 되돌릴 때
+    원래 레코드와 같은 키만 쓴다. 숫자로 바꿀 수 없는 값("3.5", "-" 등)은 원래 값 그대로 둔다.
+    """
+
+    recommendation: int | str | None = None
+    grade: float | str | None = None
+    workload: float | str | None = None
+    teaching: float | str | None = None
+
+    @classmethod
+    def from_json(cls, ratings):
+        """{"recommendation": "3", "grade": "A", ...} 형식을 변환 (평점이 객체가 아니면 ValueError)"""
+        if not isinstance(ratings, dict):
+            raise ValueError(f"평점이 객체가 아닙니다: {ratings!r}")
+        values = {}
+        recommendation = ratings.get("recommendation")
+        if recommendation is not None:
+            try:
+                number = int(recommendation)
+            except (TypeError, ValueError):
+                number = None
+            # "03", " 3" 처럼 되돌렸을 때 달라지는 값도 원래 문자열로 보관
+            if number is not None and str(number) == str(recommendation):
+                values["recommendation"] = number
+            else:
+                values["recommendation"] = _raw_rating("recommendation", recommendation)
+        for key in GRADE_KEYS:
+            grade = ratings.get(key)
+            if grade is None:
+                continue
+            if grade == UNRATED:
+                values[key] = UNRATED_POINTS
+            elif isinstance(grade, str) and grade in GRADE_POINTS:
+                values[key] = GRADE_POINTS[grade]
+            else:
+                values[key] = _raw_rating(key, grade)
+        return cls(**values)
+
+    def to_json(self):
+        """reviewData.json 의 "평점" 객체로 변환 (값이 없는 항목은 쓰지 않음)"""
+        ratings = {}
+        if self.recommendation is not None:
+            ratings["recommendation"] = str(self.recommendation)
+        for key in GRADE_KEYS:
+            points = getattr(self, key)
+            if points is None:
+                continue
+            if isinstance(points, str):
+                ratings[key] = points
+            else:
+                ratings[key] = UNRATED if math.isnan(points) else POINT_GRADES[points]
+        return ratings
+
+
+@dataclass(slots=True)
+class Review:
+    """reviewData.json 의 리뷰 하나"""
+
+    course_title: str
+    course_code: str
+    professor: str
+    semester: str
+    content: str
+    ratings: Ratings
+
+    def __post_init__(self):
+        self.course_title = _intern(self.course_title)
+        self.course_code = _intern(self.course_code)
+        self.professor = _intern(self.professor)
+        self.semester = _intern(self.semester)
+
+    @property
+    def course_key(self):
+        """상태 저장소의 리뷰 수집 키 (강의명_강의코드)"""
+        return f"{self.course_title}_{self.course_code}"
+
+    @classmethod
+    def from_json(cls, record):
+        """reviewData.json 레코드를 검증하여 변환 (형식이 다르면 ValueError)"""
+        return cls(
+            _require_str(record, "강의명", "리뷰"),
+            _require_str(record, "강의코드", "리뷰"),
+            _require_str(record, "교수명", "리뷰"),
+            _require_str(record, "학기", "리뷰"),
+            _require_str(record, "리뷰내용", "리뷰"),
+            Ratings.from_json(record.get("평점", {})),
+        )
+
+    def to_json(self):
+        return {
+            "강의명": self.course_title,
+            "강의코드": self.course_code,
+            "교수명": self.professor,
+            "학기": self.semester,
+            "리뷰내용": self.content,
+            "평점": self.ratings.to_json(),
+        }
+
+
+@dataclass(slots=True)
+class Course:
+    """coursesData.json 의 과목 하나"""
+
+    title: str
+    code: str
+    department: str = ""
+    category: str = ""
+    description: str = ""
+
+    def __post_init__(self):
+        self.title = _intern(self.title)
+        self.code = _intern(self.code)
+        self.department = _intern(self.department)
+        self.category = _intern(self.category)
+
+    @classmethod
+    def from_json(cls, record):
+        """coursesData.json 레코드를 검증하여 변환 (형식이 다르면 ValueError)"""
+        return cls(
+            _require_str(record, "과목명", "과목"),
+            _require_str(record, "과목코드", "과목"),
+            _require_str(record, "학과", "과목"),
+            _require_str(record, "구분", "과목"),
+            _require_str(record, "설명", "과목"),
+        )
+
+    def to_json(self):
+        return {
+            "과목명": self.title,
+            "과목코드": self.code,
+            "학과": self.department,
+            "구분": self.category,
+            "설명": self.description,
+        }
+
+
+# 레코드 종류별 모델 (json_convert.py 의 검증 단계에서 사용)
+RECORD_TYPES = {"review": Review, "course": Course}
+
+
+def records_to_json(records):
+    """레코드 객체 목록을 JSON 스키마의 dict 목록으로 변환 (저널 기록용)"""
+    return [record.to_json() for record in records]
+
+
+def validate_records(items, record_type, errors=None):
+    """
+    JSON 항목을 모델로 검증하여 정규화된 dict로 하나씩 반환
+
+    형식이 맞지 않는 항목도 버리지 않고 원래 값 그대로 반환하며, errors 에 (순번, 오류 메시지)를 추가한다.
+
+    매개변수:
+        items (iterable): JSON 배열 / JSONL 항목
+        record_type (str): "review" 또는 "course"
+        errors (list): 형식 오류를 모을 리스트 (None이면 기록하지 않음)
+    """
+    model = RECORD_TYPES[record_type]
+    for index, item in enumerate(items):
+        try:
+            if not isinstance(item, dict):
+                raise ValueError(f"항목이 객체가 아닙니다: {item!r}")
+            record = model.from_json(item).to_json()
+        except ValueError as e:
+            if errors is not None:
+                errors.append((index, str(e)))
+            record = item
+        yield record
@@ -0,0 +1,166 @@
+from multiprocessing import Pool
+import argparse
+import json
+import os
+
+try:
+    import lxml.html
+except ImportError:  # 아카이브 재추출을 하지 않으면 필요 없음
+    lxml = None
+
+from otl_archive import PageArchive, archive_path, DEFAULT_ARCHIVE
+from otl_extract import parse_ratings, build_course_info
+from otl_journal import JsonlJournal
+from otl_records import Review, Ratings, records_to_json
+
+# 상세 창에서 사용하는 클래스 (otl_extract.py 의 추출 스크립트와 같은 선택자)
+TITLE_CLASS = "_title_zjyzb_1296"
+SUBTITLE_CLASS = "_subtitle_zjyzb_2133"
+ATTRIBUTE_CLASS = "_attribute--long-info_zjyzb_2482"
+REVIEW_CLASS = "block--review"
+REVIEW_TITLE_CLASS = "_block--review__title_zjyzb_1807"
+REVIEW_CONTENT_CLASS = "_block--review__content_zjyzb_1814"
+REVIEW_SCORE_CLASS = "_block--review__menus__score_zjyzb_1834"
+
+# 리뷰 로드를 기다린 뒤 저장한 페이지 (course 스크래퍼의 페이지는 리뷰가 없을 수 있음)
+REVIEW_SOURCES = {"review", "unified"}
+
+
+def _by_class(element, class_name):
+    return element.xpath(f".//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]")
+
+
+def _text(element):
+    """요소의 텍스트 (요소가 없으면 None, <br>은 parse_page 에서 줄바꿈으로 바꿔 innerText 와 맞춤)"""
+    if element is None:
+        return None
+    return element.text_content().strip()
+
+
+def _first(element, class_name):
+    found = _by_class(element, class_name)
+    return found[0] if found else None
+
+
+def parse_page(page):
+    """
+    아카이브 페이지 하나에서 (리뷰 레코드 목록, 과목 레코드) 추출 (프로세스 풀 작업)
+
+    브라우저의 추출 스크립트(otl_extract.py)와 같은 선택자와 변환을 사용하므로
+    결과는 실시간 수집과 같은 형식이다. 강의명 / 코드는 HTML에서 다시 읽고 없으면 저장된 값을 쓴다.
+    """
+    root = lxml.html.fragment_fromstring(page["html"], create_parent="div")
+    for br in root.iter("br"):
+        br.tail = "\n" + (br.tail or "")
+
+    course_title = _text(_first(root, TITLE_CLASS)) or page["course_title"]
+    course_code = _text(_first(root, SUBTITLE_CLASS)) or page["course_code"]
+
+    attributes = []
+    for attr in _by_class(root, ATTRIBUTE_CLASS):
+        # getElementsByTagName 과 같이 자기 자신을 제외한 하위 div
+        divs = [div for div in attr.iter("div") if div is not attr]
+        if len(divs) >= 2:
+            attributes.append((_text(divs[0]), _text(divs[1])))
+    course = build_course_info(course_title, course_code, attributes)
+
+    reviews = []
+    if page.get("source") in REVIEW_SOURCES:
+        for block in _by_class(root, REVIEW_CLASS):
+            title = _first(block, REVIEW_TITLE_CLASS)
+            content = _first(block, REVIEW_CONTENT_CLASS)
+            if title is None or content is None:
+                continue
+            spans = title.findall("span")
+            reviews.append(Review(
+                course_title,
+                course_code,
+                _text(spans[0]) if len(spans) >= 2 else "알 수 없음",
+                _text(spans[1]) if len(spans) >= 2 else "알 수 없음",
+                _text(content),
+                Ratings.from_json(parse_ratings([_text(score) for score in _by_class(block, REVIEW_SCORE_CLASS)])),
+            ))
+    return reviews, course
+
+
+def _write_json(full_path, records):
+    """레코드 배열을 임시 파일에 쓴 뒤 교체 (JsonlJournal.compact 와 같은 형식)"""
+    tmp_path = f"{full_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, ensure_ascii=False, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, full_path)
+
+
+def reparse_archive(archive=DEFAULT_ARCHIVE, review_filename="reviewData.json", course_filename="coursesData.json",
+                    processes=None, chunksize=16):
+    """
+    아카이브의 원본 HTML로 reviewData.json / coursesData.json 을 다시 생성 (네트워크 사용 없음)
+
+    강의마다 가장 최근에 저장한 페이지를 프로세스 풀에서 lxml로 파싱한다.
+    결과 파일은 아카이브 내용으로 통째로 바뀌므로 아카이브 없이 수집한 강의는 빠진다.
+    크롤링 중인 저널이 남아 있으면 저널 내용과 섞이지 않도록 중단한다.
+
+    매개변수:
+        archive (str): 아카이브 파일 이름 (otl_crawl 폴더 기준)
+        review_filename (str): 다시 만들 리뷰 파일 이름 (None이면 만들지 않음)
+        course_filename (str): 다시 만들 과목 파일 이름 (None이면 만들지 않음)
+        processes (int): 파싱 프로세스 수 (기본값: CPU 코어 수)
+        chunksize (int): 프로세스에 한 번에 넘길 페이지 수
+    """
+    if lxml is None:
+        raise RuntimeError("아카이브를 다시 파싱하려면 lxml 패키지를 설치하세요.")
+
+    outputs = [name for name in (review_filename, course_filename) if name]
+    for name in outputs:
+        journal = JsonlJournal(os.path.join(os.getcwd(), "otl_crawl", name))
+        if os.path.exists(journal.path):
+            raise RuntimeError(f"기록 중인 저널이 있습니다: {journal.path} (크롤링을 마치거나 compact 후 다시 실행하세요)")
+
+    pages = PageArchive(archive_path(archive)).latest()
+    if not pages:
+        print(f"아카이브에 저장된 페이지가 없습니다: {archive_path(archive)}")
+        return None
+    print(f"아카이브의 강의 {len(pages)}개를 다시 파싱합니다.")
+
+    with Pool(processes=processes) as pool:
+        results = pool.map(parse_page, pages, chunksize=chunksize)
+
+    reviews = [review for page_reviews, _ in results for review in page_reviews]
+    # 과목 코드가 같은 페이지는 처음 나온 것만 사용 (coursesData.json 의 중복 판별 키)
+    courses = {}
+    for _, course in results:
+        courses.setdefault(course.code, course)
+    courses = list(courses.values())
+
+    otl_crawl_path = os.path.join(os.getcwd(), "otl_crawl")
+    if review_filename:
+        _write_json(os.path.join(otl_crawl_path, review_filename), records_to_json(reviews))
+        print(f"{os.path.join(otl_crawl_path, review_filename)}: 리뷰 {len(reviews)}개")
+    if course_filename:
+        _write_json(os.path.join(otl_crawl_path, course_filename), records_to_json(courses))
+        print(f"{os.path.join(otl_crawl_path, course_filename)}: 과목 {len(courses)}개")
+    return reviews, courses
+
+
+def main():
+    parser = argparse.ArgumentParser(description="원본 HTML 아카이브로 결과 JSON 파일을 다시 생성")
+    parser.add_argument("--archive", default=DEFAULT_ARCHIVE)
+    parser.add_argument("--reviews", default="reviewData.json", help="다시 만들 리뷰 파일 이름")
+    parser.add_argument("--courses", default="coursesData.json", help="다시 만들 과목 파일 이름")
+    parser.add_argument("--skip-reviews", action="store_true")
+    parser.add_argument("--skip-courses", action="store_true")
+    parser.add_argument("--processes", type=int)
+    args = parser.parse_args()
+
+    reparse_archive(
+        args.archive,
+        None if args.skip_reviews else args.reviews,
+        None if args.skip_courses else args.courses,
+        processes=args.processes,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import heapq
+import json
+import os
+import time
+
+
+class RetryQueue:
+    """
+    실패한 강의를 지수 백오프로 다시 방문하기 위한 대기열
+
+    강의가 실패하면 attempts번째 실패마다 base_delay * 2^(attempts-1)초(최대 max_delay) 뒤에
+    다시 방문하도록 예약하고, max_attempts번 실패한 강의는 dead 목록으로 옮긴다.
+    CourseCursor가 목록을 모두 순회한 뒤 next_due()로 예약된 강의를 꺼내 이어서 방문한다.
+
+    매개변수:
+        max_attempts (int): 강의 하나의 최대 시도 횟수 (첫 방문 포함)
+        base_delay (float): 첫 재시도까지의 대기 시간(초)
+        max_delay (float): 재시도 대기 시간 상한(초)
+    """
+
+    def __init__(self, max_attempts=3, base_delay=2.0, max_delay=60.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.attempts = {}  # 목록 순번 -> 실패 횟수
+        self.errors = {}  # 목록 순번 -> 마지막 오류
+        self.waiting = []  # (재시도 시각, 목록 순번) 힙
+        self.dead = []  # 최대 시도 횟수를 넘긴 강의 (dead-letter 항목)
+
+    def __len__(self):
+        """재시도를 기다리는 강의 수"""
+        return len(self.waiting)
+
+    def fail(self, index, key, error):
+        """
+        강의 하나의 실패 기록 (다시 시도하도록 예약했으면 True, 포기했으면 False)
+
+        매개변수:
+            index (int): 강의 목록 순번
+            key (str): 강의 키 (목록 제목)
+            error: 실패 원인 (예외 또는 문자열)
+        """
+        attempts = self.attempts.get(index, 0) + 1
+        self.attempts[index] = attempts
+        self.errors[index] = str(error)
+        if attempts < self.max_attempts:
+            delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+            heapq.heappush(self.waiting, (time.monotonic() + delay, index))
+            print(f"{key}: {attempts}번째 실패, {delay:.0f}초 뒤 목록 끝에서 다시 시도합니다.")
+            return True
+        self.dead.append(self._dead_letter(key, index))
+        print(f"{key}: {attempts}번 실패하여 실패 목록에 기록합니다.")
+        return False
+
+    def _dead_letter(self, key, index):
+        return {
+            "key": key,
+            "attempts": self.attempts[index],
+            "error": self.errors[index],
+            "failed_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+
+    def abandon(self, keys):
+        """실행이 중단되어 재시도하지 못한 강의를 dead-letter 항목으로 반환하고 대기열을 비움"""
+        abandoned = [self._dead_letter(keys[index], index) for _, index in sorted(self.waiting)]
+        self.waiting = []
+        return abandoned
+
+    def next_due(self):
+        """가장 먼저 재시도할 강의의 목록 순번 (시각이 될 때까지 대기, 남은 강의가 없으면 None)"""
+        if not self.waiting:
+            return None
+        due, index = heapq.heappop(self.waiting)
+        delay = due - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        return index
+
+
+def dead_letter_path(filename):
+    """결과 파일 이름에 대응하는 실패 목록 경로 (예: otl_crawl/reviewData.failed.jsonl)"""
+    stem, _ = os.path.splitext(filename)
+    return os.path.join(os.getcwd(), "otl_crawl", f"{stem}.failed.jsonl")
+
+
+class DeadLetterFile:
+    """
+    재시도 후에도 실패한 강의를 모아 두는 JSONL 파일 (강의 키마다 한 줄)
+
+    각 줄에는 강의 키(목록 제목), 그 강의가 나온 검색 필터, 시도 횟수, 마지막 오류가 기록되어
+    --only-failed 실행이 전체 목록을 다시 수집하지 않고 이 강의들만 다시 방문할 수 있다.
+    다음 실행에서 수집에 성공한 강의는 목록에서 지운다.
+
+    매개변수:
+        path (str): 실패 목록 파일 경로 (dead_letter_path 참고)
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        """실패 목록 항목 반환 (파일이 없으면 빈 리스트)"""
+        if not os.path.exists(self.path):
+            return []
+        entries = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entries.append(json.loads(line))
+        return entries
+
+    def write(self, entries):
+        """실패 목록 전체를 임시 파일에 쓴 뒤 교체 (비었으면 파일 삭제)"""
+        if not entries:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def update(self, resolved=(), failed=(), filters=None):
+        """
+        이번 실행 결과를 실패 목록에 반영
+
+        매개변수:
+            resolved (iterable): 이번 실행에서 처리에 성공한 강의 키 (목록에서 지움)
+            failed (list): RetryQueue.dead 항목 (검색 필터를 붙여 추가하거나 갱신)
+            filters (tuple): 이번 실행의 (강의 유형 목록, 학과 목록)
+        """
+        entries = {entry["key"]: entry for entry in self.load()}
+        for key in resolved:
+            entries.pop(key, None)
+        for entry in failed:
+            entry = dict(entry)
+            if filters is not None:
+                entry["types"], entry["departments"] = list(filters[0]), list(filters[1])
+            entries[entry["key"]] = entry
+        self.write(list(entries.values()))
+        return len(entries)
+
+    def merge(self, other_path, remove=True):
+        """다른 실패 목록(병렬 워커 파일 등)의 항목을 이 목록에 합침"""
+        other = DeadLetterFile(other_path)
+        failed = other.load()
+        if failed:
+            self.update(failed=failed)
+        if remove and os.path.exists(other_path):
+            os.remove(other_path)
+        return len(failed)
+
+    def by_filters(self):
+        """실패 목록을 검색 필터별 강의 키 집합으로 묶음 ({(유형 튜플, 학과 튜플): {강의 키}})"""
+        groups = {}
+        for entry in self.load():
+            filters = (tuple(entry.get("types") or ()), tuple(entry.get("departments") or ()))
+            groups.setdefault(filters, set()).add(entry["key"])
+        return groups
+
+
+def scrape_dead_letters(scraper, filename, **scrape_kwargs):
+    """
+    실패 목록에 남은 강의만 다시 수집 (--only-failed 실행)
+
+    검색 필터별로 필터를 다시 적용하고 scrape_courses(only_keys=...)로 해당 강의만 방문한다.
+    navigate_to_otl()을 먼저 호출해 두어야 한다.
+
+    매개변수:
+        scraper: OTLScraper / OTLCourseScraper / OTLUnifiedScraper
+        filename (str): 실패 목록이 대응하는 결과 파일 이름
+        scrape_kwargs: scrape_courses에 그대로 넘길 인자
+    """
+    groups = DeadLetterFile(dead_letter_path(filename)).by_filters()
+    if not groups:
+        print("다시 수집할 실패 강의가 없습니다.")
+        return False
+    for (course_types, departments), keys in groups.items():
+        print(f"실패한 강의 {len(keys)}개를 다시 수집합니다 (유형: {', '.join(course_types)}, 학과: {', '.join(departments)})")
+        if scraper.select_filters(list(course_types), list(departments)):
+            scraper.scrape_courses(only_keys=keys, **scrape_kwargs)
+    return True
+
+
+def record_dead_letters(filename, cursor, resolved, filters):
+    """
+    scrape_courses가 끝날 때 실패 목록 갱신
+
+    이번 실행에서 수집에 성공했거나 이미 수집 완료로 확인된 강의(resolved)만 목록에서 지우고,
+    최대 시도 횟수를 넘긴 강의와 실행이 중단되어 재시도하지 못한 강의를 추가한다.
+    다른 검색 조합이 맡아 건너뛴 강의는 지우지 않는다. 실패 목록에 남은 강의 수를 반환한다.
+    """
+    retries = cursor.retries
+    failed = retries.dead + retries.abandon(cursor.keys)
+    failed_keys = {entry["key"] for entry in failed}
+    remaining = DeadLetterFile(dead_letter_path(filename)).update(set(resolved) - failed_keys, failed, filters)
+    if failed:
+        print(f"끝내 실패한 강의 {len(failed)}개를 {dead_letter_path(filename)}에 기록했습니다. "
+              f"--only-failed 로 다시 수집할 수 있습니다.")
+    return remaining
@@ -0,0 +1,243 @@
+from multiprocessing import Pool
+import argparse
+import os
+
+from otl_crawling import ALL_OPTION, TYPE_MAPPING, DEPT_MAPPING
+from otl_cursor import CourseCursor
+from otl_journal import JsonlJournal
+from otl_parallel import SCRAPERS, worker_filename, merge_worker_outputs
+from otl_profiles import PROFILES
+from otl_rate import RateController, DEFAULT_BUDGET
+from otl_state import CrawlStateStore, PENDING, DONE, FAILED
+
+# 검색 조합 키: "강의 유형+강의 유형|학과+학과" (모든 항목을 고른 차원은 "전체")
+# 예: "전체|전산+전자", "기필+기선|전체"
+QUERY_SEPARATOR = "|"
+NAME_SEPARATOR = "+"
+
+
+def expand(names, mapping):
+    """필터 이름 목록을 매핑 순서의 전체 이름 목록으로 변환 ("전체" 또는 None이면 모든 항목)"""
+    if not names or ALL_OPTION in names:
+        return list(mapping)
+    unknown = [name for name in names if name not in mapping]
+    if unknown:
+        raise ValueError(f"알 수 없는 필터 이름입니다: {', '.join(unknown)}")
+    return [name for name in mapping if name in names]
+
+
+def query_key(course_types, departments):
+    """(강의 유형 목록, 학과 목록)을 검색 조합 키로 변환"""
+    def part(names, mapping):
+        names = expand(names, mapping)
+        return ALL_OPTION if len(names) == len(mapping) else NAME_SEPARATOR.join(names)
+    return f"{part(course_types, TYPE_MAPPING)}{QUERY_SEPARATOR}{part(departments, DEPT_MAPPING)}"
+
+
+def parse_query_key(key):
+    """검색 조합 키를 select_filters 에 넘길 (강의 유형 목록, 학과 목록)으로 변환"""
+    types, departments = key.split(QUERY_SEPARATOR)
+    return types.split(NAME_SEPARATOR), departments.split(NAME_SEPARATOR)
+
+
+def split_query(key):
+    """
+    검색 조합을 항목이 더 많은 차원의 절반씩 두 조합으로 나눔
+
+    두 차원 모두 항목이 하나뿐이면 더 나눌 수 없으므로 빈 목록을 반환한다.
+    """
+    course_types, departments = parse_query_key(key)
+    types = expand(course_types, TYPE_MAPPING)
+    depts = expand(departments, DEPT_MAPPING)
+    if len(types) == 1 and len(depts) == 1:
+        return []
+    if len(depts) >= len(types):
+        half = (len(depts) + 1) // 2
+        return [query_key(types, depts[:half]), query_key(types, depts[half:])]
+    half = (len(types) + 1) // 2
+    return [query_key(types[:half], depts), query_key(types[half:], depts)]
+
+
+def plan_queries(course_types=None, departments=None, min_queries=1):
+    """
+    강의 유형 × 학과 범위를 덮는 최소한의 검색 조합 목록 생성
+
+    한 번의 검색에서 여러 유형 / 학과를 함께 선택할 수 있으므로 범위 전체를 한 조합으로 시작하고,
+    워커들이 나누어 처리할 수 있도록 조합 수가 min_queries 이상이 될 때까지 가장 넓은 조합을 반으로 나눈다.
+    나눈 조합은 서로 겹치지 않으므로 각 강의는 하나의 조합에만 나타난다
+    (여러 학과에 개설된 강의처럼 실제로 겹치는 경우는 CrawlStateStore.claim 으로 한 번만 수집).
+
+    매개변수:
+        course_types (list): 강의 유형 범위 (기본값: 전체)
+        departments (list): 학과 범위 (기본값: 전체)
+        min_queries (int): 최소 조합 수 (보통 워커 수)
+    """
+    plan = [query_key(course_types, departments)]
+    while len(plan) < min_queries:
+        # 유형 수 × 학과 수가 가장 큰 조합을 나눔
+        sizes = []
+        for key in plan:
+            types, depts = parse_query_key(key)
+            sizes.append(len(expand(types, TYPE_MAPPING)) * len(expand(depts, DEPT_MAPPING)))
+        widest = max(range(len(plan)), key=lambda index: sizes[index])
+        children = split_query(plan[widest])
+        if not children:
+            break
+        plan[widest:widest + 1] = children
+    return plan
+
+
+def run_query_worker(task):
+    """
+    워커 프로세스 하나에서 배정된 검색 조합을 차례로 검색하고 스크래핑
+
+    검색 결과가 max_results 이상이면(사이트가 결과 수를 제한하는 경우) 조합을 둘로 나누어
+    이 워커가 이어서 처리하고, 나눈 조합도 상태 저장소에 기록하여 중단 후 재개할 수 있도록 한다.
+
+    매개변수:
+        task (dict): scraper, worker_index, worker_count, filename, queries, save_interval, max_results,
+                     profile, rate_budget 을 담은 작업 정보
+    """
+    spec = SCRAPERS[task["scraper"]]
+    filename = worker_filename(task["filename"], task["worker_index"])
+    queries = CrawlStateStore(f"{task['scraper']}:query")
+    rate = RateController(task["rate_budget"], workers=task["worker_count"])
+    scraper = spec["class"](headless=True, profile=task["profile"], rate=rate)
+    pending = list(task["queries"])
+
+    try:
+        scraper.navigate_to_otl()
+        while pending:
+            key = pending.pop(0)
+            course_types, departments = parse_query_key(key)
+            print(f"[워커 {task['worker_index']}] 검색 조합 {key} (남은 조합 {len(pending)}개)")
+            queries.mark_started(key)
+            try:
+                if not scraper.select_filters(course_types, departments):
+                    queries.mark_done([key])
+                    continue
+
+                if task["max_results"]:
+                    listed = len(CourseCursor(scraper.driver, scraper.waits).snapshot())
+                    children = split_query(key) if listed >= task["max_results"] else []
+                    if children:
+                        print(f"[워커 {task['worker_index']}] 결과 {listed}개가 상한에 도달하여 {', '.join(children)} 로 나눕니다.")
+                        queries.add_pending(children)
+                        queries.mark_done([key])
+                        pending[:0] = children
+                        continue
+
+                finished = scraper.scrape_courses(
+                    save_interval=task["save_interval"],
+                    filename=filename,
+                    claim=lambda list_title, owner=key: queries.claim(list_title, owner),
+                )
+                if finished:
+                    queries.mark_done([key])
+                else:
+                    # 목록을 끝까지 돌지 못했으므로 다음 실행에서 이 조합을 다시 처리
+                    queries.mark_failed(key, "스크래핑이 중간에 중단됨")
+            except Exception as e:
+                print(f"[워커 {task['worker_index']}] 검색 조합 {key} 처리 중 오류: {e}")
+                queries.mark_failed(key, e)
+    except Exception as e:
+        print(f"[워커 {task['worker_index']}] 오류 발생: {e}")
+    finally:
+        scraper.close()
+        queries.close()
+
+    return filename
+
+
+def crawl_schedule(scraper_name, course_types=None, departments=None, num_workers=None, filename=None,
+                   save_interval=5, max_results=None, profile="fast", restart=False, rate_budget=DEFAULT_BUDGET):
+    """
+    강의 유형 × 학과 검색 조합을 계획하고 워커들에게 나누어 스크래핑
+
+    조합별 진행 상태는 crawlState.db 의 "<scraper>:query" namespace에 기록되므로
+    중단된 실행을 다시 시작하면 끝나지 않은 조합(pending / failed)만 다시 처리한다.
+
+    매개변수:
+        scraper_name (str): "review" (OTLScraper) 또는 "course" (OTLCourseScraper)
+        course_types (list): 강의 유형 범위 (기본값: 전체)
+        departments (list): 학과 범위 (기본값: 전체)
+        num_workers (int): 워커 수 (기본값: CPU 코어 수)
+        filename (str): 최종 저장할 JSON 파일 이름 (기본값: 스크래퍼별 기본 파일)
+        save_interval (int): 워커가 몇 개의 강의마다 중간 저장할지 지정
+        max_results (int): 검색 결과가 이 수 이상이면 조합을 나눔 (사이트의 결과 수 제한, None이면 나누지 않음)
+        profile (str): 워커 드라이버의 크롤링 프로필
+        restart (bool): 이전 조합 진행 기록을 지우고 처음부터 계획할지 여부
+        rate_budget (float): 모든 워커를 합친 초당 상세 창 열기 상한 (워커마다 나누어 적용)
+    """
+    spec = SCRAPERS[scraper_name]
+    filename = filename or spec["filename"]
+    num_workers = num_workers or os.cpu_count() or 1
+
+    # 기존 결과에 이미 있는 강의는 공유 상태 저장소를 통해 모든 워커가 건너뜀
+    full_path = os.path.join(os.getcwd(), "otl_crawl", filename)
+    state = CrawlStateStore(scraper_name)
+    state.seed_if_empty(lambda: [spec["key"](record) for record in JsonlJournal(full_path).load()])
+    state.warn_if_results_missing(JsonlJournal(full_path).exists())
+    state.close()
+
+    queries = CrawlStateStore(f"{scraper_name}:query")
+    if restart:
+        queries.clear()
+    if queries.is_empty():
+        plan = plan_queries(course_types, departments, num_workers)
+        queries.add_pending(plan)
+        print(f"검색 조합 {len(plan)}개를 계획했습니다: {', '.join(plan)}")
+    counts = queries.counts()
+    todo = queries.keys(PENDING) + queries.keys(FAILED)
+    queries.close()
+    print(f"검색 조합: 완료 {counts.get(DONE, 0)}개, 남은 조합 {len(todo)}개")
+    if not todo:
+        print("모든 검색 조합을 이미 처리했습니다. 처음부터 다시 하려면 restart=True 로 실행하세요.")
+        return None
+
+    # 남은 조합을 워커들에게 번갈아 배정
+    num_workers = min(num_workers, len(todo))
+    tasks = [
+        {
+            "scraper": scraper_name,
+            "filename": filename,
+            "worker_index": worker_index,
+            "worker_count": num_workers,
+            "queries": todo[worker_index::num_workers],
+            "save_interval": save_interval,
+            "max_results": max_results,
+            "profile": profile,
+            "rate_budget": rate_budget,
+        }
+        for worker_index in range(num_workers)
+    ]
+
+    with Pool(processes=num_workers) as pool:
+        worker_files = pool.map(run_query_worker, tasks)
+
+    return merge_worker_outputs(scraper_name, filename, worker_files)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="강의 유형 × 학과 검색 조합 스케줄러")
+    parser.add_argument("--scraper", choices=list(SCRAPERS), default="review")
+    parser.add_argument("--types", nargs="+", help=f"강의 유형 범위 (기본값: {ALL_OPTION})")
+    parser.add_argument("--departments", nargs="+", help=f"학과 범위 (기본값: {ALL_OPTION})")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-results", type=int, help="검색 결과가 이 수 이상이면 조합을 나눔")
+    parser.add_argument("--profile", choices=list(PROFILES), default="fast")
+    parser.add_argument("--rate", type=float, default=DEFAULT_BUDGET, help="모든 워커를 합친 초당 상세 창 열기 상한")
+    parser.add_argument("--restart", action="store_true", help="이전 진행 기록을 지우고 처음부터 계획")
+    parser.add_argument("--plan", action="store_true", help="계획한 검색 조합만 출력")
+    args = parser.parse_args()
+
+    if args.plan:
+        for key in plan_queries(args.types, args.departments, args.workers):
+            print(key)
+        return
+    crawl_schedule(args.scraper, args.types, args.departments, args.workers,
+                   max_results=args.max_results, profile=args.profile, restart=args.restart, rate_budget=args.rate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+import sqlite3
+import time
+import os
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+class CrawlStateStore:
+    """
+    강의별 수집 상태를 기록하는 SQLite 저장소
+
+    시작할 때마다 기존 결과 파일 전체를 읽어 수집한 강의 목록을 만드는 대신,
+    강의 키마다 상태(pending/done/failed), 시도 횟수, 마지막 수집 시각을 디스크에 기록한다.
+    두 스크래퍼가 같은 파일을 namespace로 구분하여 함께 사용할 수 있고,
+    병렬 워커 프로세스도 같은 파일을 동시에 열 수 있다.
+
+    매개변수:
+        namespace (str): 스크래퍼 구분 이름 (예: "review", "course")
+        path (str): SQLite 파일 경로 (기본값: otl_crawl/crawlState.db)
+    """
+
+    def __init__(self, namespace, path=None):
+        self.namespace = namespace
+        self.path = path or os.path.join(os.getcwd(), "otl_crawl", "crawlState.db")
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        # 여러 워커가 동시에 쓸 수 있도록 잠금 대기 시간을 넉넉히 둔다
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS course_state (
+                namespace TEXT NOT NULL,
+                course_key TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_crawled REAL,
+                last_error TEXT,
+                PRIMARY KEY (namespace, course_key)
+            )
+        """)
+        # 증분 수집용: 강의별로 이미 저장한 리뷰 지문과 마지막으로 본 리뷰 수 / 최신 학기
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS review_fingerprint (
+                course_key TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                PRIMARY KEY (course_key, fingerprint)
+            )
+        """)
+        # 여러 검색 조합에 겹쳐 나오는 강의를 처음 맡은 조합(owner)만 수집하도록 기록
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS course_claim (
+                namespace TEXT NOT NULL,
+                course_key TEXT NOT NULL,
+                owner TEXT NOT NULL,
+                PRIMARY KEY (namespace, course_key)
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS review_snapshot (
+                course_key TEXT PRIMARY KEY,
+                review_count INTEGER NOT NULL,
+                newest_semester TEXT
+            )
+        """)
+        self.conn.commit()
+
+    def status(self, course_key):
+        """강의 키의 상태 반환 (기록이 없으면 None)"""
+        row = self.conn.execute(
+            "SELECT status FROM course_state WHERE namespace = ? AND course_key = ?",
+            (self.namespace, course_key),
+        ).fetchone()
+        return row[0] if row else None
+
+    def is_done(self, course_key):
+        """이미 수집을 마친 강의인지 확인"""
+        return self.status(course_key) == DONE
+
+    def mark_started(self, course_key):
+        """수집 시작 기록 (상태를 pending으로 바꾸고 시도 횟수 증가)"""
+        with self.conn:
+            self.conn.execute("""
+                INSERT INTO course_state (namespace, course_key, status, attempts, last_crawled)
+                VALUES (?, ?, ?, 1, ?)
+                ON CONFLICT (namespace, course_key) DO UPDATE SET
+                    status = excluded.status,
+                    attempts = course_state.attempts + 1,
+                    last_crawled = excluded.last_crawled
+            """, (self.namespace, course_key, PENDING, time.time()))
+
+    def mark_done(self, course_keys):
+        """결과가 디스크에 기록된 강의들을 done으로 표시"""
+        now = time.time()
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO course_state (namespace, course_key, status, attempts, last_crawled)
+                VALUES (?, ?, ?, 1, ?)
+                ON CONFLICT (namespace, course_key) DO UPDATE SET
+                    status = excluded.status,
+                    last_crawled = excluded.last_crawled,
+                    last_error = NULL
+            """, [(self.namespace, key, DONE, now) for key in course_keys])
+
+    def mark_failed(self, course_key, error=None):
+        """수집 도중 실패한 강의 기록"""
+        with self.conn:
+            self.conn.execute("""
+                INSERT INTO course_state (namespace, course_key, status, attempts, last_crawled, last_error)
+                VALUES (?, ?, ?, 1, ?, ?)
+                ON CONFLICT (namespace, course_key) DO UPDATE SET
+                    status = excluded.status,
+                    last_crawled = excluded.last_crawled,
+                    last_error = excluded.last_error
+            """, (self.namespace, course_key, FAILED, time.time(), str(error) if error else None))
+
+    def add_pending(self, course_keys):
+        """기록이 없는 키만 pending으로 추가 (이미 있는 키의 상태는 바꾸지 않음)"""
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO course_state (namespace, course_key, status, attempts)
+                VALUES (?, ?, ?, 0)
+                ON CONFLICT (namespace, course_key) DO NOTHING
+            """, [(self.namespace, key, PENDING) for key in course_keys])
+
+    def claim(self, course_key, owner):
+        """
+        강의를 owner가 맡도록 기록하고, owner가 맡은 강의인지 반환
+
+        이미 다른 owner가 맡은 강의면 False를 반환한다. 같은 owner가 다시 요청하면
+        (중단 후 재실행 등) True를 반환한다. 여러 워커 프로세스가 동시에 호출해도 한 owner만 맡는다.
+        """
+        with self.conn:
+            self.conn.execute("""
+                INSERT INTO course_claim (namespace, course_key, owner) VALUES (?, ?, ?)
+                ON CONFLICT (namespace, course_key) DO NOTHING
+            """, (self.namespace, course_key, owner))
+        row = self.conn.execute(
+            "SELECT owner FROM course_claim WHERE namespace = ? AND course_key = ?",
+            (self.namespace, course_key)).fetchone()
+        return row is not None and row[0] == owner
+
+    def clear(self):
+        """이 namespace의 상태와 강의 배정 기록을 모두 삭제"""
+        with self.conn:
+            self.conn.execute("DELETE FROM course_state WHERE namespace = ?", (self.namespace,))
+            self.conn.execute("DELETE FROM course_claim WHERE namespace = ?", (self.namespace,))
+
+    def keys(self, status=None):
+        """상태별 강의 키 목록 반환 (status가 None이면 전체)"""
+        if status is None:
+            rows = self.conn.execute(
+                "SELECT course_key FROM course_state WHERE namespace = ?", (self.namespace,))
+        else:
+            rows = self.conn.execute(
+                "SELECT course_key FROM course_state WHERE namespace = ? AND status = ?", (self.namespace, status))
+        return [row[0] for row in rows]
+
+    def counts(self):
+        """상태별 강의 수 반환"""
+        rows = self.conn.execute(
+            "SELECT status, COUNT(*) FROM course_state WHERE namespace = ? GROUP BY status", (self.namespace,))
+        return dict(rows.fetchall())
+
+    def is_empty(self):
+        """이 namespace에 기록된 강의가 하나도 없는지 확인"""
+        row = self.conn.execute(
+            "SELECT 1 FROM course_state WHERE namespace = ? LIMIT 1", (self.namespace,)).fetchone()
+        return row is None
+
+    def seed_if_empty(self, load_keys):
+        """
+        상태 저장소를 처음 사용할 때 기존 결과 파일의 강의를 done으로 가져옴
+
+        매개변수:
+            load_keys (callable): 기존 결과의 강의 키 목록을 반환하는 함수 (저장소가 비어 있을 때만 호출)
+        """
+        if not self.is_empty():
+            return 0
+        keys = set(load_keys())
+        if keys:
+            self.mark_done(keys)
+            print(f"기존 결과에서 {len(keys)}개 강의를 수집 상태 저장소로 가져왔습니다.")
+        return len(keys)
+
+    def warn_if_results_missing(self, results_exist):
+        """
+        결과 파일이 없는데 수집 완료 기록이 남아 있으면 경고 출력 (경고했으면 True)
+
+        결과 파일을 지워 다시 수집하려는 경우 이 기록 때문에 모든 강의를 건너뛰게 된다.
+        병렬 워커의 임시 파일이 아니라 최종 결과 파일에 대해서만 호출한다.
+        """
+        done = self.counts().get(DONE, 0)
+        if results_exist or not done:
+            return False
+        print(f"⚠️ 결과 파일이 없지만 {self.path}에 수집 완료로 기록된 {self.namespace} 강의 {done}개를 건너뜁니다. "
+              f"처음부터 다시 수집하려면 --reset-state 로 실행하거나 수집 상태를 지우세요.")
+        return True
+
+    def review_snapshot(self, course_key):
+        """강의의 마지막 (리뷰 수, 최신 학기) 반환 (기록이 없으면 None)"""
+        row = self.conn.execute(
+            "SELECT review_count, newest_semester FROM review_snapshot WHERE course_key = ?", (course_key,)).fetchone()
+        return tuple(row) if row else None
+
+    def review_fingerprints(self, course_key):
+        """강의에 대해 이미 저장한 리뷰 지문 집합 반환"""
+        rows = self.conn.execute(
+            "SELECT fingerprint FROM review_fingerprint WHERE course_key = ?", (course_key,))
+        return {row[0] for row in rows}
+
+    def remember_reviews(self, course_key, fingerprints, review_count, newest_semester):
+        """저장한 리뷰의 지문을 추가하고 강의의 리뷰 수 / 최신 학기 갱신"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO review_fingerprint (course_key, fingerprint) VALUES (?, ?)",
+                [(course_key, fp) for fp in fingerprints])
+            self.conn.execute(
+                "INSERT OR REPLACE INTO review_snapshot (course_key, review_count, newest_semester) VALUES (?, ?, ?)",
+                (course_key, review_count, newest_semester))
+
+    def seed_reviews_if_empty(self, load_summaries):
+        """
+        리뷰 지문 테이블을 처음 사용할 때 기존 리뷰 데이터로 채움
+
+        매개변수:
+            load_summaries (callable): {강의 키: (지문 목록, 리뷰 수, 최신 학기)}를 반환하는 함수
+        """
+        if self.conn.execute("SELECT 1 FROM review_snapshot LIMIT 1").fetchone() is not None:
+            return 0
+        summaries = load_summaries()
+        for course_key, (fingerprints, review_count, newest) in summaries.items():
+            self.remember_reviews(course_key, fingerprints, review_count, newest)
+        if summaries:
+            print(f"기존 리뷰 데이터에서 {len(summaries)}개 강의의 리뷰 지문을 가져왔습니다.")
+        return len(summaries)
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,400 @@
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.action_chains import ActionChains
+import argparse
+import os
+import time
+
+from otl_crawling import OTLScraper
+from otl_journal import JsonlJournal
+from otl_state import CrawlStateStore
+from otl_wait import detail_heading, in_viewport
+from otl_extract import extract_reviews, extract_course_attributes, build_course_info
+from otl_incremental import review_fingerprint, newest_semester
+from otl_metrics import timed
+from otl_records import records_to_json
+from otl_profiles import DEFAULT_PROFILE
+from otl_watchdog import driver_alive
+from otl_cursor import CourseCursor
+from otl_retry import RetryQueue, record_dead_letters, scrape_dead_letters
+
+
+class Extractor:
+    """
+    강의 상세 창 하나에서 출력 파일 하나의 레코드를 만드는 추출기
+
+    하위 클래스는 name, filename, course_key(), extract()를 정의한다.
+    추출기마다 자신의 상태 저장소 namespace, 저널, 체크포인트를 가진다.
+    """
+
+    name = None
+    filename = None
+
+    def __init__(self, filename=None):
+        self.filename = filename or type(self).filename
+        self.records = []  # 이번 실행에서 새로 수집한 레코드 (Review / Course)
+        self.saved_count = 0
+        self.pending_done = []
+        self.state = None
+
+    @property
+    def full_path(self):
+        return os.path.join(os.getcwd(), "otl_crawl", self.filename)
+
+    def course_key(self, course_title, course_code):
+        """상세 창의 강의명과 코드로 만든 중복 판별 키"""
+        raise NotImplementedError
+
+    def list_key(self, list_title):
+        """강의 목록에 표시된 제목만으로 알 수 있는 키 (알 수 없으면 None)"""
+        return None
+
+    def extract(self, scraper, detail_section, course_title, course_code):
+        """열려 있는 상세 창에서 레코드 목록 추출"""
+        raise NotImplementedError
+
+    def record_key(self, record):
+        """저장된 레코드의 중복 판별 키"""
+        raise NotImplementedError
+
+    def open(self, state_path=None, reset=False):
+        """상태 저장소를 열고 처음 사용하는 경우 기존 결과로 채움 (reset이면 이전 기록을 먼저 지움)"""
+        self.state = CrawlStateStore(self.name, state_path)
+        if reset:
+            self.state.clear()
+        self.state.seed_if_empty(lambda: [self.record_key(r) for r in JsonlJournal(self.full_path).load()])
+        self.state.warn_if_results_missing(JsonlJournal(self.full_path).exists())
+
+    def add(self, course_key, records):
+        self.records.extend(records)
+        self.pending_done.append(course_key)
+
+    def checkpoint(self):
+        """마지막 체크포인트 이후 레코드를 저널에 추가하고 수집 완료로 표시"""
+        new_records = self.records[self.saved_count:]
+        JsonlJournal(self.full_path).append(records_to_json(new_records))
+        self.saved_count = len(self.records)
+        self.state.mark_done(self.pending_done)
+        self.pending_done = []
+        return len(new_records)
+
+    def compact(self):
+        return JsonlJournal(self.full_path).compact()
+
+    def close(self):
+        if self.state is not None:
+            self.state.close()
+
+
+class CourseInfoExtractor(Extractor):
+    """과목 분류/설명을 coursesData.json 형식으로 추출"""
+
+    name = "course"
+    filename = "coursesData.json"
+
+    def course_key(self, course_title, course_code):
+        return course_code
+
+    def list_key(self, list_title):
+        parts = list_title.split()
+        return parts[-1] if len(parts) > 1 else None
+
+    def record_key(self, record):
+        return record["과목코드"]
+
+    def extract(self, scraper, detail_section, course_title, course_code):
+        attributes = extract_course_attributes(scraper.driver, detail_section)
+        return [build_course_info(course_title, course_code, attributes)]
+
+
+class ReviewExtractor(Extractor):
+    """리뷰 블록을 reviewData.json 형식으로 추출하고 증분 수집용 지문을 기록"""
+
+    name = "review"
+    filename = "reviewData.json"
+
+    def __init__(self, filename=None):
+        super().__init__(filename)
+        self.pending_reviews = []
+
+    def course_key(self, course_title, course_code):
+        return f"{course_title}_{course_code}"
+
+    def record_key(self, record):
+        return f"{record['강의명']}_{record['강의코드']}"
+
+    def extract(self, scraper, detail_section, course_title, course_code):
+        # 시간 초과면 이 추출기만 실패로 기록되어 재시도 대기열에서 다시 방문
+        if scraper.waits.wait_for_reviews() is None:
+            raise TimeoutException("리뷰 목록이 로드되지 않았습니다.")
+        reviews = extract_reviews(scraper.driver, course_title, course_code, scraper.waits.stale_reviews)
+        self.pending_reviews.append((
+            self.course_key(course_title, course_code),
+            [review_fingerprint(review) for review in reviews],
+            len(reviews),
+            newest_semester([review.semester for review in reviews]),
+        ))
+        return reviews
+
+    def checkpoint(self):
+        count = super().checkpoint()
+        for course_key, fingerprints, review_count, newest in self.pending_reviews:
+            self.state.remember_reviews(course_key, fingerprints, review_count, newest)
+        self.pending_reviews = []
+        return count
+
+
+class OTLUnifiedScraper(OTLScraper):
+    """
+    강의 상세 창을 한 번만 열어 여러 출력(과목 정보, 리뷰 등)을 함께 수집하는 스크래퍼
+
+    검색/필터 설정은 OTLScraper와 같고, 강의마다 등록된 추출기를 차례로 실행한다.
+    모든 추출기가 이미 수집한 강의는 상세 창을 열지 않고 건너뛴다.
+
+    매개변수:
+        extractors (list): 사용할 추출기 목록 (기본값: 과목 정보 + 리뷰)
+        headless (bool): 헤드리스 모드로 실행할지 여부
+        state_path (str): 수집 상태 저장소 경로
+        profile (str): 크롤링 프로필 ("debug", "fast", "minimal-memory")
+        watchdog (DriverWatchdog): 드라이버 재시작 기준 (기본값: 프로필 설정)
+        rate (RateController): 상세 창 열기 요청 속도 조절기
+        capture (str): 오류 기록 수준 (off / text / dom / screenshot, 기본값: 프로필 설정)
+        archive (bool): 상세 창 원본 HTML을 아카이브에 저장할지 여부 (otl_reparse.py 참고)
+        reset_state (bool): 추출기들의 수집 완료 기록을 지우고 남아 있는 결과 파일로 다시 채울지 여부
+    """
+
+    def __init__(self, extractors=None, headless=False, state_path=None, profile=DEFAULT_PROFILE, watchdog=None,
+                 rate=None, capture=None, archive=False, reset_state=False):
+        super().__init__(headless=headless, bulk_extract=True, state_path=state_path, profile=profile,
+                         watchdog=watchdog, rate=rate, capture=capture, archive=archive)
+        if self.archive is not None:
+            self.archive.source = "unified"
+        self.metrics.scraper = "unified"
+        self.extractors = extractors or [CourseInfoExtractor(), ReviewExtractor()]
+        for extractor in self.extractors:
+            extractor.open(state_path, reset=reset_state)
+
+    @timed("save")
+    def checkpoint(self):
+        """모든 추출기의 새 레코드를 저널에 기록"""
+        if self.archive is not None:
+            self.archive.flush()
+        for extractor in self.extractors:
+            try:
+                count = extractor.checkpoint()
+                print(f"[{extractor.name}] {count}개 레코드를 저널에 추가했습니다.")
+            except Exception as e:
+                print(f"[{extractor.name}] JSON 저장 중 오류 발생: {e}")
+
+    def compact_all(self):
+        """모든 추출기의 저널을 최종 JSON 배열 파일로 합침"""
+        for extractor in self.extractors:
+            try:
+                count = extractor.compact()
+                if count is not None:
+                    print(f"데이터가 {extractor.full_path}에 저장되었습니다. 총 {count}개 레코드.")
+            except Exception as e:
+                print(f"[{extractor.name}] JSON 병합 중 오류 발생: {e}")
+
+    def _skip_from_list(self, list_title):
+        """목록 제목만으로 모든 추출기가 이미 수집한 강의인지 확인"""
+        keys = [extractor.list_key(list_title) for extractor in self.extractors]
+        return all(key is not None and extractor.state.is_done(key) for extractor, key in zip(self.extractors, keys))
+
+    def scrape_courses(self, save_interval=5, worker_index=0, worker_count=1, only_keys=None, max_attempts=3):
+        """
+        강의마다 상세 창을 한 번 열어 모든 추출기를 실행
+
+        목록을 끝까지 처리했으면 True, 오류로 중간에 멈췄으면 False를 반환한다.
+
+        매개변수:
+            save_interval (int): 몇 개의 강의마다 저널에 저장할지 지정
+            worker_index (int): 병렬 모드에서 이 워커의 번호 (0부터 시작)
+            worker_count (int): 병렬 모드의 전체 워커 수 (1이면 모든 강의 처리)
+            only_keys (set): 이 강의 키(목록 제목)만 방문 (실패 목록 재수집)
+            max_attempts (int): 강의 하나의 최대 시도 횟수 (넘으면 unifiedCrawl.failed.jsonl 에 기록)
+        """
+        cursor = None
+        resolved = set()  # 모든 출력을 수집했거나 이미 수집 완료인 강의의 목록 제목 (실패 목록에서 지움)
+        try:
+            self.waits.wait_for_results()
+            # 실패한 강의는 목록을 다 돈 뒤 지수 백오프로 max_attempts번까지 다시 방문
+            cursor = CourseCursor(self.driver, self.waits, retries=RetryQueue(max_attempts))
+            if not cursor.snapshot():
+                print("강의를 찾을 수 없습니다. 필터를 확인하세요.")
+                return True
+            print(f"총 {len(cursor.keys)}개의 강의를 찾았습니다")
+            # 병렬 모드에서는 강의 키 해시로 이 워커에 배정된 강의만 처리
+            cursor.shard(worker_index, worker_count)
+            if only_keys is not None:
+                cursor.restrict(only_keys)
+            self.metrics.set_gauge("courses_listed", len(cursor.keys))
+            self.metrics.start_progress()
+
+            courses_since_last_save = 0
+            last_heading = detail_heading(self.driver)
+
+            for i, list_title in cursor:
+                course_started = time.perf_counter()
+                try:
+                    if list_title and self._skip_from_list(list_title):
+                        print(f"이미 수집한 강의입니다: {list_title}. 건너뜁니다.")
+                        self.metrics.incr("courses_skipped")
+                        resolved.add(list_title)
+                        continue
+
+                    print(f"강의 처리 중 {i+1}/{len(cursor.keys)} (남은 강의 {cursor.remaining}개): {list_title}")
+                    with self.metrics.phase("scroll"):
+                        course_block = cursor.locate(i)
+                        if course_block is None:
+                            raise NoSuchElementException(f"강의 블록을 찾을 수 없습니다: {list_title}")
+                        self.waits.wait("scroll", in_viewport(course_block))
+                    with self.metrics.phase("throttle"):
+                        self.rate.acquire()
+                    self.waits.snapshot_reviews()  # 클릭 전에 이전 강의의 리뷰 블록을 기억
+                    self.driver.execute_script("arguments[0].click();", course_block)
+
+                    modal_started = time.perf_counter()
+                    with self.metrics.phase("modal_open"):
+                        detail_section = self.waits.wait_for_modal(last_heading)
+                    self.rate.record(time.perf_counter() - modal_started, error=detail_section is None)
+                    self.rate.publish(self.metrics)
+                    if detail_section is None:
+                        raise TimeoutException("강의 상세 정보가 로드되지 않았습니다.")
+                    course_title = detail_section.find_element(By.CLASS_NAME, "_title_zjyzb_1296").text.strip()
+                    course_code = detail_section.find_element(By.CLASS_NAME, "_subtitle_zjyzb_2133").text.strip()
+                    last_heading = (course_title, course_code)
+
+                    # 한 번의 상세 창 방문에서 아직 수집하지 않은 출력만 추출
+                    extracted = False
+                    extract_error = None
+                    for extractor in self.extractors:
+                        course_key = extractor.course_key(course_title, course_code)
+                        if extractor.state.is_done(course_key):
+                            continue
+                        extractor.state.mark_started(course_key)
+                        try:
+                            with self.metrics.phase(f"extract_{extractor.name}"):
+                                records = extractor.extract(self, detail_section, course_title, course_code)
+                        except Exception as e:
+                            print(f"[{extractor.name}] {course_title} 추출 중 오류: {e}")
+                            extractor.state.mark_failed(course_key, e)
+                            self.metrics.incr(f"{extractor.name}_failed")
+                            extract_error = e
+                            continue
+                        extractor.add(course_key, records)
+                        self.metrics.incr(f"{extractor.name}_records_extracted", len(records))
+                        extracted = True
+                        print(f"[{extractor.name}] {course_title} ({course_code}): {len(records)}개 레코드")
+
+                    # 추출한 출력이 없고 오류가 있었으면 건너뛴 것이 아니라 실패로 집계
+                    if extracted:
+                        self.metrics.incr("courses_processed")
+                    elif extract_error is not None:
+                        self.metrics.incr("courses_failed")
+                    else:
+                        self.metrics.incr("courses_skipped")
+                    if extracted and self.archive is not None:
+                        self.archive.add(self.driver, course_title, course_code)
+                    if extract_error is not None:
+                        # 실패한 추출기만 남아 있으므로 재방문하면 그 출력만 다시 추출
+                        cursor.retry(i, extract_error)
+                    else:
+                        resolved.add(list_title)
+                    if extracted:
+                        courses_since_last_save += 1
+                        if courses_since_last_save >= save_interval:
+                            self.checkpoint()
+                            courses_since_last_save = 0
+
+                    with self.metrics.phase("modal_close"):
+                        ActionChains(self.driver).send_keys(u'\ue00c').perform()
+                        self.waits.wait_for_modal_closed()
+                    self.watchdog.record(time.perf_counter() - course_started)
+                    self.metrics.progress(cursor.position, len(cursor))
+
+                except StaleElementReferenceException:
+                    print("요소가 오래되었습니다. 이 강의는 목록 끝에서 다시 찾습니다.")
+                    if not cursor.requeue(i):
+                        cursor.retry(i, "강의 목록이 반복해서 다시 렌더링됨")
+                except Exception as e:
+                    print(f"강의 처리 중 오류 발생: {e}")
+                    self.metrics.incr("courses_failed")
+                    cursor.retry(i, e)
+                    if not driver_alive(self.driver):
+                        self.watchdog.request_restart(f"브라우저 응답 없음: {e}")
+                    else:
+                        self.capture.capture(self.driver, "course_error", e, index=i, course=list_title)
+                        try:
+                            ActionChains(self.driver).send_keys(u'\ue00c').perform()
+                            self.waits.wait_for_modal_closed()
+                        except Exception:
+                            print("페이지 상태 복구 실패")
+
+                # 메모리 / 처리 시간 기준을 넘었거나 브라우저가 종료되었으면 드라이버를 재시작하고 다음 강의부터 계속
+                reason = self.watchdog.check()
+                if self.watchdog.last_rss:
+                    self.metrics.set_gauge("browser_rss_mb", round(self.watchdog.last_rss / (1 << 20)))
+                if reason:
+                    if courses_since_last_save > 0:
+                        self.checkpoint()
+                        courses_since_last_save = 0
+                    self.restart_driver(reason)
+                    cursor.driver = self.driver
+                    last_heading = detail_heading(self.driver)
+
+            self.waits.print_summary()
+            self.metrics.progress(cursor.position, len(cursor), force=True)
+            return True
+        except Exception as e:
+            print(f"강의 스크래핑 중 오류 발생: {e}")
+            self.capture.capture(self.driver, "scrape_courses_error", e)
+            return False
+        finally:
+            # 오류가 나도 지금까지 수집한 데이터를 저장하고 최종 JSON으로 합침
+            self.checkpoint()
+            with self.metrics.phase("compact"):
+                self.compact_all()
+            if cursor is not None:
+                self.metrics.set_gauge("dead_letters", record_dead_letters("unifiedCrawl.json", cursor, resolved, self.filters))
+            self.capture.publish(self.metrics)
+            self.metrics.export("unifiedCrawl.json", self.waits.summary())
+
+    def close(self):
+        """웹드라이버, 상태 저장소 종료"""
+        for extractor in self.extractors:
+            extractor.close()
+        super().close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OTL 과목 + 리뷰 통합 스크래퍼")
+    parser.add_argument("--only-failed", action="store_true",
+                        help="이전 실행에서 끝내 실패한 강의(unifiedCrawl.failed.jsonl)만 다시 수집")
+    parser.add_argument("--reset-state", action="store_true",
+                        help="crawlState.db 의 수집 완료 기록을 지우고 남아 있는 결과 파일 기준으로 다시 수집")
+    args = parser.parse_args()
+    scraper = OTLUnifiedScraper(reset_state=args.reset_state)
+
+    try:
+        scraper.navigate_to_otl()
+
+        if args.only_failed:
+            scrape_dead_letters(scraper, "unifiedCrawl.json", save_interval=5)
+            return
+
+        # 필터 설정
+        course_types = ["인선"]
+        departments = ["전체"]
+
+        if scraper.select_filters(course_types, departments):
+            # coursesData.json 과 reviewData.json 을 한 번의 순회로 함께 수집
+            scraper.scrape_courses(save_interval=5)
+        else:
+            print("검색 결과가 없어 스크래핑을 중단합니다.")
+    finally:
+        scraper.close()
+
+
+if __name__ == "__main__":
+    main()
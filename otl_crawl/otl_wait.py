@@ -0,0 +1,245 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+import time
+
+# 단계별 최대 대기 시간(초). 조건이 만족되면 즉시 다음 단계로 진행한다.
+DEFAULT_TIMEOUTS = {
+    "navigate": 15,      # 첫 페이지 로드
+    "filter": 5,         # 탭/체크박스 상태 변경
+    "search": 15,        # 검색 결과 목록 로드
+    "scroll": 3,         # 강의 블록이 화면 안으로 들어올 때까지
+    "modal_open": 10,    # 클릭한 강의의 상세 창 로드
+    "reviews": 5,        # 리뷰 개수 안정화
+    "modal_close": 2,    # ESC 후 상세 창 닫힘
+}
+
+COURSE_BLOCK = (By.CLASS_NAME, "_block--course_zjyzb_1737")
+DETAIL_SECTION = (By.CLASS_NAME, "_section--course-detail_zjyzb_637")
+REVIEW_BLOCK = (By.CLASS_NAME, "block--review")
+NO_RESULTS = (By.CLASS_NAME, "_list-placeholder_zjyzb_2887")
+# 리뷰 목록 자리의 안내 문구 (불러오는 동안에는 "불러오는 중"이 같은 클래스로 표시됨)
+NO_REVIEWS_TEXT = "결과 없음"
+
+# 상세 창의 (제목, 코드), 리뷰 블록 목록, 리뷰 없음 안내 표시 여부를 한 번에 읽음 (상세 창이 없으면 null)
+REVIEW_STATE_SCRIPT = f"""
+const section = document.getElementsByClassName('{DETAIL_SECTION[1]}')[0];
+if (!section) return null;
+const text = (className) => {{
+    const el = section.getElementsByClassName(className)[0];
+    return el ? el.innerText.trim() : null;
+}};
+return {{
+    heading: [text('_title_zjyzb_1296'), text('_subtitle_zjyzb_2133')],
+    blocks: Array.from(document.getElementsByClassName('{REVIEW_BLOCK[1]}')),
+    empty: text('{NO_RESULTS[1]}') === '{NO_REVIEWS_TEXT}',
+}};
+"""
+
+
+def detail_heading(driver):
+    """현재 상세 창의 (강의명, 코드) 반환. 상세 창이 없으면 None"""
+    try:
+        section = driver.find_element(*DETAIL_SECTION)
+        title = section.find_element(By.CLASS_NAME, "_title_zjyzb_1296").text.strip()
+        code = section.find_element(By.CLASS_NAME, "_subtitle_zjyzb_2133").text.strip()
+    except (NoSuchElementException, StaleElementReferenceException):
+        return None
+    return (title, code) if title else None
+
+
+def modal_heading_changed(previous):
+    """상세 창의 제목이 이전에 열었던 강의와 달라지면 상세 창 요소를 반환하는 조건"""
+    def condition(driver):
+        heading = detail_heading(driver)
+        if heading is None or heading == previous:
+            return False
+        return driver.find_element(*DETAIL_SECTION)
+    return condition
+
+
+def in_viewport(element):
+    """요소가 화면 안에 완전히 들어오면 True를 반환하는 조건"""
+    def condition(driver):
+        return driver.execute_script(
+            "const r = arguments[0].getBoundingClientRect();"
+            "return r.top >= 0 && r.bottom <= window.innerHeight;",
+            element,
+        )
+    return condition
+
+
+def results_or_placeholder(driver):
+    """검색 결과 강의 블록 또는 '결과 없음' 안내가 나타나면 True를 반환하는 조건"""
+    return bool(driver.find_elements(*COURSE_BLOCK) or driver.find_elements(*NO_RESULTS))
+
+
+class CountSettled:
+    """
+    요소 개수가 일정 시간 동안 변하지 않으면 그 개수를 반환하는 조건
+
+    리뷰처럼 비동기로 조금씩 추가되는 목록이 모두 렌더링될 때까지 기다리는 데 사용한다.
+    개수가 0인 경우에는 결과 반환값이 falsy가 되지 않도록 (개수,) 튜플을 반환한다.
+    """
+
+    def __init__(self, locator, stable_for=0.3):
+        self.locator = locator
+        self.stable_for = stable_for
+        self.last_count = None
+        self.since = None
+
+    def __call__(self, driver):
+        return self.observe(len(driver.find_elements(*self.locator)))
+
+    def observe(self, count):
+        """이번 개수를 기록하고 stable_for초 동안 같았으면 (개수,) 반환"""
+        now = time.perf_counter()
+        if count != self.last_count:
+            self.last_count = count
+            self.since = now
+            return False
+        if now - self.since >= self.stable_for:
+            return (count,)
+        return False
+
+
+class ReviewsSettled(CountSettled):
+    """
+    방금 연 강의의 리뷰 블록 개수가 일정 시간 동안 변하지 않으면 (개수,)를 반환하는 조건
+
+    리뷰는 상세 창 제목이 바뀐 뒤 따로 불러오므로 개수가 0인 상태로 멈춰 있어도 바로 끝내지 않고,
+    상세 창에 "결과 없음" 안내가 보일 때만 0개로 확정한다 (아니면 단계 시간 초과까지 대기).
+    이전 강의에서 남은 리뷰 블록(stale)은 세지 않고, 상세 창 제목이 heading과 다르면 처음부터 다시 센다.
+
+    매개변수:
+        heading (tuple): 방금 연 강의의 (강의명, 코드) (None이면 제목을 확인하지 않음)
+        stale (set): 강의를 열기 전에 있던 리뷰 블록 요소
+    """
+
+    def __init__(self, heading=None, stale=(), stable_for=0.3):
+        super().__init__(REVIEW_BLOCK, stable_for)
+        self.heading = heading
+        self.stale = set(stale)
+
+    def __call__(self, driver):
+        state = driver.execute_script(REVIEW_STATE_SCRIPT)
+        if state is None or (self.heading is not None and tuple(state["heading"]) != self.heading):
+            self.last_count = None
+            return False
+        count = sum(1 for block in state["blocks"] if block not in self.stale)
+        if count == 0 and not state["empty"]:
+            self.last_count = None
+            return False
+        return self.observe(count)
+
+
+class WaitEngine:
+    """
+    고정된 time.sleep 대신 DOM 조건을 기다리는 공용 대기 계층
+
+    단계 이름별로 최대 대기 시간을 따로 두고, 실제로 기다린 시간을 기록하여
+    어느 단계에서 시간이 소요되는지 확인할 수 있도록 한다.
+    """
+
+    def __init__(self, driver, timeouts=None, poll_frequency=0.05):
+        self.driver = driver
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self.poll_frequency = poll_frequency
+        self.latencies = {}   # 단계 이름 -> 대기 시간 목록(초)
+        self.timeouts_hit = {}  # 단계 이름 -> 시간 초과 횟수
+        # ESC로 닫히지 않는 레이아웃(넓은 화면의 고정 상세 창)인지 여부
+        self.modal_persistent = False
+        self.modal_heading = None  # 마지막으로 연 상세 창의 (강의명, 코드)
+        self.stale_reviews = set()  # 그 강의를 열기 전에 있던 리뷰 블록
+
+    def wait(self, step, condition, timeout=None):
+        """
+        조건이 만족될 때까지 기다리고 조건의 반환값을 돌려줌
+
+        매개변수:
+            step (str): 단계 이름 (DEFAULT_TIMEOUTS의 키)
+            condition (callable): driver를 받아 truthy 값을 반환하는 조건
+            timeout (float): 이 호출에만 적용할 최대 대기 시간
+
+        시간 초과 시 None을 반환하며 예외를 던지지 않는다.
+        """
+        if timeout is None:
+            timeout = self.timeouts.get(step, 10)
+        start = time.perf_counter()
+        try:
+            result = WebDriverWait(
+                self.driver, timeout, poll_frequency=self.poll_frequency,
+                ignored_exceptions=(NoSuchElementException, StaleElementReferenceException),
+            ).until(condition)
+        except TimeoutException:
+            self.timeouts_hit[step] = self.timeouts_hit.get(step, 0) + 1
+            result = None
+        self.latencies.setdefault(step, []).append(time.perf_counter() - start)
+        return result
+
+    def wait_for_results(self):
+        """검색 결과가 나타나고 강의 블록 개수가 안정될 때까지 대기"""
+        if self.wait("search", results_or_placeholder) is None:
+            return None
+        return self.wait("search", CountSettled(COURSE_BLOCK))
+
+    def snapshot_reviews(self):
+        """
+        강의를 클릭하기 직전에 호출하여 지금 있는 리뷰 블록을 기억
+
+        이 블록들은 이전 강의의 것이므로 wait_for_reviews와 리뷰 추출에서 제외한다.
+        클릭한 뒤에 기억하면 새 강의의 리뷰가 먼저 렌더링된 경우 그 리뷰까지 제외된다.
+        """
+        self.stale_reviews = set(self.driver.find_elements(*REVIEW_BLOCK))
+
+    def wait_for_modal(self, previous_heading):
+        """클릭한 강의로 상세 창 제목이 바뀔 때까지 대기하고 상세 창 요소를 반환 (클릭 전에 snapshot_reviews 호출)"""
+        section = self.wait("modal_open", modal_heading_changed(previous_heading))
+        self.modal_heading = detail_heading(self.driver) if section is not None else None
+        return section
+
+    def wait_for_reviews(self):
+        """
+        방금 연 강의의 리뷰 블록 개수가 안정될 때까지 대기하고 개수를 반환
+
+        리뷰가 없다는 안내 없이 개수가 0이면 시간 초과까지 기다리며, 시간 초과 시 None을 반환한다.
+        """
+        settled = self.wait("reviews", ReviewsSettled(self.modal_heading, self.stale_reviews))
+        return settled[0] if settled else None
+
+    def wait_for_modal_closed(self):
+        """
+        ESC 후 상세 창이 사라질 때까지 대기
+
+        한 번이라도 상세 창이 닫히지 않는 것이 확인되면(넓은 화면 레이아웃)
+        이후에는 기다리지 않는다. 다음 강의는 제목 변화로 감지하므로 문제가 없다.
+        """
+        if self.modal_persistent:
+            return True
+        if self.wait("modal_close", EC.invisibility_of_element_located(DETAIL_SECTION)) is None:
+            self.modal_persistent = True
+            return False
+        return True
+
+    def summary(self):
+        """단계별 대기 횟수, 평균/최대 대기 시간, 시간 초과 횟수 반환"""
+        result = {}
+        for step, values in self.latencies.items():
+            ordered = sorted(values)
+            result[step] = {
+                "count": len(values),
+                "mean": sum(values) / len(values),
+                "p50": ordered[len(ordered) // 2],
+                "max": ordered[-1],
+                "timeouts": self.timeouts_hit.get(step, 0),
+            }
+        return result
+
+    def print_summary(self):
+        """단계별 실제 대기 시간 요약 출력"""
+        for step, stats in self.summary().items():
+            print(f"[대기] {step}: {stats['count']}회, 평균 {stats['mean']:.3f}초, "
+                  f"중앙값 {stats['p50']:.3f}초, 최대 {stats['max']:.3f}초, 시간 초과 {stats['timeouts']}회")
@@ -0,0 +1,137 @@
+from collections import deque
+from selenium.webdriver.support.ui import WebDriverWait
+import statistics
+
+from otl_memory import process_tree_rss
+from otl_metrics import timed
+from otl_profiles import create_driver
+
+
+def driver_pid(driver):
+    """chromedriver 프로세스 PID (브라우저는 그 하위 프로세스). 알 수 없으면 None"""
+    try:
+        return driver.service.process.pid
+    except AttributeError:
+        return None
+
+
+def driver_alive(driver):
+    """
+    브라우저 세션이 아직 명령에 응답하는지 확인
+
+    chromedriver 프로세스가 종료되면 WebDriverException이 아니라 urllib3 MaxRetryError /
+    ConnectionError가 발생하므로 모든 예외를 응답 없음으로 본다.
+    """
+    try:
+        driver.execute_script("return 1;")
+        return True
+    except Exception:
+        return False
+
+
+class DriverWatchdog:
+    """
+    브라우저 메모리와 강의별 처리 시간을 감시하여 드라이버를 재시작할 시점을 알려줌
+
+    SPA가 오래 실행되며 상태가 쌓이면 메모리가 늘고 강의 하나를 처리하는 시간이 길어지므로
+    다음 중 하나라도 해당하면 재시작 사유를 반환한다.
+
+    - 드라이버를 띄운 뒤 recycle_every개의 강의를 처리함
+    - chromedriver + 브라우저 프로세스 트리의 RSS가 max_rss_mb를 넘음 (/proc 사용)
+    - 최근 window개 강의 처리 시간의 중앙값이 드라이버를 띄운 직후 window개의 중앙값보다 latency_factor배 이상 느림
+    - 브라우저가 응답하지 않아 request_restart()로 재시작을 요청함
+
+    매개변수:
+        recycle_every (int): 몇 개의 강의마다 재시작할지 (None이면 사용 안 함)
+        max_rss_mb (float): 브라우저 메모리 상한(MB) (None이면 사용 안 함)
+        latency_factor (float): 처리 시간 증가 배수 상한 (None이면 사용 안 함)
+        window (int): 처리 시간 중앙값을 계산할 강의 수
+        rss_every (int): 몇 개의 강의마다 RSS를 확인할지 (/proc 전체를 훑으므로 매번 하지 않음)
+    """
+
+    def __init__(self, recycle_every=None, max_rss_mb=None, latency_factor=None, window=20, rss_every=5):
+        self.recycle_every = recycle_every
+        self.max_rss_mb = max_rss_mb
+        self.latency_factor = latency_factor
+        self.window = window
+        self.rss_every = rss_every
+        self.last_rss = None  # 마지막으로 확인한 브라우저 RSS(bytes)
+        self.reset(None)
+
+    def reset(self, driver):
+        """새 드라이버로 기준값과 카운터를 초기화"""
+        self.pid = driver_pid(driver) if driver is not None else None
+        self.courses = 0
+        self.baseline = None
+        self.recent = deque(maxlen=self.window)
+        self.pending_reason = None
+
+    def record(self, seconds):
+        """상세 창을 연 강의 하나의 처리 시간(초) 기록"""
+        self.courses += 1
+        self.recent.append(seconds)
+        if self.baseline is None and len(self.recent) == self.window:
+            self.baseline = statistics.median(self.recent)
+
+    def request_restart(self, reason):
+        """다음 check()에서 재시작하도록 요청 (브라우저가 죽은 경우 등)"""
+        self.pending_reason = reason
+
+    def browser_rss(self):
+        """chromedriver + 브라우저 RSS 합계(bytes) (PID를 모르거나 /proc 이 없으면 None)"""
+        if self.pid is None:
+            return None
+        self.last_rss = process_tree_rss(self.pid)
+        return self.last_rss
+
+    def check(self):
+        """재시작이 필요하면 사유 문자열, 아니면 None 반환"""
+        if self.pending_reason:
+            return self.pending_reason
+        if self.recycle_every and self.courses >= self.recycle_every:
+            return f"강의 {self.courses}개 처리 (주기적 재시작)"
+        if (self.latency_factor and self.baseline and len(self.recent) == self.window
+                and self.courses >= 2 * self.window):
+            current = statistics.median(self.recent)
+            if current > self.baseline * self.latency_factor:
+                return f"강의 처리 시간 증가 ({self.baseline:.2f}초 → {current:.2f}초)"
+        if self.max_rss_mb and self.courses and self.courses % self.rss_every == 0:
+            rss = self.browser_rss()
+            if rss and rss > self.max_rss_mb * (1 << 20):
+                return f"브라우저 메모리 {rss / (1 << 20):.0f}MB > {self.max_rss_mb}MB"
+        return None
+
+
+class DriverRestartMixin:
+    """
+    OTLScraper / OTLCourseScraper 공용 드라이버 재시작
+
+    사용하는 클래스는 profile, headless, driver, wait, waits, watchdog, metrics, base_url, filters 속성과
+    navigate_to_otl / select_filters 메서드를 가져야 한다.
+    """
+
+    @timed("restart")
+    def restart_driver(self, reason):
+        """
+        드라이버를 종료하고 새로 띄운 뒤 같은 주소와 검색 필터로 강의 목록을 다시 불러옴
+
+        매개변수:
+            reason (str): 재시작 사유 (로그 출력용)
+        """
+        print(f"드라이버를 재시작합니다: {reason}")
+        self.metrics.incr("driver_restarts")
+        if self.filters is None:
+            raise RuntimeError("select_filters 를 호출하기 전에는 드라이버를 재시작할 수 없습니다.")
+        try:
+            self.driver.quit()
+        except Exception:
+            pass  # 이미 종료된 브라우저
+        self.driver = create_driver(self.profile, self.headless)
+        self.wait = WebDriverWait(self.driver, 15)
+        self.waits.driver = self.driver
+        self.waits.modal_persistent = False
+        self.watchdog.reset(self.driver)
+        self.navigate_to_otl(self.base_url)
+        if not self.select_filters(*self.filters):
+            raise RuntimeError("드라이버 재시작 후 검색 결과를 불러오지 못했습니다.")
+        self.waits.wait_for_results()
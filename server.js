@@ -15,6 +15,32 @@ const openai = new OpenAI({
 // 벡터 스토어 ID 설정
 const VECTOR_STORE_ID = 'vs_6824bad0eee88191a83e8489e1577351';
 
+// 로컬 검색 서버 주소 (otl_crawl/otl_index.py serve). 설정하면 검색 결과를 시스템 메시지에 포함
+const LOCAL_INDEX_URL = process.env.LOCAL_INDEX_URL;
+const LOCAL_INDEX_TOP_K = parseInt(process.env.LOCAL_INDEX_TOP_K, 10) || 8;
+
+// 로컬 인덱스에서 질의와 관련된 과목/리뷰 문서 검색 (실패하면 빈 배열)
+async function searchLocalIndex(query) {
+  if (!LOCAL_INDEX_URL || !query) return [];
+  try {
+    const response = await fetch(`${LOCAL_INDEX_URL}/search`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ query, k: LOCAL_INDEX_TOP_K })
+    });
+    if (!response.ok) {
+      console.warn('로컬 인덱스 검색 실패:', response.status);
+      return [];
+    }
+    const data = await response.json();
+    console.log(`로컬 인덱스 검색: ${data.results.length}개 문서 (${data.elapsed_ms.toFixed(1)}ms)`);
+    return data.results;
+  } catch (error) {
+    console.warn('로컬 인덱스 서버에 연결할 수 없습니다:', error.message);
+    return [];
+  }
+}
+
 // CORS 설정
 app.use(cors({
   origin: 'http://localhost:3000',
@@ -99,6 +125,16 @@ app.post('/api/chat', async (req, res) => {
       });
     }
 
+    // 로컬 인덱스 검색 결과 추가 (LOCAL_INDEX_URL 이 설정된 경우)
+    const lastUserMessage = [...(messages || [])].reverse().find(message => message.role === 'user');
+    const localResults = await searchLocalIndex(lastUserMessage?.content);
+    if (localResults.length > 0) {
+      systemMessage.content += `\n\n다음은 질문과 관련된 과목 정보, 리뷰 요약입니다:\n\n`;
+      localResults.forEach(result => {
+        systemMessage.content += `${result.text}\n\n`;
+      });
+    }
+
     // 최종 메시지 배열 생성
     const finalMessages = [systemMessage, ...messages];
     
@@ -241,4 +277,7 @@ function parseRecommendedCourses(message) {
 app.listen(port, () => {
   console.log(`서버가 포트 ${port}에서 실행 중입니다.`);
   console.log(`벡터 스토어 ID: ${VECTOR_STORE_ID} (시스템 메시지에 포함됨)`);
+  if (LOCAL_INDEX_URL) {
+    console.log(`로컬 인덱스 검색 서버: ${LOCAL_INDEX_URL}`);
+  }
 });
\ No newline at end of file
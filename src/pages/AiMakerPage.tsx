@@ -14,9 +14,9 @@ import {
   formatScheduleString,
   getCourseDescription,
   calculateSubjectRating,
-  getRatingColor,
-  getSubjectReviews
+  getRatingColor
 } from '../utils/subjectUtils';
+import { useSubjectReviews } from '../utils/useSubjectReviews';
 
 // OpenAI API 설정
 const OPENAI_API_KEY = process.env.REACT_APP_OPENAI_API_KEY;
@@ -28,6 +28,7 @@ const AiMakerPage: React.FC = () => {
   const [allSubjects, setAllSubjects] = useState<Subject[]>([]);
   const [filteredSubjectsBySemester, setFilteredSubjectsBySemester] = useState<Subject[]>([]);
   const [selectedSubject, setSelectedSubject] = useState<Subject | null>(null);
+  const subjectReviews = useSubjectReviews(selectedSubject);
   const [isModalOpen, setIsModalOpen] = useState(false);
   
   const { currentSemester } = useSemester();
@@ -955,7 +956,10 @@ ${availableCourses.map(course =>
                 <ReviewsSection>
                   <CourseInfoTitle>수강생 리뷰</CourseInfoTitle>
                   {(() => {
-                    const reviews = getSubjectReviews(selectedSubject.code, selectedSubject.professor);
+                    if (subjectReviews === null) {
+                      return <EmptyReviews>리뷰를 불러오는 중입니다...</EmptyReviews>;
+                    }
+                    const reviews = subjectReviews;
                     
                     if (reviews.length === 0) {
                       return <EmptyReviews>아직 리뷰가 없습니다.</EmptyReviews>;
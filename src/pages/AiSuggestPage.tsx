@@ -17,9 +17,9 @@ import {
   filterSubjectsBySemester,
   calculateSubjectRating,
   getCourseDescription,
-  getSubjectReviews,
   getRatingColor
 } from '../utils/subjectUtils';
+import { useSubjectReviews } from '../utils/useSubjectReviews';
 
 // AI 추천을 위한 학생 선호도 인터페이스
 interface StudentPreference {
@@ -54,6 +54,7 @@ const AiSuggestPage: React.FC = () => {
   
   // 모달 상태
   const [selectedSubject, setSelectedSubject] = useState<Subject | null>(null);
+  const subjectReviews = useSubjectReviews(selectedSubject);
   const [isModalOpen, setIsModalOpen] = useState(false);
   
   // 학기 Context 사용
@@ -619,7 +620,10 @@ const AiSuggestPage: React.FC = () => {
                 <ReviewsSection>
                   <CourseInfoTitle>수강생 리뷰</CourseInfoTitle>
                   {(() => {
-                    const reviews = getSubjectReviews(selectedSubject.code, selectedSubject.professor);
+                    if (subjectReviews === null) {
+                      return <EmptyReviews>리뷰를 불러오는 중입니다...</EmptyReviews>;
+                    }
+                    const reviews = subjectReviews;
                     
                     if (reviews.length === 0) {
                       return <EmptyReviews>아직 리뷰가 없습니다.</EmptyReviews>;
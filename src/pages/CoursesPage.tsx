@@ -15,9 +15,9 @@ import {
   filterSubjectsBySemester,
   getCourseDescription,
   calculateSubjectRating,
-  getSubjectReviews,
   getRatingColor
 } from '../utils/subjectUtils';
+import { useSubjectReviews } from '../utils/useSubjectReviews';
 
 const CoursesPage: React.FC = () => {
   const [activeMenuItem, setActiveMenuItem] = useState<MenuItemType>('courses');
@@ -46,6 +46,7 @@ const CoursesPage: React.FC = () => {
 
   // 모달 상태
   const [selectedSubject, setSelectedSubject] = useState<Subject | null>(null);
+  const subjectReviews = useSubjectReviews(selectedSubject);
   const [isModalOpen, setIsModalOpen] = useState(false);
 
   // 모든 과목 데이터 로드
@@ -625,7 +626,10 @@ const CoursesPage: React.FC = () => {
                 <ReviewsSection>
                   <CourseInfoTitle>수강생 리뷰</CourseInfoTitle>
                   {(() => {
-                    const reviews = getSubjectReviews(selectedSubject.code, selectedSubject.professor);
+                    if (subjectReviews === null) {
+                      return <EmptyReviews>리뷰를 불러오는 중입니다...</EmptyReviews>;
+                    }
+                    const reviews = subjectReviews;
                     
                     if (reviews.length === 0) {
                       return <EmptyReviews>아직 리뷰가 없습니다.</EmptyReviews>;
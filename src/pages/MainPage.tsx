@@ -15,11 +15,11 @@ import {
   filterSubjectsBySemester,
   getCourseDescription,
   calculateSubjectRating,
-  getSubjectReviews,
   getRatingColor,
   getFilterOptions,
   searchSubjects
 } from '../utils/subjectUtils';
+import { useSubjectReviews } from '../utils/useSubjectReviews';
 import { styled } from 'styled-components';
 
 const MainPage: React.FC = () => {
@@ -52,6 +52,7 @@ const MainPage: React.FC = () => {
 
   // 모달 상태
   const [selectedSubject, setSelectedSubject] = useState<Subject | null>(null);
+  const subjectReviews = useSubjectReviews(selectedSubject);
   const [isModalOpen, setIsModalOpen] = useState(false);
   const [showSurveyPopup, setShowSurveyPopup] = useState(true);
 
@@ -929,7 +930,10 @@ const MainPage: React.FC = () => {
                 <ReviewsSection>
                   <CourseInfoTitle>수강생 리뷰</CourseInfoTitle>
                   {(() => {
-                    const reviews = getSubjectReviews(selectedSubject.code, selectedSubject.professor);
+                    if (subjectReviews === null) {
+                      return <EmptyReviews>리뷰를 불러오는 중입니다...</EmptyReviews>;
+                    }
+                    const reviews = subjectReviews;
                     
                     if (reviews.length === 0) {
                       return <EmptyReviews>아직 리뷰가 없습니다.</EmptyReviews>;
@@ -2,7 +2,7 @@
 import { Subject, Schedule, departmentColors, defaultColor } from '../types/subject';
 import subjectData from '../data/subjectData.json';
 import coursesData from '../data/coursesData.json';
-import reviewData from '../data/reviewData.json';
+import ratingAggregates from '../data/ratingAggregates.json';
 
 // 리뷰 데이터 타입 정의
 export interface Review {
@@ -28,6 +28,12 @@ export interface CourseInfo {
   설명: string;
 }
 
+// 상세 창에 표시하는 리뷰 (otl_crawl/otl_aggregate.py 가 과목 코드별 파일로 분리)
+export type SubjectReview = Pick<Review, '학기' | '리뷰내용' | '평점'>;
+
+// 교수명 -> 리뷰 목록 (public/reviews/<과목 코드>.json)
+type CourseReviews = Record<string, SubjectReview[]>;
+
 // 평점 타입 정의
 export interface Rating {
   gradeScore: number;
@@ -40,6 +46,28 @@ export interface Rating {
   reviewCount: number;
 }
 
+// 미리 계산한 평점 집계 (otl_crawl/otl_aggregate.py 로 생성)
+// 항목 순서: gradeScore, workloadScore, teachingScore, recommendationScore, reviewCount, grade, workload, teaching
+type RatingAggregateEntry = [number, number, number, number, number, string, string, string];
+
+interface RatingAggregates {
+  fields: string[];
+  byCourseProfessor: Record<string, Record<string, RatingAggregateEntry>>;
+}
+
+const aggregates = ratingAggregates as unknown as RatingAggregates;
+
+const toRating = (entry: RatingAggregateEntry): Rating => ({
+  gradeScore: entry[0],
+  workloadScore: entry[1],
+  teachingScore: entry[2],
+  recommendationScore: entry[3],
+  reviewCount: entry[4],
+  grade: entry[5],
+  workload: entry[6],
+  teaching: entry[7]
+});
+
 // 평점 변환 함수
 export const convertGradeToNumber = (grade: string): number => {
   switch (grade) {
@@ -129,44 +157,10 @@ export const parseCredits = (creditsStr: string): number => {
   return parseFloat(match[3]);
 };
 
-// 과목 리뷰 계산
+// 과목 리뷰 계산 (과목 코드 + 교수명 기준 집계 사용)
 export const calculateSubjectRating = (subject: Subject): Rating | null => {
-  // 과목 코드와 교수명이 동일한 리뷰 찾기
-  const matchingReviews = (reviewData as Review[]).filter(
-    review => review.강의코드 === subject.code && review.교수명 === subject.professor
-  );
-  
-  if (matchingReviews.length === 0) {
-    return null;
-  }
-  
-  let totalGrade = 0;
-  let totalWorkload = 0;
-  let totalTeaching = 0;
-  let totalRecommendation = 0;
-  
-  matchingReviews.forEach(review => {
-    totalGrade += convertGradeToNumber(review.평점.grade);
-    totalWorkload += convertGradeToNumber(review.평점.workload);
-    totalTeaching += convertGradeToNumber(review.평점.teaching);
-    totalRecommendation += parseInt(review.평점.recommendation) || 0;
-  });
-  
-  const avgGrade = totalGrade / matchingReviews.length;
-  const avgWorkload = totalWorkload / matchingReviews.length;
-  const avgTeaching = totalTeaching / matchingReviews.length;
-  const avgRecommendation = totalRecommendation / matchingReviews.length;
-  
-  return {
-    gradeScore: avgGrade,
-    workloadScore: avgWorkload,
-    teachingScore: avgTeaching,
-    recommendationScore: avgRecommendation,
-    grade: convertNumberToGrade(avgGrade),
-    workload: convertNumberToGrade(avgWorkload),
-    teaching: convertNumberToGrade(avgTeaching),
-    reviewCount: matchingReviews.length
-  };
+  const entry = aggregates.byCourseProfessor[subject.code]?.[subject.professor];
+  return entry ? toRating(entry) : null;
 };
 
 // 과목 설명 가져오기
@@ -175,11 +169,30 @@ export const getCourseDescription = (code: string): string => {
   return course ? course.설명 : '설명이 없습니다.';
 };
 
-// 과목별 리뷰 가져오기
-export const getSubjectReviews = (code: string, professor: string): Review[] => {
-  return (reviewData as Review[]).filter(
-    review => review.강의코드 === code && review.교수명 === professor
-  );
+// 과목 코드를 리뷰 파일 이름으로 변환 (otl_aggregate.review_filename 과 같은 규칙)
+const reviewFileName = (code: string): string => `${code.replace(/[^A-Za-z0-9._-]/g, '_')}.json`;
+
+// 과목 코드별 리뷰 파일 요청 (같은 과목은 한 번만 불러옴)
+const courseReviewRequests = new Map<string, Promise<CourseReviews>>();
+
+const loadCourseReviews = (code: string): Promise<CourseReviews> => {
+  let request = courseReviewRequests.get(code);
+  if (!request) {
+    request = fetch(`${process.env.PUBLIC_URL}/reviews/${reviewFileName(code)}`)
+      .then(response => (response.ok ? response.json() : {}))
+      .catch(() => {
+        // 네트워크 오류는 다음에 다시 시도
+        courseReviewRequests.delete(code);
+        return {};
+      });
+    courseReviewRequests.set(code, request);
+  }
+  return request;
+};
+
+// 과목별 리뷰 가져오기 (리뷰 파일이 없으면 빈 배열)
+export const getSubjectReviews = (code: string, professor: string): Promise<SubjectReview[]> => {
+  return loadCourseReviews(code).then(reviews => reviews[professor] || []);
 };
 
 // 교과목 데이터 변환
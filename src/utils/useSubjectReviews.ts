@@ -0,0 +1,26 @@
+// src/utils/useSubjectReviews.ts
+import { useEffect, useState } from 'react';
+import { Subject } from '../types/subject';
+import { getSubjectReviews, SubjectReview } from './subjectUtils';
+
+// 선택한 과목의 리뷰를 상세 창을 열 때 불러옴 (불러오는 중이면 null)
+export const useSubjectReviews = (subject: Subject | null): SubjectReview[] | null => {
+  const [reviews, setReviews] = useState<SubjectReview[] | null>(null);
+  const code = subject?.code;
+  const professor = subject?.professor;
+
+  useEffect(() => {
+    setReviews(null);
+    if (!code) return;
+
+    let active = true;
+    getSubjectReviews(code, professor || '').then(result => {
+      if (active) setReviews(result);
+    });
+    return () => {
+      active = false;
+    };
+  }, [code, professor]);
+
+  return reviews;
+};